@@ -0,0 +1,77 @@
+"""
+Compares building columns from decoded query results by hydrating documents (like `find_all` does) and then
+collecting their values, and by appending the values directly to the column buffers of `QuerySet.to_columns`.
+
+Usage::
+
+    python benchmarks/columns.py [number of rows]
+
+No database is required, so the time spent by the database and the driver is not included.
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, IntField, FloatField, DateTimeField
+from jetengine.columns import get_column, numpy
+
+
+class Sale(Document):
+    __collection__ = "BenchmarkColumnsSale"
+
+    product = StringField()
+    quantity = IntField()
+    price = FloatField()
+    sold_at = DateTimeField()
+
+
+def get_sons(rows):
+    now = datetime(2018, 1, 1)
+    return [
+        {
+            "_id": ObjectId(),
+            "product": "product%d" % (index % 100),
+            "quantity": index % 10,
+            "price": index * 0.5,
+            "sold_at": now + timedelta(seconds=index),
+        }
+        for index in range(rows)
+    ]
+
+
+def documents(sons):
+    sales = [Sale.from_son(son) for son in sons]
+    columns = {}
+    for name in Sale._fields:
+        values = [getattr(sale, name) for sale in sales]
+        columns[name] = values if numpy is None else numpy.array(values)
+
+    return columns
+
+
+def buffers(sons):
+    columns = dict((name, get_column(field)) for name, field in Sale._fields.items())
+    appends = [(field.db_field, columns[name].append) for name, field in Sale._fields.items()]
+
+    for son in sons:
+        for db_field, append in appends:
+            append(son.get(db_field))
+
+    return dict((name, column.to_array()) for name, column in columns.items())
+
+
+def main(rows):
+    sons = get_sons(rows)
+
+    print("%-10s %12s" % ("columns", "rows/s"))
+    for name, function in [("documents", documents), ("buffers", buffers)]:
+        start = time.perf_counter()
+        function(sons)
+        print("%-10s %12.0f" % (name, rows / (time.perf_counter() - start)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
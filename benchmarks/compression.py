@@ -0,0 +1,77 @@
+"""
+Compares the size on the wire (BSON bytes) and the time to load and decode large text and json payloads
+stored uncompressed and compressed with each codec.
+
+Usage::
+
+    python benchmarks/compression.py [number of iterations]
+
+No database is required.
+"""
+
+import sys
+import random
+import timeit
+
+from bson import BSON
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, JsonField
+
+
+def get_document_class(codec):
+    class Report(Document):
+        __collection__ = "BenchmarkCompressionReport"
+
+        text = StringField(compress=codec)
+        payload = JsonField(compress=codec)
+
+    return Report
+
+
+def get_payload(size):
+    words = ["status", "error", "request", "latency", "user", "session", "checkout", "cart", "item", "price"]
+    random.seed(size)
+
+    text = " ".join(random.choice(words) for index in range(size // 7))
+    payload = {
+        "events": [
+            {"name": random.choice(words), "value": random.randint(0, 1000), "tags": random.sample(words, 3)}
+            for index in range(size // 80)
+        ]
+    }
+
+    return text, payload
+
+
+def main(iterations):
+    print("%-8s %-6s %12s %18s %18s" % ("size", "codec", "wire bytes", "load (docs/s)", "decode (docs/s)"))
+
+    for size in [50000, 500000]:
+        text, payload = get_payload(size)
+
+        for codec in [None, "zlib", "lzma"]:
+            document_class = get_document_class(codec)
+            son = document_class(text=text, payload=payload).to_son()
+            son["_id"] = ObjectId()
+            data = BSON.encode(son)
+
+            def load():
+                return document_class.from_son(BSON.decode(data))
+
+            def decode():
+                document = load()
+                return document.text, document.payload
+
+            count = max(iterations // (size // 50000), 1)
+            load_elapsed = min(timeit.repeat(load, number=count, repeat=3))
+            decode_elapsed = min(timeit.repeat(decode, number=count, repeat=3))
+
+            print(
+                "%-8d %-6s %12d %18.0f %18.0f"
+                % (size, codec or "none", len(data), count / load_elapsed, count / decode_elapsed)
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,60 @@
+"""
+Compares decoding and hydrating documents with six `DateTimeField` values:
+
+* `legacy` - fields parsing strings (`parse_strings=True`), which check every value like older versions did;
+* `plain` - fields without arguments, which don't convert the decoded values;
+* `field tz` - fields converting the values to a timezone (`tz` argument);
+* `driver tz` - the driver decoding the values in the timezone (`tz_aware` and `tzinfo` arguments of `connect`),
+  so the fields don't convert them.
+
+Usage::
+
+    python benchmarks/datetime_field.py [number of iterations]
+
+No database is required.
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from bson import BSON
+from bson.codec_options import CodecOptions
+from bson.objectid import ObjectId
+
+from jetengine import Document, DateTimeField
+
+BRASILIA = timezone(timedelta(hours=-3))
+NAMES = ["created", "paid", "packed", "shipped", "delivered", "updated"]
+
+
+def get_document_class(name, **kw):
+    attrs = dict((field_name, DateTimeField(**kw)) for field_name in NAMES)
+    attrs["__collection__"] = "BenchmarkDateTimeFieldShipment"
+    return type(name, (Document,), attrs)
+
+
+def main(iterations):
+    now = datetime(2020, 1, 1, 10, 0)
+    values = dict((name, now + timedelta(hours=index)) for index, name in enumerate(NAMES))
+    data = BSON.encode(dict(values, _id=ObjectId()))
+
+    cases = [
+        ("legacy", get_document_class("LegacyShipment", parse_strings=True), CodecOptions()),
+        ("plain", get_document_class("PlainShipment"), CodecOptions()),
+        ("field tz", get_document_class("FieldShipment", tz=BRASILIA), CodecOptions(tz_aware=True)),
+        ("driver tz", get_document_class("DriverShipment"), CodecOptions(tz_aware=True, tzinfo=BRASILIA)),
+    ]
+
+    print("%-10s %12s" % ("decoding", "docs/s"))
+    for name, document_class, codec_options in cases:
+
+        def load():
+            return document_class.from_son(BSON(data).decode(codec_options=codec_options))
+
+        elapsed = min(timeit.repeat(load, number=iterations, repeat=5))
+        print("%-10s %12.0f" % (name, iterations / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,114 @@
+"""
+Compares decoding raw batches of query results into documents on the event loop thread and in worker threads or
+processes (`find_all(decode_in=...)`), measuring the total time and the median and longest stalls of the event
+loop (how long other tasks wait to run).
+
+Usage::
+
+    python benchmarks/decoding.py [number of documents] [number of workers]
+
+No database is required, so the time spent by the database and the driver fetching the batches is not included.
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+from bson import BSON
+from bson.codec_options import CodecOptions
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, IntField, FloatField, DateTimeField, ListField
+from jetengine.decoding import decode_batch, get_executor, shutdown_executors
+
+BATCH_SIZE = 1000
+
+
+class Event(Document):
+    __collection__ = "BenchmarkDecodingEvent"
+
+    name = StringField()
+    order = IntField()
+    score = FloatField()
+    happened = DateTimeField()
+    tags = ListField(StringField())
+
+
+def get_batches(count):
+    sons = [
+        BSON.encode(
+            dict(
+                Event(
+                    name="event%d" % index, order=index, score=index / 3, happened=datetime.now(), tags=["a", "b"]
+                ).to_son(),
+                _id=ObjectId(),
+            )
+        )
+        for index in range(count)
+    ]
+    return [b"".join(sons[index : index + BATCH_SIZE]) for index in range(0, count, BATCH_SIZE)]
+
+
+async def measure_stalls(stalls, done):
+    last = time.perf_counter()
+    while not done.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        stalls.append(now - last)
+        last = now
+
+
+async def decode(batches, decode_in, workers):
+    loop = asyncio.get_event_loop()
+    codec_options = CodecOptions()
+
+    if decode_in is None:
+        result = []
+        for data in batches:
+            result.extend(decode_batch(Event, data, codec_options))
+            # lets the other tasks run between batches, like a cursor does
+            await asyncio.sleep(0)
+
+        return result
+
+    executor = get_executor(decode_in, workers)
+    futures = [loop.run_in_executor(executor, decode_batch, Event, data, codec_options) for data in batches]
+    return [document for documents in await asyncio.gather(*futures) for document in documents]
+
+
+async def run(batches, decode_in, workers):
+    stalls = []
+    done = asyncio.Event()
+    ticker = asyncio.ensure_future(measure_stalls(stalls, done))
+
+    start = time.perf_counter()
+    await decode(batches, decode_in, workers)
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    await ticker
+    stalls.sort()
+    return elapsed, stalls[len(stalls) // 2], stalls[-1]
+
+
+def main(count, workers):
+    batches = get_batches(count)
+
+    # starts the workers before measuring
+    for decode_in in ["thread", "process"]:
+        get_executor(decode_in, workers).submit(len, b"").result()
+
+    print("%-10s %12s %18s %18s" % ("decode in", "docs/s", "median stall (ms)", "longest stall (ms)"))
+    for decode_in in [None, "thread", "process"]:
+        elapsed, median, longest = asyncio.get_event_loop().run_until_complete(run(batches, decode_in, workers))
+        print("%-10s %12.0f %18.1f %18.1f" % (decode_in or "loop", count / elapsed, median * 1000, longest * 1000))
+
+    shutdown_executors()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
@@ -0,0 +1,66 @@
+"""
+Compares creating documents loaded from the database with `Document.hydrate` and with the constructor,
+which evaluates every default before setting the loaded values.
+
+Usage::
+
+    python benchmarks/hydration.py [number of iterations]
+
+No database is required.
+"""
+
+import sys
+import uuid
+import timeit
+from datetime import datetime
+
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, IntField, DateTimeField, ListField, DictField
+
+
+class Event(Document):
+    __collection__ = "BenchmarkHydrationEvent"
+
+    uid = StringField(default=lambda: str(uuid.uuid4()))
+    name = StringField()
+    value = IntField(default=0)
+    created_at = DateTimeField(default=datetime.now)
+    updated_at = DateTimeField(default=datetime.now)
+    tags = ListField(StringField())
+    metadata = DictField(default=lambda: {})
+
+
+def main(iterations):
+    son = {
+        "_id": ObjectId(),
+        "uid": str(uuid.uuid4()),
+        "name": "click",
+        "value": 10,
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+        "tags": ["a", "b"],
+        "metadata": {"source": "web"},
+    }
+
+    def with_constructor():
+        values = dict(son)
+        object_id = values.pop("_id")
+        return Event(_id=object_id, **values)
+
+    def with_hydrate():
+        values = dict(son)
+        object_id = values.pop("_id")
+        return Event.hydrate(values, _id=object_id)
+
+    def with_from_son():
+        return Event.from_son(dict(son))
+
+    print("%-14s %12s" % ("method", "docs/s"))
+    for name, function in [("constructor", with_constructor), ("hydrate", with_hydrate), ("from_son", with_from_son)]:
+        elapsed = min(timeit.repeat(function, number=iterations, repeat=3))
+        print("%-14s %12.0f" % (name, iterations / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,77 @@
+"""
+Compares saving and loading documents with a ~5KB `JsonField` payload stored as a json string (with each
+available json serializer) and stored natively as a BSON sub-document.
+
+Usage::
+
+    python benchmarks/json_field.py [number of iterations]
+
+No database is required. Saving includes the BSON encoding done by the driver and loading includes the
+BSON decoding.
+"""
+
+import sys
+import timeit
+
+from bson import BSON
+from bson.objectid import ObjectId
+
+from jetengine import Document, JsonField, utils
+
+
+class StringJob(Document):
+    __collection__ = "BenchmarkJsonFieldJob"
+
+    payload = JsonField()
+
+
+class NativeJob(Document):
+    __collection__ = "BenchmarkJsonFieldJob"
+
+    payload = JsonField(native=True)
+
+
+def get_payload():
+    return {
+        "status": "done",
+        "attempts": 3,
+        "steps": [
+            {"name": "step%d" % index, "elapsed": index * 0.25, "ok": index % 7 != 0, "tags": ["a", "b", "c"]}
+            for index in range(60)
+        ],
+    }
+
+
+def run(document_class, iterations):
+    payload = get_payload()
+    document = document_class(payload=payload)
+    son = dict(document.to_son(), _id=ObjectId())
+    data = BSON.encode(son)
+
+    def save():
+        return BSON.encode(document.to_son())
+
+    def load():
+        return document_class.from_son(BSON.decode(data)).payload
+
+    save_elapsed = min(timeit.repeat(save, number=iterations, repeat=3))
+    load_elapsed = min(timeit.repeat(load, number=iterations, repeat=3))
+
+    return len(data), iterations / save_elapsed, iterations / load_elapsed
+
+
+def main(iterations):
+    print("%-16s %10s %14s %14s" % ("mode", "bytes", "save (docs/s)", "load (docs/s)"))
+
+    for name in ["orjson", "ujson", "json"]:
+        if utils.use_json_serializer(name, "json") != name:
+            continue
+
+        print("%-16s %10d %14.0f %14.0f" % (("string/%s" % name,) + run(StringJob, iterations)))
+
+    utils.use_json_serializer(*utils.JSON_SERIALIZERS)
+    print("%-16s %10d %14.0f %14.0f" % (("native",) + run(NativeJob, iterations)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
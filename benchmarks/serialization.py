@@ -0,0 +1,102 @@
+"""
+Compares the `to_son`/`from_son` functions compiled per document class with the generic field loop.
+
+Usage::
+
+    python benchmarks/serialization.py [number of iterations]
+
+No database is required.
+"""
+
+import sys
+import timeit
+
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, IntField, BooleanField, DateTimeField, ListField
+
+FIELD_COUNTS = [10, 50, 200]
+
+
+def create_document_type(number_of_fields):
+    field_types = [StringField, IntField, BooleanField, StringField, DateTimeField, ListField]
+
+    attrs = {"__collection__": "BenchmarkSerialization%d" % number_of_fields}
+    for index in range(number_of_fields):
+        field_type = field_types[index % len(field_types)]
+        if field_type is ListField:
+            attrs["field%d" % index] = ListField(StringField())
+        else:
+            attrs["field%d" % index] = field_type()
+
+    return type("BenchmarkDocument%d" % number_of_fields, (Document,), attrs)
+
+
+def create_document(document_type):
+    values = {}
+    for name, field in document_type._fields.items():
+        if isinstance(field, (StringField,)):
+            values[name] = "value of %s" % name
+        elif isinstance(field, (IntField,)):
+            values[name] = 10
+        elif isinstance(field, (BooleanField,)):
+            values[name] = True
+        elif isinstance(field, (ListField,)):
+            values[name] = ["a", "b", "c"]
+
+    return document_type(**values)
+
+
+def generic_to_son(document):
+    data = dict()
+
+    for name, field in document._fields.items():
+        value = document.get_field_value(name)
+        if field.sparse and value is None:
+            continue
+        data[field.db_field] = field.to_son(value)
+
+    return data
+
+
+def generic_from_son(cls, dic):
+    field_values = {}
+    _object_id = dic.pop("_id", None)
+    for name, value in dic.items():
+        field = cls.get_field_by_db_name(name)
+        if field:
+            field_values[field.name] = field.from_son(value)
+        else:
+            field_values[name] = value
+    field_values["_id"] = _object_id
+
+    return cls(**field_values)
+
+
+def measure(function, iterations):
+    return iterations / min(timeit.repeat(function, number=iterations, repeat=3))
+
+
+def main(iterations):
+    print("%-8s %14s %14s %16s %16s" % ("fields", "to_son/s", "generic/s", "from_son/s", "generic/s"))
+
+    for number_of_fields in FIELD_COUNTS:
+        document_type = create_document_type(number_of_fields)
+        document = create_document(document_type)
+        son = document.to_son()
+        son["_id"] = ObjectId()
+
+        assert generic_to_son(document) == document.to_son()
+
+        results = [
+            measure(document.to_son, iterations),
+            measure(lambda: generic_to_son(document), iterations),
+            measure(lambda: document_type.from_son(dict(son)), iterations),
+            measure(lambda: generic_from_son(document_type, dict(son)), iterations),
+        ]
+
+        print("%-8d %14.0f %14.0f %16.0f %16.0f" % tuple([number_of_fields] + results))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,61 @@
+"""
+Compares decoding and hydrating documents with Decimal128 fields when the values are converted by the driver
+(with the type registry of `jetengine.type_codecs`) and when they are converted by `DecimalField.from_son`.
+
+Usage::
+
+    python benchmarks/type_codecs.py [number of iterations]
+
+No database is required.
+"""
+
+import sys
+import timeit
+from decimal import Decimal
+
+from bson import BSON
+from bson.codec_options import CodecOptions
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, DecimalField
+from jetengine.type_codecs import get_type_registry
+
+
+class Order(Document):
+    __collection__ = "BenchmarkTypeCodecsOrder"
+
+    number = StringField()
+    subtotal = DecimalField(storage="decimal128")
+    tax = DecimalField(storage="decimal128")
+    shipping = DecimalField(storage="decimal128")
+    discount = DecimalField(storage="decimal128")
+    total = DecimalField(storage="decimal128")
+
+
+def main(iterations):
+    values = dict((name, Decimal("%d.99" % index)) for index, name in enumerate(Order._fields) if name != "number")
+    son = dict(Order(number="1", **values).to_son(), _id=ObjectId())
+    data = BSON.encode(son)
+
+    with_registry = CodecOptions(type_registry=get_type_registry(Order))
+    without_registry = CodecOptions()
+
+    def driver():
+        return Order.from_son(BSON(data).decode(codec_options=with_registry))
+
+    def fields():
+        values = BSON(data).decode(codec_options=without_registry)
+        object_id = values.pop("_id")
+        for name, field in Order._fields.items():
+            values[field.db_field] = field.from_son(values.get(field.db_field))
+
+        return Order.hydrate(values, _id=object_id)
+
+    print("%-10s %12s" % ("decoding", "docs/s"))
+    for name, function in [("fields", fields), ("driver", driver)]:
+        elapsed = min(timeit.repeat(function, number=iterations, repeat=3))
+        print("%-10s %12.0f" % (name, iterations / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,82 @@
+"""
+Measures the ingest throughput of `bulk_insert` and `save` for each write concern level.
+
+Usage::
+
+    python benchmarks/write_concern.py [number of documents]
+
+Requires a mongod running on localhost:27017 (`majority` and `j=True` need journaling enabled).
+"""
+
+import sys
+import time
+import asyncio
+
+from jetengine import Document, StringField, IntField, DateTimeField, connect
+
+LEVELS = [
+    ("w=0", {"w": 0}),
+    ("w=1, j=False", {"w": 1, "j": False}),
+    ("w=1, j=True", {"w": 1, "j": True}),
+    ("w=majority", {"w": "majority"}),
+]
+
+BATCH_SIZE = 500
+
+
+class Event(Document):
+    __collection__ = "BenchmarkWriteConcernEvent"
+
+    source = StringField(required=True)
+    kind = StringField()
+    value = IntField()
+    created_at = DateTimeField(auto_now_on_insert=True)
+
+
+def build_events(number_of_documents):
+    return [
+        Event(source="sensor-%d" % (index % 100), kind="reading", value=index) for index in range(number_of_documents)
+    ]
+
+
+async def run_bulk_insert(number_of_documents, write_concern):
+    events = build_events(number_of_documents)
+    start = time.perf_counter()
+
+    for index in range(0, number_of_documents, BATCH_SIZE):
+        await Event.objects.bulk_insert(events[index : index + BATCH_SIZE], write_concern=write_concern)
+
+    return time.perf_counter() - start
+
+
+async def run_save(number_of_documents, write_concern):
+    events = build_events(number_of_documents)
+    start = time.perf_counter()
+
+    for event in events:
+        await event.save(write_concern=write_concern)
+
+    return time.perf_counter() - start
+
+
+async def main(number_of_documents):
+    db = connect("benchmark", host="localhost", port=27017, io_loop=asyncio.get_event_loop())
+
+    print("%-16s %18s %18s" % ("write concern", "bulk_insert docs/s", "save docs/s"))
+
+    for name, write_concern in LEVELS:
+        results = []
+
+        for method in (run_bulk_insert, run_save):
+            await db[Event.__collection__].drop()
+            elapsed = await method(number_of_documents, write_concern)
+            results.append(number_of_documents / elapsed)
+
+        print("%-16s %18.0f %18.0f" % (name, results[0], results[1]))
+
+    await db[Event.__collection__].drop()
+
+
+if __name__ == "__main__":
+    number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    asyncio.get_event_loop().run_until_complete(main(number_of_documents))
@@ -15,12 +15,15 @@ try:
         ListField,
         EmbeddedDocumentField,
         ReferenceField,
+        CachedReferenceField,
         URLField,
         EmailField,
         IntField,
+        SequenceField,
         FloatField,
         DecimalField,
         BinaryField,
+        FileField,
         JsonField,
         ObjectIdField,
         DictField,
@@ -0,0 +1,151 @@
+"""
+Column buffers used by `QuerySet.to_columns` to export query results without creating documents.
+
+Values of boolean, int and float fields are appended to `array.array` buffers. When NumPy is installed the buffers
+are returned as NumPy arrays that share their memory, and datetime fields are stored as `datetime64[ms]` values.
+Values of other fields are converted with the `from_son` method of the field and kept in lists (NumPy object
+arrays when NumPy is installed).
+
+Missing values of int and boolean fields turn their column into a float column (like pandas does), with NaN for the
+missing values. Missing datetime values are stored as NaT.
+"""
+
+import array
+from datetime import datetime, timedelta, timezone
+
+from jetengine.serialization import is_identity
+from jetengine.type_codecs import get_decoded_type
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+NAN = float("nan")
+NAT = -(2**63)
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MILLISECOND = timedelta(milliseconds=1)
+
+
+class Column(object):
+    """Values of a field converted with its `from_son` method and kept in a list."""
+
+    def __init__(self, field):
+        self.field = field
+        self.values = []
+        self.convert = self.convert_value
+        self.decoded_type = get_decoded_type(field)
+
+        if is_identity(field, "get_value"):
+            if is_identity(field, "from_son"):
+                self.convert = None
+            elif self.decoded_type is not None:
+                self.convert = self.convert_undecoded_value
+
+    def convert_value(self, value):
+        return self.field.get_value(self.field.from_son(value))
+
+    def convert_undecoded_value(self, value):
+        # values converted by the type codecs of the collection are used as they are
+        if type(value) is self.decoded_type:
+            return value
+
+        return self.field.from_son(value)
+
+    def append(self, value):
+        if value is not None and self.convert is not None:
+            value = self.convert(value)
+
+        self.values.append(value)
+
+    def to_array(self):
+        if numpy is None:
+            return self.values
+
+        result = numpy.empty(len(self.values), dtype=object)
+        result[:] = self.values
+        return result
+
+
+class NumberColumn(Column):
+    """Values of a boolean, int or float field appended to an `array.array` buffer."""
+
+    DTYPES = {"B": "bool", "q": "int64", "d": "float64"}
+
+    def __init__(self, field, typecode):
+        self.field = field
+        self.buffer = array.array(typecode)
+
+    def append(self, value):
+        try:
+            self.buffer.append(value)
+        except TypeError:
+            if value is not None:
+                self.buffer.append(self.field.from_son(value))
+                return
+
+            if self.buffer.typecode != "d":
+                self.buffer = array.array("d", self.buffer)
+
+            self.buffer.append(NAN)
+
+    def to_array(self):
+        if numpy is None:
+            return self.buffer
+
+        return numpy.frombuffer(self.buffer, dtype=self.DTYPES[self.buffer.typecode])
+
+
+class DateTimeColumn(Column):
+    """Values of a datetime field appended to an `array.array` buffer as milliseconds since the epoch."""
+
+    def __init__(self, field):
+        self.field = field
+        self.buffer = array.array("q")
+
+    def append(self, value):
+        if value is None:
+            self.buffer.append(NAT)
+        elif value.tzinfo is None:
+            self.buffer.append((value - EPOCH) // MILLISECOND)
+        else:
+            self.buffer.append((value - EPOCH_UTC) // MILLISECOND)
+
+    def to_array(self):
+        return numpy.frombuffer(self.buffer, dtype="datetime64[ms]")
+
+
+def get_column(field):
+    """Returns an empty column for the values of `field`."""
+    from jetengine.fields.boolean_field import BooleanField
+    from jetengine.fields.datetime_field import DateTimeField
+    from jetengine.fields.float_field import FloatField
+    from jetengine.fields.int_field import IntField
+
+    if isinstance(field, BooleanField):
+        return NumberColumn(field, "B")
+
+    if isinstance(field, IntField):
+        return NumberColumn(field, "q")
+
+    if isinstance(field, FloatField):
+        return NumberColumn(field, "d")
+
+    if isinstance(field, DateTimeField) and numpy is not None:
+        return DateTimeColumn(field)
+
+    return Column(field)
+
+
+def to_dataframe(columns):
+    """Returns a pandas `DataFrame` with the columns returned by `QuerySet.to_columns`."""
+    if pandas is None:
+        raise ImportError("pandas is required to export query results to a DataFrame.")
+
+    return pandas.DataFrame(columns, columns=list(columns))
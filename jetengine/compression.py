@@ -0,0 +1,142 @@
+import lzma
+import zlib
+
+from bson.binary import Binary
+
+# first binary subtype reserved for user-defined data
+COMPRESSED_SUBTYPE = 0x80
+
+_codecs = {}
+
+
+class Codec(object):
+    def __init__(self, name, compress, decompress):
+        self.name = name
+        self.tag = name.encode("ascii") + b":"
+        self.compress = compress
+        self.decompress = decompress
+
+
+def register_codec(name, compress, decompress):
+    """
+    Registers a compression codec that can be used in the `compress` argument of fields.
+
+    Usage::
+
+        import zstandard
+
+        register_codec("zstd", zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress)
+
+        body = StringField(compress="zstd")
+
+    The name of the codec is stored with each compressed value, so codecs must not be renamed (or unregistered)
+    while there are values compressed with them.
+    """
+    if ":" in name:
+        raise ValueError("Invalid codec name '%s': codec names can't contain ':'." % name)
+
+    _codecs[name] = Codec(name, compress, decompress)
+
+
+def get_codec(name):
+    if name not in _codecs:
+        raise ValueError("Unknown compression codec '%s': must be one of %s." % (name, ", ".join(sorted(_codecs))))
+
+    return _codecs[name]
+
+
+register_codec("zlib", zlib.compress, zlib.decompress)
+register_codec("lzma", lzma.compress, lzma.decompress)
+
+
+def compress(codec_name, data):
+    """Compresses `data` (bytes) with the specified codec into a tagged binary value."""
+    codec = get_codec(codec_name)
+    return Binary(codec.tag + codec.compress(data), COMPRESSED_SUBTYPE)
+
+
+def is_compressed(value):
+    return isinstance(value, (Binary,)) and value.subtype == COMPRESSED_SUBTYPE
+
+
+def decompress(value):
+    """Decompresses a tagged binary value created by `compress` with the codec it was compressed with."""
+    name, _, data = bytes(value).partition(b":")
+    return get_codec(name.decode("ascii")).decompress(data)
+
+
+class CompressedValue(object):
+    """
+    Compressed value loaded from the database. The value is only decompressed (and decoded with `decode`) when
+    it's first accessed, and values that were never accessed are saved again as they were loaded.
+    """
+
+    __slots__ = ("son", "decode", "loaded", "_value")
+
+    def __init__(self, son, decode):
+        self.son = son
+        self.decode = decode
+        self.loaded = False
+        self._value = None
+
+    @property
+    def value(self):
+        if not self.loaded:
+            self._value = self.decode(decompress(self.son))
+            self.loaded = True
+
+        return self._value
+
+    def __repr__(self):
+        if self.loaded:
+            return "<CompressedValue %r>" % (self._value,)
+
+        return "<CompressedValue (%d compressed bytes)>" % len(self.son)
+
+
+def is_untouched(value):
+    """Indicates that `value` is a compressed value that was never decompressed."""
+    return type(value) is CompressedValue and not value.loaded
+
+
+class CompressibleField(object):
+    """
+    Mixin for fields that store their values compressed when the `compress` argument is specified.
+
+    * `compress` - The name of the codec used to compress values (`zlib`, `lzma` or one registered with
+      :py:func:`jetengine.compression.register_codec`)
+    * `compress_threshold` - Values with fewer bytes than this are stored uncompressed (defaults to 1024)
+
+    Fields using the mixin implement `decode` to convert decompressed bytes to values, and store compressed
+    values that were loaded from the database (the `son` of a `CompressedValue`) without compressing them again.
+    """
+
+    def init_compression(self, compress=None, compress_threshold=1024):
+        if compress is not None:
+            get_codec(compress)
+
+        self.compress = compress
+        self.compress_threshold = compress_threshold
+
+    def decode(self, data):
+        raise NotImplementedError()
+
+    def compress_data(self, data):
+        """Returns the compressed value to store for `data` (bytes), or `None` when it's below the threshold."""
+        if len(data) < self.compress_threshold:
+            return None
+
+        return compress(self.compress, data)
+
+    def load_compressed(self, value):
+        """Wraps compressed values loaded from the database so they are only decompressed when accessed."""
+        if is_compressed(value):
+            return CompressedValue(value, self.decode)
+
+        return value
+
+    def get_value(self, value):
+        if type(value) is CompressedValue:
+            return value.value
+
+        return value
@@ -1,5 +1,6 @@
 import sys
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.write_concern import WriteConcern
 from jetengine.database import Database
 
 DEFAULT_CONNECTION_NAME = "default"
@@ -12,6 +13,7 @@ class ConnectionError(Exception):
 _connection_settings = {}
 _connections = {}
 _default_dbs = {}
+_collections_with_options = {}
 
 
 def register_connection(db, alias, **kwargs):
@@ -26,10 +28,12 @@ def cleanup():
     global _connections
     global _connection_settings
     global _default_dbs
+    global _collections_with_options
 
     _connections = {}
     _connection_settings = {}
     _default_dbs = {}
+    _collections_with_options = {}
 
 
 def disconnect(alias=DEFAULT_CONNECTION_NAME):
@@ -43,6 +47,9 @@ def disconnect(alias=DEFAULT_CONNECTION_NAME):
         del _connection_settings[alias]
         del _default_dbs[alias]
 
+        for key in [key for key in _collections_with_options if key[0] == alias]:
+            del _collections_with_options[key]
+
 
 def get_connection(alias=DEFAULT_CONNECTION_NAME, db=None):
     global _connections
@@ -81,6 +88,40 @@ def get_connection(alias=DEFAULT_CONNECTION_NAME, db=None):
     return Database(_connections[alias], database)
 
 
+def get_collection_with_write_concern(collection, write_concern, alias=DEFAULT_CONNECTION_NAME):
+    """Returns the specified collection using a different write concern.
+
+    Collections are cached per connection alias, collection and write concern options.
+
+    :param write_concern: dict of write concern options (ex.: `{"w": 1, "j": False}`)
+    or an instance of `pymongo.write_concern.WriteConcern`.
+    """
+    if isinstance(write_concern, WriteConcern):
+        options = write_concern.document
+    else:
+        options = dict(write_concern)
+
+    type_registry = getattr(collection.codec_options, "type_registry", None)
+    key = (alias, collection.full_name, id(type_registry), tuple(sorted(options.items())))
+    if key not in _collections_with_options:
+        _collections_with_options[key] = collection.with_options(write_concern=WriteConcern(**options))
+
+    return _collections_with_options[key]
+
+
+def get_collection_with_type_registry(collection, type_registry, alias=DEFAULT_CONNECTION_NAME):
+    """Returns the specified collection decoding values with the codecs of `type_registry`.
+
+    Collections are cached per connection alias, collection and type registry.
+    """
+    key = (alias, collection.full_name, "type_registry", id(type_registry))
+    if key not in _collections_with_options:
+        codec_options = collection.codec_options._replace(type_registry=type_registry)
+        _collections_with_options[key] = collection.with_options(codec_options=codec_options)
+
+    return _collections_with_options[key]
+
+
 def connect(db, alias=DEFAULT_CONNECTION_NAME, **kwargs):
     """Connect to the database specified by the 'db' argument.
 
@@ -92,9 +133,15 @@ def connect(db, alias=DEFAULT_CONNECTION_NAME, **kwargs):
     `alias` to connect to a different instance of :program:`mongod`.
 
     Extra keyword-arguments are passed to Motor when connecting to the database.
+    Dates are decoded as timezone-aware values in the timezone given in `tzinfo`
+    (UTC when only `tz_aware=True` is given), so `DateTimeField` doesn't need to
+    convert them when loading documents.
     """
     global _connections
     if alias not in _connections:
+        if kwargs.get("tzinfo") is not None:
+            kwargs.setdefault("tz_aware", True)
+
         kwargs["name"] = db
         register_connection(db, alias, **kwargs)
 
@@ -0,0 +1,57 @@
+"""
+Decoding of query results in worker threads or processes, used by `QuerySet.find_all` with `decode_in`.
+
+The results are fetched as `RawBSONDocument` instances, and the BSON of each batch of `DECODE_BATCH_SIZE` documents
+is decoded and converted to documents by an executor, so the event loop thread only waits for them. Worker
+processes receive the document class and return the documents pickled, so the document classes must be importable
+(defined at module level).
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from bson import decode_all
+
+DECODE_BATCH_SIZE = 1000
+DECODE_MODES = ("thread", "process")
+EXECUTOR_TYPES = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+_executors = {}
+
+
+def get_executor(decode_in, workers=None):
+    """
+    Returns the executor that decodes query results in `decode_in` ("thread" or "process") with `workers` workers
+    (the default number of workers of the executor type when None). Executors are shared by all querysets.
+    """
+    if decode_in not in DECODE_MODES:
+        raise ValueError("Invalid decode_in '%s': must be one of %s." % (decode_in, ", ".join(DECODE_MODES)))
+
+    if workers is not None and workers < 1:
+        raise ValueError("The number of workers must be at least 1.")
+
+    key = (decode_in, workers)
+    if key not in _executors:
+        _executors[key] = EXECUTOR_TYPES[decode_in](max_workers=workers)
+
+    return _executors[key]
+
+
+def shutdown_executors(wait=True):
+    """Shuts down the executors used to decode query results."""
+    for executor in _executors.values():
+        executor.shutdown(wait=wait)
+
+    _executors.clear()
+
+
+def decode_batch(document_type, data, codec_options, is_partly_loaded=False, reference_loaded_fields=None):
+    """
+    Decodes a batch of query results (the concatenated BSON of the documents) and creates instances of
+    `document_type` with them. `codec_options` must not make `decode_all` return raw documents.
+    """
+    return [
+        document_type.from_son(
+            son, _is_partly_loaded=is_partly_loaded, _reference_loaded_fields=reference_loaded_fields
+        )
+        for son in decode_all(data, codec_options)
+    ]
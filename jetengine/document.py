@@ -1,8 +1,21 @@
+from bson.raw_bson import RawBSONDocument
+
 from jetengine.metaclasses import DocumentMetaClass
-from jetengine.errors import InvalidDocumentError, LoadReferencesRequiredError
+from jetengine.errors import LoadReferencesRequiredError
+from jetengine.lazy import LazyValues
+from jetengine.fields.list_field import TrackedList
+from jetengine.serialization import get_serializers
+from jetengine.validation import get_validator
 
 
-AUTHORIZED_FIELDS = ["_id", "_values", "_reference_loaded_fields", "is_partly_loaded"]
+AUTHORIZED_FIELDS = [
+    "_id",
+    "_id_preallocated",
+    "_values",
+    "_changed_fields",
+    "_reference_loaded_fields",
+    "is_partly_loaded",
+]
 
 
 class BaseDocument(object):
@@ -14,9 +27,23 @@ class BaseDocument(object):
         reference fields if any. Default: None.
         :param kw: pairs of fields of the document and their values
         """
+        from bson.objectid import ObjectId
         from jetengine.fields.dynamic_field import DynamicField
 
+        # fields assigned since the document was loaded or saved (`None` while it's new)
+        self._changed_fields = None
+
+        # documents loaded from the database always have an `_id` argument
+        is_new = "_id" not in kw
+
         self._id = kw.pop("_id", None)
+
+        # True while `_id` was allocated by jetengine but the document wasn't inserted yet
+        self._id_preallocated = False
+        if is_new and getattr(self, "__id_allocation__", "save") == "construction":
+            self._id = ObjectId()
+            self._id_preallocated = True
+
         self._values = {}
         self.is_partly_loaded = _is_partly_loaded
 
@@ -63,53 +90,129 @@ class BaseDocument(object):
 
     @classmethod
     def from_son(cls, dic, _is_partly_loaded=False, _reference_loaded_fields=None):
-        field_values = {}
-        _object_id = dic.pop("_id", None)
-        for name, value in dic.items():
-            field = cls.get_field_by_db_name(name)
-            if field:
-                field_values[field.name] = field.from_son(value)
-            else:
-                field_values[name] = value
-        field_values["_id"] = _object_id
-
-        return cls(
-            _is_partly_loaded=_is_partly_loaded, _reference_loaded_fields=_reference_loaded_fields, **field_values
+        if isinstance(dic, (RawBSONDocument,)):
+            return cls.from_raw(
+                dic, _is_partly_loaded=_is_partly_loaded, _reference_loaded_fields=_reference_loaded_fields
+            )
+
+        from_son = get_serializers(cls)[1]
+        return from_son(
+            cls, dic, _is_partly_loaded=_is_partly_loaded, _reference_loaded_fields=_reference_loaded_fields
         )
 
-    def to_son(self):
-        data = dict()
+    @classmethod
+    def hydrate(cls, values, _id=None, _is_partly_loaded=False, _reference_loaded_fields=None):
+        """
+        Creates a document from field values decoded from the database.
+
+        Unlike the constructor, defaults are only evaluated for the fields missing from `values`, and
+        `values` (a dict of field names to values) becomes the values of the document without being copied.
+        """
+        from jetengine.fields.dynamic_field import DynamicField
+
+        document = cls.__new__(cls)
+        object.__setattr__(document, "_id", _id)
+        object.__setattr__(document, "_id_preallocated", False)
+        object.__setattr__(document, "is_partly_loaded", _is_partly_loaded)
+        object.__setattr__(document, "_reference_loaded_fields", _reference_loaded_fields or {})
+        object.__setattr__(document, "_values", values)
+        object.__setattr__(document, "_changed_fields", set())
+
+        fields = cls._fields
+        for name in values:
+            if name not in fields:
+                fields[name] = DynamicField(db_field="_%s" % name.lstrip("_"))
+
+        if len(values) < len(fields):
+            for name, field in fields.items():
+                if name not in values:
+                    values[name] = field.default() if callable(field.default) else field.default
+
+        return document
+
+    @classmethod
+    def from_raw(cls, raw, _is_partly_loaded=False, _reference_loaded_fields=None):
+        """
+        Creates a document from a `RawBSONDocument` without converting its fields.
+
+        Each field is converted when it's first accessed (see `jetengine.lazy.LazyValues`). Keys of the raw
+        document that don't belong to a field are kept when saving the document, but aren't available as attributes.
+        """
+        document = cls.__new__(cls)
+        document._id = raw.get("_id")
+        document._id_preallocated = False
+        document.is_partly_loaded = _is_partly_loaded
+        document._reference_loaded_fields = _reference_loaded_fields or {}
+        document._values = LazyValues(cls, raw)
+        document._changed_fields = set()
 
-        for name, field in self._fields.items():
-            value = self.get_field_value(name)
-            if field.sparse and value is None:
-                continue
-            data[field.db_field] = field.to_son(value)
+        return document
 
-        return data
+    @property
+    def is_lazily_decoded(self):
+        return isinstance(self._values, (LazyValues,))
+
+    def to_son(self):
+        if self.is_lazily_decoded:
+            return self._values.to_son()
+
+        to_son = get_serializers(self.__class__)[0]
+        return to_son(self)
 
     def validate(self):
         return self.validate_fields()
 
     def validate_fields(self):
-        for name, field in self._fields.items():
-
-            value = self.get_field_value(name)
+        """
+        Validates the fields of this document. Fields of documents loaded from the database are only validated
+        if they may have changed since (see `jetengine.validation.compile_validator`).
+        """
+        return get_validator(self.__class__)(self)
 
-            if field.required and field.is_empty(value):
-                raise InvalidDocumentError("Field '%s' is required." % name)
-            if not field.validate(value):
-                raise InvalidDocumentError("Field '%s' must be valid." % name)
+    def clear_changed_fields(self):
+        """Marks the current values of this document (and of its embedded documents) as the ones in the database."""
+        self._changed_fields = set()
 
-        return True
+        # only the values that were decoded, so lazily decoded documents stay lazy
+        for value in dict.values(self._values):
+            if isinstance(value, (TrackedList,)):
+                value._dirty = False
+            elif isinstance(value, (BaseDocument,)):
+                value.clear_changed_fields()
 
-    async def save(self, alias=None, upsert=False):
+    async def save(self, alias=None, upsert=False, write_concern=None):
         """
         Creates or updates the current instance of this document.
         """
-        return await self.objects.save(self, alias=alias, upsert=upsert)
+        return await self.objects.save(self, alias=alias, upsert=upsert, write_concern=write_concern)
+
+    async def upsert_by(self, *fields, alias=None, insert_only=None):
+        """
+        Inserts this document or updates the existing one with the same values for the specified fields.
+
+        Usage::
+
+            result = await User(email="heynemann@gmail.com", name="Bernardo").upsert_by("email")
+            assert result.inserted
+
+        See `QuerySet.upsert_by` for details.
+        """
+        return await self.objects.upsert_by(self, *fields, alias=alias, insert_only=insert_only)
+
+    async def modify(self, alias=None, **kwargs):
+        """
+        Atomically applies update operators to this document and reloads the fields they changed.
+
+        Usage::
+
+            await post.modify(inc__views=1, push__tags="python")
 
-    async def delete(self, alias=None):
+        The available operators are the same as in `QuerySet.update`. Returns `False` if the
+        document does not exist in the database anymore.
+        """
+        return await self.objects._modify_document(self, alias=alias, **kwargs)
+
+    async def delete(self, alias=None, write_concern=None):
         """
         Deletes the current instance of this Document.
 
@@ -143,7 +246,7 @@ class BaseDocument(object):
             io_loop.add_timeout(1, create_user)
             io_loop.start()
         """
-        return await self.objects.remove(instance=self, alias=alias)
+        return await self.objects.remove(instance=self, alias=alias, write_concern=write_concern)
 
     def fill_values_collection(self, collection, field_name, value):
         collection[field_name] = value
@@ -217,7 +320,8 @@ class BaseDocument(object):
         if self.is_reference_field(field):
             value = document._values.get(field_name, None)
             load_function = self._get_load_function(document, field_name, field.reference_type)
-            if value is not None:
+            # references joined with `select_related` are already loaded
+            if value is not None and not isinstance(value, field.reference_type):
                 results.append([load_function, value, document._values, field_name, None])
 
     def find_list_field(self, document, results, field_name, field):
@@ -229,8 +333,13 @@ class BaseDocument(object):
                 document_type = values[0].__class__
                 if isinstance(field._base_field, ReferenceField):
                     document_type = field._base_field.reference_type
+                    if all(isinstance(value, document_type) for value in values):
+                        return
+
                     load_function = self._get_load_function(document, field_name, document_type)
                     for value in values:
+                        if isinstance(value, document_type):
+                            value = value._id
                         results.append(
                             [load_function, value, document._values, field_name, self.fill_list_values_collection]
                         )
@@ -283,6 +392,10 @@ class BaseDocument(object):
 
         if name in self._fields:
             self._values[name] = value
+
+            changed_fields = self._changed_fields
+            if changed_fields is not None:
+                changed_fields.add(name)
             return
 
         object.__setattr__(self, name, value)
@@ -296,7 +409,7 @@ class BaseDocument(object):
 
     @classmethod
     def get_fields(cls, name, fields=None):
-        from jetengine import EmbeddedDocumentField, ListField
+        from jetengine import EmbeddedDocumentField, ListField, JsonField, BaseField
         from jetengine.fields.dynamic_field import DynamicField
 
         if fields is None:
@@ -318,6 +431,10 @@ class BaseDocument(object):
         if isinstance(obj, (ListField,)):
             obj.item_type.get_fields(".".join(field_values[1:]), fields=fields)
 
+        if isinstance(obj, (JsonField,)) and obj.native:
+            # values inside native json fields are queried as they are
+            fields.extend(BaseField(db_field=part) for part in field_values[1:])
+
         return fields
 
 
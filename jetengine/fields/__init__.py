@@ -6,12 +6,15 @@ from jetengine.fields.uuid_field import UUIDField
 from jetengine.fields.list_field import ListField
 from jetengine.fields.embedded_document_field import EmbeddedDocumentField
 from jetengine.fields.reference_field import ReferenceField
+from jetengine.fields.cached_reference_field import CachedReferenceField
 from jetengine.fields.url_field import URLField
 from jetengine.fields.email_field import EmailField
 from jetengine.fields.int_field import IntField
+from jetengine.fields.sequence_field import SequenceField
 from jetengine.fields.float_field import FloatField
 from jetengine.fields.decimal_field import DecimalField
 from jetengine.fields.binary_field import BinaryField
+from jetengine.fields.file_field import FileField
 from jetengine.fields.json_field import JsonField
 from jetengine.fields.objectid_field import ObjectIdField
 from jetengine.fields.dict_field import DictField
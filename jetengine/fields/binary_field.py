@@ -1,7 +1,8 @@
+from jetengine.compression import CompressibleField, CompressedValue, is_compressed
 from jetengine.fields.base_field import BaseField
 
 
-class BinaryField(BaseField):
+class BinaryField(CompressibleField, BaseField):
     """
     Field responsible for storing binary values.
 
@@ -14,18 +15,35 @@ class BinaryField(BaseField):
     Available arguments (apart from those in `BaseField`):
 
     * `max_bytes` - The maximum number of bytes that can be stored in this field
+    * `compress` - The codec used to compress large values (`zlib`, `lzma` or a registered codec)
+    * `compress_threshold` - Values with fewer bytes than this are stored uncompressed (defaults to 1024)
     """
 
-    def __init__(self, max_bytes=None, *args, **kwargs):
+    def __init__(self, max_bytes=None, *args, compress=None, compress_threshold=1024, **kwargs):
         super(BinaryField, self).__init__(*args, **kwargs)
         self.max_bytes = max_bytes
+        self.init_compression(compress, compress_threshold)
+
+        if compress is None:
+            self.identity_methods = ("get_value",)
+
+    def decode(self, data):
+        return data
 
     def to_son(self, value):
         if value is None:
             return None
 
         if not isinstance(value, bytes):
-            return bytes(value)
+            if isinstance(value, (CompressedValue,)):
+                return value.son
+
+            value = bytes(value)
+
+        if self.compress is not None:
+            compressed = self.compress_data(value)
+            if compressed is not None:
+                return compressed
 
         return value
 
@@ -33,6 +51,9 @@ class BinaryField(BaseField):
         if value is None:
             return None
 
+        if self.compress is not None and is_compressed(value):
+            return self.load_compressed(value)
+
         if not isinstance(value, bytes):
             return bytes(value)
 
@@ -0,0 +1,103 @@
+from bson.objectid import ObjectId
+
+from jetengine.fields.reference_field import ReferenceField
+
+_referencing_documents = []
+
+
+def register_referencing_document(document_type, field):
+    """Registers a top-level field of `document_type` that stores cached references."""
+    _referencing_documents.append((document_type, field))
+
+
+def get_referencing_documents(document, field_names=None):
+    """
+    Returns the document types and fields that cache values of the specified document (only the ones that cache
+    any of `field_names` when specified).
+    """
+    result = []
+    seen = set()
+
+    for document_type, field in _referencing_documents:
+        cached_field = getattr(field, "_base_field", field)
+        if not isinstance(document, cached_field.reference_type):
+            continue
+
+        if field_names is not None and not any(name in field_names for name in cached_field.fields):
+            continue
+
+        key = (document_type.__alias__, document_type.__collection__, field.db_field)
+        if key in seen:
+            continue
+
+        seen.add(key)
+        result.append((document_type, field))
+
+    return result
+
+
+class CachedReferenceField(ReferenceField):
+    """
+    Field responsible for creating a reference to another document that also stores some of its fields.
+
+    Usage:
+
+    .. testcode:: modeling_fields
+
+        class User(Document):
+            name = StringField(required=True)
+            avatar = URLField()
+
+        author = CachedReferenceField(User, fields=["name", "avatar"])
+
+    Available arguments (apart from those in `ReferenceField`):
+
+    * `fields` - The names of the fields of the referenced document that are stored along with its id.
+
+    Accessing a cached reference never requires `load_references`: it returns a partly loaded instance of the
+    referenced document with the cached fields filled. Whenever a referenced document is saved (with `save` or
+    `upsert_by`, or changed with `Document.modify`) and any of the cached fields may have changed, the cached
+    values are updated in every collection that references it.
+
+    .. note::
+
+        Only cached references declared directly in a document (or in a ListField of the document) are kept
+        in sync, the copies stored inside embedded documents are not updated. Neither are the copies of documents
+        changed with `QuerySet.update` or `QuerySet.modify`: call `QuerySet.update_cached_references` with the
+        changed documents after them.
+    """
+
+    def __init__(self, reference_document_type=None, fields=None, *args, **kw):
+        super(CachedReferenceField, self).__init__(reference_document_type, *args, **kw)
+
+        self.fields = list(fields or [])
+
+    def to_son(self, value):
+        if value is None:
+            return None
+
+        if isinstance(value, ObjectId):
+            return {"_id": value}
+
+        data = {"_id": value._id}
+
+        for name in self.fields:
+            field = self.reference_type._fields[name]
+            data[field.db_field] = field.to_son(value.get_field_value(name))
+
+        return data
+
+    def to_query(self, value):
+        if value is None or isinstance(value, ObjectId):
+            return value
+
+        if isinstance(value, (tuple, set, list)):
+            return {"$all": [self.to_query(item) for item in value]}
+
+        return value._id
+
+    def from_son(self, value):
+        if value is None or isinstance(value, ObjectId):
+            return value
+
+        return self.reference_type.from_son(dict(value), _is_partly_loaded=True)
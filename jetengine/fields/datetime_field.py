@@ -20,33 +20,51 @@ class DateTimeField(BaseField):
     * `auto_now_on_insert` - When an instance is created sets the field to datetime.now()
     * `auto_now_on_update` - Whenever the instance is saved the field value gets updated to datetime.now()
     * `tz` - Defines the timezone used for auto_now_on_insert and auto_now_on_update and should be enforced on all values of this datetime field. To interpret all times as UTC use tz=datetime.timezone.utc (Defaults: to None, which means waht you put in comes out again)
+    * `parse_strings` - Parses string values with the "%Y-%m-%d %H:%M:%S" format, as older versions did (Defaults: to False)
+
+    The timezone of loaded values is best set for the whole connection with the `tz_aware` and `tzinfo` arguments
+    of `connect`, so the driver decodes the dates already in that timezone. Loaded values that are already in `tz`
+    (or all of them, when `tz` is None) are not converted again.
     """
 
-    def __init__(self, auto_now_on_insert=False, auto_now_on_update=False, tz=None, *args, **kw):
+    def __init__(self, auto_now_on_insert=False, auto_now_on_update=False, tz=None, *args, parse_strings=False, **kw):
         super(DateTimeField, self).__init__(*args, **kw)
         self.auto_now_on_insert = auto_now_on_insert
         self.auto_now_on_update = auto_now_on_update
         self.tz = tz
+        self.parse_strings = parse_strings
+
+        if tz is None and not parse_strings:
+            self.identity_methods = ("to_son", "from_son")
 
     def get_value(self, value):
         return value
 
+    def now(self):
+        return datetime.now(self.tz)
+
     def to_son(self, value):
         if value is None:
             return None
 
-        if isinstance(value, str):
+        if self.parse_strings and isinstance(value, str):
             value = datetime.strptime(value, FORMAT)
 
+        if self.tz is None:
+            return value
+
         return self.ensure_timezone(value)
 
     def from_son(self, value):
         if value is None:
             return None
 
-        if isinstance(value, str):
+        if self.parse_strings and isinstance(value, str):
             value = datetime.strptime(value, FORMAT)
 
+        if self.tz is None or value.tzinfo is self.tz:
+            return value
+
         return self.ensure_timezone(value)
 
     def validate(self, value):
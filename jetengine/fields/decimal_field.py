@@ -1,5 +1,7 @@
 import decimal
 
+from bson.decimal128 import Decimal128
+
 from jetengine.fields.base_field import BaseField
 
 
@@ -31,13 +33,35 @@ class DecimalField(BaseField):
         * decimal.ROUND_UP (away from zero)
         * decimal.ROUND_05UP (away from zero if last digit after rounding towards zero would have been 0 or 5; otherwise towards zero)
 
+    * `storage` - How the value is stored in MongoDB: `string` (the default) or `decimal128`.
+
     .. note::
 
-        Decimal field stores the value as a string in MongoDB to preserve the precision.
+        By default decimal field stores the value as a string in MongoDB to preserve the precision. With
+        `storage="decimal128"` values are stored as BSON Decimal128 instead, which preserves the precision as
+        well and allows range queries, sorting and `$sum` in aggregations to be done by MongoDB.
+
+    With pymongo 3.8 or later Decimal128 values are converted to :py:class:`decimal.Decimal` by the driver (see
+    :py:mod:`jetengine.type_codecs`), so they are not quantized again when loaded.
+
+    Values stored as strings can be converted after switching to `decimal128` (and back) with
+    :py:meth:`jetengine.queryset.QuerySet.migrate_field`.
     """
 
-    def __init__(self, min_value=None, max_value=None, precision=2, rounding=decimal.ROUND_HALF_UP, *args, **kw):
+    STORAGE_TYPES = ("string", "decimal128")
+
+    def __init__(
+        self, min_value=None, max_value=None, precision=2, rounding=decimal.ROUND_HALF_UP, *args, storage="string", **kw
+    ):
         super(DecimalField, self).__init__(*args, **kw)
+
+        if storage not in self.STORAGE_TYPES:
+            raise ValueError(
+                "Invalid storage '%s' for DecimalField: must be one of %s." % (storage, ", ".join(self.STORAGE_TYPES))
+            )
+
+        self.storage = storage
+        self.bson_type = Decimal128 if storage == "decimal128" else None
         self.min_value = min_value
         if self.min_value is not None:
             self.min_value = decimal.Decimal(min_value)
@@ -53,22 +77,45 @@ class DecimalField(BaseField):
         if value is None:
             return None
 
-        value = decimal.Decimal(value)
-        return str(value.quantize(self.precision, rounding=self.rounding))
+        value = self.to_decimal(value).quantize(self.precision, rounding=self.rounding)
+
+        if self.storage == "decimal128":
+            return Decimal128(value)
+
+        return str(value)
+
+    def to_query(self, value):
+        if value is None or self.storage != "decimal128":
+            return self.to_son(value)
+
+        # query values are not quantized, so `amount__gte=Decimal("10.004")` does not match 10.00
+        return Decimal128(self.to_decimal(value))
 
     def from_son(self, value):
         if value is None:
             return None
 
-        value = decimal.Decimal(value)
-        return value.quantize(self.precision, rounding=self.rounding)
+        return self.to_decimal(value).quantize(self.precision, rounding=self.rounding)
+
+    def to_decimal(self, value):
+        if isinstance(value, (Decimal128,)):
+            return value.to_decimal()
+
+        return decimal.Decimal(value)
+
+    def get_migration_query(self):
+        """Returns the query that matches values stored in a different format than `storage`."""
+        if self.storage == "decimal128":
+            return {"$type": "string"}
+
+        return {"$type": "decimal"}
 
     def validate(self, value):
         if value is None:
             return True
 
         try:
-            value = decimal.Decimal(value)
+            value = self.to_decimal(value)
         except:
             return False
 
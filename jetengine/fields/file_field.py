@@ -0,0 +1,282 @@
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+
+from jetengine.connection import DEFAULT_CONNECTION_NAME, get_connection
+from jetengine.fields.base_field import BaseField
+
+
+class GridFSReader(object):
+    """
+    Stream that reads the bytes `start` to `end` (exclusive) of a file stored in GridFS, one chunk at a time.
+
+    Usage::
+
+        async for chunk in message.attachment.open():
+            response.write(chunk)
+
+        async with message.attachment.open(start=1024, end=2048) as stream:
+            data = await stream.read(512)
+    """
+
+    def __init__(self, file, start=0, end=None, alias=None):
+        if start < 0 or (end is not None and end < start):
+            raise ValueError("Invalid range %s-%s: start must be positive and lesser than end." % (start, end))
+
+        self.file = file
+        self.start = start
+        self.end = end
+        self.alias = alias
+
+        self._grid_out = None
+        self._remaining = None
+
+    @property
+    def length(self):
+        """Total length of the file (available after the stream was opened)."""
+        if self._grid_out is None:
+            return None
+
+        return self._grid_out.length
+
+    async def open(self):
+        if self._grid_out is not None:
+            return self
+
+        self._grid_out = await self.file.get_bucket(self.alias).open_download_stream(self.file.get_file_id())
+
+        end = self._grid_out.length
+        if self.end is not None:
+            end = min(self.end, end)
+
+        if self.start:
+            self._grid_out.seek(self.start)
+
+        self._remaining = max(end - self.start, 0)
+        return self
+
+    async def read(self, size=-1):
+        """Reads at most `size` bytes of the range (or the rest of it)."""
+        await self.open()
+
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+
+        if size == 0:
+            return b""
+
+        data = await self._grid_out.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self.open()
+
+        if self._remaining <= 0:
+            raise StopAsyncIteration
+
+        chunk = await self._grid_out.readchunk()
+        if not chunk:
+            raise StopAsyncIteration
+
+        chunk = chunk[: self._remaining]
+        self._remaining -= len(chunk)
+        return chunk
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._remaining = 0
+
+
+class GridFSWriter(object):
+    """
+    Stream that uploads a new file to GridFS in chunks. When the stream is closed the file is assigned to the
+    document (the previous file, if any, is not removed).
+
+    Usage::
+
+        async with message.attachment.open_writer(filename="report.pdf") as stream:
+            async for data in request.stream:
+                await stream.write(data)
+
+        await message.save()
+
+    The upload is aborted (and the uploaded chunks removed) if the block raises an exception.
+    """
+
+    def __init__(self, file, filename=None, metadata=None, alias=None):
+        self.file = file
+        self.filename = filename
+        self.metadata = metadata
+        self.alias = alias
+
+        self._grid_in = None
+
+    async def open(self):
+        if self._grid_in is None:
+            self._grid_in = self.file.get_bucket(self.alias).open_upload_stream(
+                self.filename or "", chunk_size_bytes=self.file.field.chunk_size, metadata=self.metadata
+            )
+
+        return self
+
+    async def write(self, data):
+        await self.open()
+        await self._grid_in.write(data)
+
+    async def close(self):
+        await self.open()
+        await self._grid_in.close()
+        self.file.file_id = self._grid_in._id
+
+    async def abort(self):
+        if self._grid_in is not None:
+            await self._grid_in.abort()
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            await self.abort()
+        else:
+            await self.close()
+
+
+class GridFSFile(object):
+    """
+    Value of a `FileField`: a reference to a file stored in GridFS (or no file, when `file_id` is `None`).
+    """
+
+    def __init__(self, field, file_id=None):
+        self.field = field
+        self.file_id = file_id
+
+    def get_bucket(self, alias=None):
+        return self.field.get_bucket(alias)
+
+    def get_file_id(self):
+        if self.file_id is None:
+            raise ValueError("No file was stored in field '%s'." % self.field.name)
+
+        return self.file_id
+
+    def open(self, start=0, end=None, alias=None):
+        """Returns a `GridFSReader` for the bytes `start` to `end` (exclusive) of the file."""
+        return GridFSReader(self, start=start, end=end, alias=alias)
+
+    async def read(self, start=0, end=None, alias=None):
+        """Reads the bytes `start` to `end` (exclusive) of the file."""
+        return await self.open(start=start, end=end, alias=alias).read()
+
+    def open_writer(self, filename=None, metadata=None, alias=None):
+        """Returns a `GridFSWriter` that uploads a new file for this field."""
+        return GridFSWriter(self, filename=filename, metadata=metadata, alias=alias)
+
+    async def put(self, data, filename=None, metadata=None, alias=None):
+        """Uploads `data` (bytes or an async iterable of bytes) as the new file of this field."""
+        async with self.open_writer(filename=filename, metadata=metadata, alias=alias) as stream:
+            if isinstance(data, (bytes, bytearray)):
+                await stream.write(data)
+            else:
+                async for chunk in data:
+                    await stream.write(chunk)
+
+        return self.file_id
+
+    async def delete(self, alias=None):
+        """Removes the file from GridFS (if it still exists) and clears the reference to it."""
+        if self.file_id is None:
+            return
+
+        await self.field.delete_file(self.file_id, alias=alias)
+        self.file_id = None
+
+    def __eq__(self, other):
+        return isinstance(other, GridFSFile) and self.file_id == other.file_id
+
+    def __hash__(self):
+        return hash(self.file_id)
+
+    def __repr__(self):
+        return "<GridFSFile %s>" % self.file_id
+
+
+class FileField(BaseField):
+    """
+    Field responsible for storing files in GridFS. The document only stores the id of the file, so the size of
+    the files isn't limited by the maximum size of documents and their content is never loaded with them.
+
+    Usage:
+
+    .. testcode:: modeling_fields
+
+        attachment = FileField(bucket="attachments")
+
+    Available arguments (apart from those in `BaseField`):
+
+    * `bucket` - The name of the GridFS bucket (defaults to `fs`)
+    * `chunk_size` - The size of the chunks of new files (defaults to the GridFS default)
+    * `alias` - The connection alias of the database that stores the files. When not specified, the files are
+      stored in the database of the alias passed to each operation (or of the default connection).
+
+    The value of the field is a :py:class:`GridFSFile` that reads and writes the file with async streams::
+
+        async with message.attachment.open_writer(filename="report.pdf") as stream:
+            await stream.write(data)
+        await message.save()
+
+        async for chunk in message.attachment.open(start=0, end=1024):
+            ...
+
+    The files of documents removed with `delete()`, `QuerySet.delete()` or `QuerySet.delete_many()` are
+    removed from GridFS as well.
+    """
+
+    def __init__(self, bucket="fs", chunk_size=None, alias=None, *args, **kw):
+        super(FileField, self).__init__(*args, **kw)
+
+        self.bucket = bucket
+        self.chunk_size = chunk_size
+        self.alias = alias
+
+        if self.default is None:
+            self.default = self.new_file
+
+    def new_file(self):
+        return GridFSFile(self)
+
+    def get_bucket(self, alias=None):
+        # the alias of the field always wins, so files are read and removed where they were written
+        database = get_connection(alias=self.alias or alias or DEFAULT_CONNECTION_NAME).database
+
+        # the chunk size is given when uploading, since the buckets of motor 1.3 only take the collection name
+        return AsyncIOMotorGridFSBucket(database, collection=self.bucket)
+
+    async def delete_file(self, file_id, alias=None):
+        try:
+            await self.get_bucket(alias).delete(file_id)
+        except NoFile:
+            pass
+
+    def get_file_id(self, value):
+        if isinstance(value, (GridFSFile,)):
+            return value.file_id
+
+        return value
+
+    def is_empty(self, value):
+        return self.get_file_id(value) is None
+
+    def validate(self, value):
+        return value is None or isinstance(value, (GridFSFile,))
+
+    def to_son(self, value):
+        return self.get_file_id(value)
+
+    def from_son(self, value):
+        return GridFSFile(self, value)
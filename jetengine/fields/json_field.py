@@ -1,8 +1,9 @@
+from jetengine.compression import CompressibleField, is_compressed, is_untouched
 from jetengine.fields.base_field import BaseField
-from jetengine.utils import serialize, deserialize
+from jetengine import utils
 
 
-class JsonField(BaseField):
+class JsonField(CompressibleField, BaseField):
     """
     Field responsible for storing json objects.
 
@@ -12,32 +13,104 @@ class JsonField(BaseField):
 
         name = JsonField(required=True)
 
-    Available arguments (apart from those in `BaseField`): `None`
+    Available arguments (apart from those in `BaseField`):
+
+    * `native` - Stores the value as a BSON sub-document instead of a json string, so it can be queried
+      with dotted paths (`Q(payload__status="done")`) and is never converted to and from text
+    * `compress` - The codec used to compress large values (`zlib`, `lzma` or a registered codec)
+    * `compress_threshold` - Values whose json has fewer bytes than this are stored uncompressed (defaults to 1024)
 
     .. note ::
 
-        If ujson is available, JetEngine will try to use it.
-        Otherwise it will fallback to the json serializer that comes with python.
+        Values are serialized with ujson if it's available or with the json module that comes with python.
+        orjson is faster but only used when chosen with :py:func:`jetengine.utils.use_json_serializer`.
+
+    Values stored as json strings can be converted after switching to `native` (and back) with
+    :py:meth:`jetengine.queryset.QuerySet.migrate_field`.
     """
 
+    def __init__(self, *args, native=False, compress=None, compress_threshold=1024, **kw):
+        super(JsonField, self).__init__(*args, **kw)
+
+        if native and compress is not None:
+            raise ValueError("A JsonField can't be both native and compressed.")
+
+        self.native = native
+        self.init_compression(compress, compress_threshold)
+
+        if native:
+            self.identity_methods = ("get_value", "to_son", "from_son")
+        elif compress is None:
+            self.identity_methods = ("get_value",)
+
+    def decode(self, data):
+        return utils.deserialize(data.decode("utf-8"))
+
     def validate(self, value):
         if value is None:
             return True
 
+        if self.native:
+            return self.validate_keys(value)
+
         try:
-            serialize(value)
+            utils.serialize(value)
             return True
         except:
             return False
 
+    def validate_keys(self, value):
+        """Keys of sub-documents must be strings that don't start with `$` or contain `.`."""
+        if isinstance(value, (dict,)):
+            for key, item in value.items():
+                if not isinstance(key, (str,)) or key.startswith("$") or "." in key:
+                    return False
+
+                if not self.validate_keys(item):
+                    return False
+
+        elif isinstance(value, (list, tuple)):
+            return all(self.validate_keys(item) for item in value)
+
+        return True
+
     def to_son(self, value):
-        if value is None:
-            return None
+        if value is None or self.native:
+            return value
+
+        if self.compress is None:
+            return utils.serialize(value)
 
-        return serialize(value)
+        # the value may have been changed in place after it was decompressed
+        if is_untouched(value):
+            return value.son
+
+        data = utils.serialize(self.get_value(value))
+        compressed = self.compress_data(data.encode("utf-8"))
+        if compressed is None:
+            return data
+
+        return compressed
 
     def from_son(self, value):
-        if value is None:
-            return None
+        if value is None or self.native:
+            return value
+
+        if self.compress is not None and is_compressed(value):
+            return self.load_compressed(value)
+
+        return utils.deserialize(value)
+
+    def get_migration_query(self):
+        """Returns the query that matches values stored in a different format than the field uses."""
+        if self.native:
+            return {"$type": "string"}
+
+        return {"$type": ["object", "array"]}
+
+    def migrate_value(self, value):
+        """Converts a value stored in the other format to the format the field uses."""
+        if self.native:
+            return utils.deserialize(value)
 
-        return deserialize(value)
+        return self.to_son(value)
@@ -1,6 +1,44 @@
 from jetengine.fields.base_field import BaseField
 
 
+class TrackedList(list):
+    """List loaded from the database that records whether it was changed in place since then."""
+
+    _dirty = False
+
+    def __reduce__(self):
+        # lists are unpickled with `extend` by default, which would mark them as changed
+        return (TrackedList, (list(self),), {"_dirty": self._dirty})
+
+
+def _mark_as_dirty(name):
+    method = getattr(list, name)
+
+    def mark(self, *args, **kw):
+        self._dirty = True
+        return method(self, *args, **kw)
+
+    mark.__name__ = name
+    return mark
+
+
+for _method_name in (
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(TrackedList, _method_name, _mark_as_dirty(_method_name))
+
+
 class ListField(BaseField):
     """
     Field responsible for storing :py:class:`list`.
@@ -57,8 +95,8 @@ class ListField(BaseField):
 
     def from_son(self, value):
         if value is None:
-            return list()
-        return list(map(self._base_field.from_son, value))
+            return TrackedList()
+        return TrackedList(map(self._base_field.from_son, value))
 
     @property
     def item_type(self):
@@ -0,0 +1,111 @@
+import asyncio
+
+from pymongo import ReturnDocument
+
+from jetengine.fields.int_field import IntField
+
+_allocators = {}
+
+
+def reset_sequences():
+    """Discards the blocks of sequence values reserved by this process."""
+    _allocators.clear()
+
+
+class SequenceAllocator(object):
+    """Hands out the values of a block reserved in the counters collection, reserving a new block when it runs out."""
+
+    def __init__(self):
+        self.next_value = 1
+        self.last_value = 0
+        self._lock = None
+        self._loop = None
+
+    @property
+    def lock(self):
+        loop = asyncio.get_event_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        return self._lock
+
+    @property
+    def available(self):
+        return self.last_value - self.next_value + 1
+
+    async def reserve(self, coll, sequence_name, size):
+        counter = await coll.find_one_and_update(
+            {"_id": sequence_name}, {"$inc": {"value": size}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+
+        self.last_value = counter["value"]
+        self.next_value = self.last_value - size + 1
+
+    async def allocate(self, coll, sequence_name, count, block_size):
+        values = []
+
+        while len(values) < count:
+            if self.available <= 0:
+                async with self.lock:
+                    # another task may have reserved a block while this one waited for the lock
+                    if self.available <= 0:
+                        await self.reserve(coll, sequence_name, max(block_size, count - len(values)))
+
+            size = min(count - len(values), self.available)
+            values.extend(range(self.next_value, self.next_value + size))
+            self.next_value += size
+
+        return values
+
+
+class SequenceField(IntField):
+    """
+    Field responsible for storing monotonically increasing integers assigned when documents are inserted.
+
+    Usage:
+
+    .. testcode:: modeling_fields
+
+        number = SequenceField(block_size=1000)
+
+    Available arguments (apart from those in `IntField`):
+
+    * `sequence_name` - The name of the counter (defaults to `<collection>.<db_field>`)
+    * `collection` - The collection that stores the counters (defaults to `counters`)
+    * `block_size` - How many values are reserved at a time
+
+    Values are reserved in blocks with a single `$inc` in the counters collection and handed out by each
+    process without further round trips, so bulk inserts get their values with almost no overhead. Values
+    are unique but may have gaps, since the unused values of a block are lost when the process exits.
+
+    .. note::
+
+        Values are only assigned to sequence fields declared directly in a document, not in embedded documents.
+    """
+
+    def __init__(self, sequence_name=None, collection="counters", block_size=1000, *args, **kw):
+        super(SequenceField, self).__init__(*args, **kw)
+
+        if block_size < 1:
+            raise ValueError("The block_size of a SequenceField must be at least 1.")
+
+        self.sequence_name = sequence_name
+        self.collection = collection
+        self.block_size = block_size
+
+    def get_sequence_name(self, document_type):
+        if self.sequence_name is not None:
+            return self.sequence_name
+
+        return "%s.%s" % (document_type.__collection__, self.db_field)
+
+    async def next_values(self, database, document_type, count, alias=None):
+        """Returns the next `count` values of the sequence of this field in `document_type`."""
+        sequence_name = self.get_sequence_name(document_type)
+
+        key = (alias, database.name, self.collection, sequence_name)
+        if key not in _allocators:
+            _allocators[key] = SequenceAllocator()
+
+        return await _allocators[key].allocate(database[self.collection], sequence_name, count, self.block_size)
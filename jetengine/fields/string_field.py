@@ -1,7 +1,8 @@
+from jetengine.compression import CompressibleField, CompressedValue
 from jetengine.fields.base_field import BaseField
 
 
-class StringField(BaseField):
+class StringField(CompressibleField, BaseField):
     """
     Field responsible for storing text.
 
@@ -14,11 +15,21 @@ class StringField(BaseField):
     Available arguments (apart from those in `BaseField`):
 
     * `max_length` - Raises a validation error if the string being stored exceeds the number of characters specified by this parameter
+    * `compress` - The codec used to compress large values (`zlib`, `lzma` or a registered codec)
+    * `compress_threshold` - Values with fewer bytes (in UTF-8) than this are stored uncompressed (defaults to 1024)
+
+    .. note::
+
+        Compressed values are stored as binary, so they can't be used in queries other than exact matches.
     """
 
-    def __init__(self, max_length=None, *args, **kw):
+    def __init__(self, max_length=None, *args, compress=None, compress_threshold=1024, **kw):
         super(StringField, self).__init__(*args, **kw)
         self.max_length = max_length
+        self.init_compression(compress, compress_threshold)
+
+        if compress is None:
+            self.identity_methods = ("get_value", "to_son", "from_son")
 
     def validate(self, value):
         if value is None:
@@ -35,3 +46,25 @@ class StringField(BaseField):
 
     def is_empty(self, value):
         return value is None or value == ""
+
+    def decode(self, data):
+        return data.decode("utf-8")
+
+    def to_son(self, value):
+        if value is None or self.compress is None:
+            return value
+
+        if isinstance(value, (CompressedValue,)):
+            return value.son
+
+        compressed = self.compress_data(value.encode("utf-8"))
+        if compressed is None:
+            return value
+
+        return compressed
+
+    def from_son(self, value):
+        if self.compress is None:
+            return value
+
+        return self.load_compressed(value)
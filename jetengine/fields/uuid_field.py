@@ -1,5 +1,7 @@
 from uuid import UUID
 
+from bson.binary import Binary, OLD_UUID_SUBTYPE, UUID_SUBTYPE
+
 from jetengine.fields.base_field import BaseField
 
 
@@ -11,9 +13,28 @@ class UUIDField(BaseField):
 
     .. testcode:: modeling_fields
 
-        name = UUIDField(required=True)
+        name = UUIDField(required=True, representation="standard")
+
+    Available arguments (apart from those in `BaseField`):
+
+    * `representation` - How the value is stored in MongoDB. By default `uuid.UUID` values are passed to motor
+      as they are and stored in the UUID representation configured in the driver. With `standard` they are
+      stored as BSON binary subtype 4 regardless of the driver configuration.
+
+    Values stored as strings (or in the legacy binary subtype 3) can be converted to the standard representation
+    with :py:meth:`jetengine.queryset.QuerySet.migrate_field`.
     """
 
+    REPRESENTATIONS = (None, "standard")
+
+    def __init__(self, *args, representation=None, **kw):
+        super(UUIDField, self).__init__(*args, **kw)
+
+        if representation not in self.REPRESENTATIONS:
+            raise ValueError("Invalid representation '%s' for UUIDField: must be standard or None." % representation)
+
+        self.representation = representation
+
     def validate(self, value):
         if value is None:
             return True
@@ -38,6 +59,32 @@ class UUIDField(BaseField):
             return None
 
         if isinstance(value, str):
-            return UUID(value)
+            value = UUID(value)
+
+        if self.representation == "standard":
+            return Binary(value.bytes, UUID_SUBTYPE)
 
         return value
+
+    def from_son(self, value):
+        if value is None or isinstance(value, UUID):
+            return value
+
+        if isinstance(value, Binary) and value.subtype in (OLD_UUID_SUBTYPE, UUID_SUBTYPE):
+            return UUID(bytes=bytes(value))
+
+        if isinstance(value, bytes):
+            return UUID(bytes=value)
+
+        return UUID(value)
+
+    def get_migration_query(self):
+        """
+        Returns the query that matches values that may be stored in a different format than `representation`.
+        Binary values already stored in the standard representation are matched as well, but don't match the
+        values read by the migration when rewritten, so they are left unchanged.
+        """
+        if self.representation == "standard":
+            return {"$type": ["string", "binData"]}
+
+        return {"$type": "string"}
@@ -0,0 +1,146 @@
+from bson.raw_bson import RawBSONDocument
+
+from jetengine.serialization import is_compressed_field
+
+
+def get_raw_codec_options(codec_options):
+    """Returns the codec options that make motor return `RawBSONDocument` instances."""
+    return codec_options._replace(document_class=RawBSONDocument)
+
+
+def inflate(value):
+    """Converts raw BSON documents (including the ones nested in lists) to dicts."""
+    if isinstance(value, (RawBSONDocument,)):
+        return dict((key, inflate(item)) for key, item in value.items())
+
+    if isinstance(value, (list,)):
+        return [inflate(item) for item in value]
+
+    return value
+
+
+class LazyValues(dict):
+    """
+    Values of a document created from a `RawBSONDocument`.
+
+    Each field is converted with its `from_son` method only when it's first accessed, and the result is cached.
+    Fields that were never accessed are written back from the raw document when the document is saved.
+    """
+
+    def __init__(self, document_type, raw):
+        super(LazyValues, self).__init__()
+
+        self.document_type = document_type
+        self.raw = raw
+        self.pending = set(document_type._fields.keys())
+        self.touched = False
+
+    @property
+    def untouched(self):
+        return not self.touched
+
+    def load(self, name):
+        if name not in self.pending:
+            return
+
+        self.pending.discard(name)
+        self.touched = True
+        field = self.document_type._fields[name]
+
+        if field.db_field in self.raw:
+            value = field.from_son(inflate(self.raw[field.db_field]))
+        elif callable(field.default):
+            value = field.default()
+        else:
+            value = field.default
+
+        dict.__setitem__(self, name, value)
+
+    def load_all(self):
+        for name in list(self.pending):
+            self.load(name)
+
+    def __getitem__(self, name):
+        self.load(name)
+        return dict.__getitem__(self, name)
+
+    def get(self, name, default=None):
+        self.load(name)
+        return dict.get(self, name, default)
+
+    def __contains__(self, name):
+        self.load(name)
+        return dict.__contains__(self, name)
+
+    def __setitem__(self, name, value):
+        self.pending.discard(name)
+        self.touched = True
+        dict.__setitem__(self, name, value)
+
+    def __delitem__(self, name):
+        self.load(name)
+        self.touched = True
+        dict.__delitem__(self, name)
+
+    def setdefault(self, name, default=None):
+        self.load(name)
+        return dict.setdefault(self, name, default)
+
+    def pop(self, name, *args):
+        self.load(name)
+        return dict.pop(self, name, *args)
+
+    def update(self, *args, **kw):
+        values = dict(*args, **kw)
+        for name in values:
+            self.pending.discard(name)
+        self.touched = True
+        dict.update(self, values)
+
+    def __iter__(self):
+        self.load_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self.load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+    def copy(self):
+        self.load_all()
+        return dict(self)
+
+    def __repr__(self):
+        self.load_all()
+        return dict.__repr__(self)
+
+    def to_son(self):
+        """Serializes the document re-encoding only the fields that were accessed or changed."""
+        data = dict((key, value) for key, value in self.raw.items() if key != "_id")
+
+        for name, field in self.document_type._fields.items():
+            if name in self.pending and field.db_field in self.raw:
+                continue
+
+            value = self.get(name)
+            if not is_compressed_field(field):
+                value = field.get_value(value)
+
+            if field.sparse and value is None:
+                data.pop(field.db_field, None)
+                continue
+
+            data[field.db_field] = field.to_son(value)
+
+        return data
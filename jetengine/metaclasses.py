@@ -1,6 +1,12 @@
 from jetengine.fields import BaseField
+from jetengine.fields.cached_reference_field import CachedReferenceField, register_referencing_document
 from jetengine.errors import InvalidDocumentError
 from jetengine.queryset import QuerySet
+from jetengine.serialization import compile_serializers
+
+# "save" assigns an ObjectId right before the document is inserted and
+# "construction" as soon as a new instance is created
+ID_ALLOCATION_MODES = ("save", "construction")
 
 
 class classproperty(property):
@@ -61,11 +67,32 @@ class DocumentMetaClass(type):
         if "__lazy__" not in attrs:
             new_class.__lazy__ = True
 
+        if "__lazy_decode__" not in attrs:
+            new_class.__lazy_decode__ = False
+
         if "__alias__" not in attrs:
             new_class.__alias__ = None
 
+        if "__write_concern__" not in attrs:
+            new_class.__write_concern__ = None
+
+        if "__id_allocation__" not in attrs:
+            new_class.__id_allocation__ = "save"
+
+        if new_class.__id_allocation__ not in ID_ALLOCATION_MODES:
+            raise ValueError(
+                "Invalid __id_allocation__ '%s' in '%s': must be one of %s."
+                % (new_class.__id_allocation__, name, ", ".join(ID_ALLOCATION_MODES))
+            )
+
         setattr(new_class, "objects", classproperty(lambda *args, **kw: cls.query_set_class(new_class)))
 
+        compile_serializers(new_class)
+
+        for field_name, doc_field in doc_fields.items():
+            if isinstance(getattr(doc_field, "_base_field", doc_field), CachedReferenceField):
+                register_referencing_document(new_class, doc_field)
+
         return new_class
 
     @classmethod
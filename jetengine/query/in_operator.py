@@ -42,4 +42,10 @@ class InQueryOperator(QueryOperator):
         return {field_name: {"$in": value}}
 
     def get_value(self, field, value):
+        from jetengine.fields.cached_reference_field import CachedReferenceField
+
+        if isinstance(field, (CachedReferenceField,)):
+            # cached references are matched by id
+            return [field.to_query(val) for val in value]
+
         return [field.to_son(val) for val in value]
@@ -58,7 +58,20 @@ def update(d, u):
     return d
 
 
+def get_query_field(field):
+    """Returns the field that converts the values compared with `field` (the items of lists of cached references)."""
+    from jetengine.fields.cached_reference_field import CachedReferenceField
+    from jetengine.fields.list_field import ListField
+
+    if isinstance(field, (ListField,)) and isinstance(field._base_field, (CachedReferenceField,)):
+        return field._base_field
+
+    return field
+
+
 def transform_query(document, **query):
+    from jetengine.fields.cached_reference_field import CachedReferenceField
+
     mongo_query = {}
 
     for key, value in sorted(query.items()):
@@ -67,10 +80,10 @@ def transform_query(document, **query):
             continue
 
         if "__" not in key:
-            field = document.get_fields(key)[0]
-            field_name = field.db_field
+            fields = document.get_fields(key)[:1]
+            field_name = fields[0].db_field
             operator = DefaultOperator()
-            field_value = operator.get_value(field, value)
+            field_value = operator.get_value(get_query_field(fields[0]), value)
         else:
             values = key.split("__")
             field_reference_name, operator = ".".join(values[:-1]), values[-1]
@@ -82,13 +95,95 @@ def transform_query(document, **query):
 
             field_name = ".".join([hasattr(field, "db_field") and field.db_field or field for field in fields])
             operator = OPERATORS.get(operator, DefaultOperator)()
-            field_value = operator.get_value(fields[-1], value)
+            field_value = operator.get_value(get_query_field(fields[-1]), value)
+
+        if isinstance(get_query_field(fields[-1]), (CachedReferenceField,)):
+            # cached references are stored as sub-documents
+            field_name = "%s._id" % field_name
 
         update(mongo_query, operator.to_query(field_name, field_value))
 
     return mongo_query
 
 
+UPDATE_OPERATORS = {
+    "set": "$set",
+    "unset": "$unset",
+    "inc": "$inc",
+    "dec": "$inc",
+    "mul": "$mul",
+    "max": "$max",
+    "min": "$min",
+    "push": "$push",
+    "push_all": "$push",
+    "add_to_set": "$addToSet",
+    "pull": "$pull",
+    "pull_all": "$pullAll",
+    "pop": "$pop",
+}
+
+
+def get_update_value(operator, field, value):
+    from jetengine.fields.base_field import BaseField
+    from jetengine.fields.list_field import ListField
+
+    if operator == "unset":
+        return ""
+
+    if operator == "pop":
+        return value
+
+    if not isinstance(field, (BaseField,)):
+        return value
+
+    if operator in ("push", "push_all", "add_to_set", "pull", "pull_all"):
+        item_field = field._base_field if isinstance(field, (ListField,)) else field
+
+        if operator in ("push_all", "pull_all") or (operator == "add_to_set" and isinstance(value, (tuple, set, list))):
+            items = [item_field.to_son(item) for item in value]
+            if operator == "pull_all":
+                return items
+            return {"$each": items}
+
+        return item_field.to_son(value)
+
+    if value is None:
+        return None
+
+    value = field.to_son(value)
+
+    if operator == "dec":
+        return -value
+
+    return value
+
+
+def transform_update(document, **update):
+    """Transforms keyword arguments such as `inc__views=1` into a MongoDB update document.
+
+    Keys without an operator are set as they are (`name="Bernardo"` is the same as `set__name="Bernardo"`)
+    and fields of embedded documents are separated with `__` (`set__author__name="Bernardo"`).
+    """
+    mongo_update = {}
+
+    for key, value in sorted(update.items()):
+        values = key.split("__")
+        operator = "set"
+        if len(values) > 1 and values[0] in UPDATE_OPERATORS:
+            operator = values.pop(0)
+
+        fields = document.get_fields(".".join(values))
+        field_name = ".".join([field.db_field for field in fields])
+
+        update_operator = UPDATE_OPERATORS[operator]
+        if update_operator not in mongo_update:
+            mongo_update[update_operator] = {}
+
+        mongo_update[update_operator][field_name] = get_update_value(operator, fields[-1], value)
+
+    return mongo_update
+
+
 def validate_fields(document, query):
     from jetengine.fields.embedded_document_field import EmbeddedDocumentField
     from jetengine.fields.list_field import ListField
@@ -1,19 +1,35 @@
 import sys
+import time
+import asyncio
 import operator
 import itertools
-from datetime import datetime
 
-from pymongo.errors import DuplicateKeyError
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from easydict import EasyDict as edict
 from bson.objectid import ObjectId
+from bson.son import SON
 
-from jetengine import ASCENDING
+from jetengine import ASCENDING, DESCENDING
 from jetengine.aggregation.base import Aggregation
-from jetengine.connection import get_connection
+from jetengine.connection import (
+    DEFAULT_CONNECTION_NAME,
+    get_connection,
+    get_collection_with_type_registry,
+    get_collection_with_write_concern,
+)
+from jetengine.decoding import DECODE_BATCH_SIZE, decode_batch, get_executor
 from jetengine.errors import UniqueKeyViolationError, PartlyLoadedDocumentError
+from jetengine.lazy import LazyValues, get_raw_codec_options
+from jetengine.type_codecs import get_type_registry
+from jetengine.validation import EMPTY, MUTABLE_FIELD_TYPES, get_validator, is_tracked_list_field
 from jetengine.query_builder.field_list import QueryFieldList
+from jetengine.write_buffer import WriteBuffer, get_write_buffer
 
 DEFAULT_LIMIT = 1000
+# number of GridFS files removed concurrently (and of documents read at once to find them)
+FILE_BATCH_SIZE = 100
+SELECT_RELATED_PREFIX = "_related_"
 
 
 class QuerySet(object):
@@ -25,24 +41,77 @@ class QuerySet(object):
         self._order_fields = []
         self._loaded_fields = QueryFieldList()
         self._reference_loaded_fields = {}
+        self._select_related = []
+        self._prefetch = {}
+        self._lazy_decode = klass.__lazy_decode__
 
     @property
     def is_lazy(self):
         return self.__klass__.__lazy__
 
+    def lazy_decode(self, enabled=True):
+        """
+        Returns documents backed by the raw BSON returned by the database, converting each field only when
+        it's first accessed.
+
+        Usage::
+
+            event = await Event.objects.lazy_decode().get(event_id)
+            # only the `name` field is converted
+            print(event.name)
+
+        Documents that are saved without accessing or changing any field are written back without being decoded.
+        Setting `__lazy_decode__ = True` in a document class enables it for all of its querysets.
+        """
+        self._lazy_decode = enabled
+        return self
+
+    def _read_coll(self, alias=None):
+        coll = self.coll(alias)
+
+        if self._lazy_decode and not self._select_related:
+            coll = coll.with_options(codec_options=get_raw_codec_options(coll.codec_options))
+
+        return coll
+
     def _get_connection_function(self):
         return get_connection
 
-    def coll(self, alias=None):
+    def coll(self, alias=None, write_concern=None):
+        """
+        Returns the collection of this queryset's document.
+
+        Values are decoded with the type codecs required by the fields of the document
+        (see `jetengine.type_codecs`).
+
+        Writes use the specified `write_concern` (a dict such as `{"w": 1, "j": False}` or a
+        `pymongo.write_concern.WriteConcern`), falling back to the `__write_concern__` of the document
+        class and then to the write concern of the connection.
+        """
         get_connection = self._get_connection_function()
         if alias is not None:
             conn = get_connection(alias=alias)
         elif self.__klass__.__alias__ is not None:
-            conn = get_connection(alias=self.__klass__.__alias__)
+            alias = self.__klass__.__alias__
+            conn = get_connection(alias=alias)
         else:
             conn = get_connection()
 
-        return conn[self.__klass__.__collection__]
+        collection = conn[self.__klass__.__collection__]
+
+        type_registry = get_type_registry(self.__klass__)
+        if type_registry is not None:
+            collection = get_collection_with_type_registry(
+                collection, type_registry, alias=alias or DEFAULT_CONNECTION_NAME
+            )
+
+        if write_concern is None:
+            write_concern = self.__klass__.__write_concern__
+
+        if write_concern is None:
+            return collection
+
+        return get_collection_with_write_concern(collection, write_concern, alias=alias or DEFAULT_CONNECTION_NAME)
 
     async def create(self, alias=None, **kwargs):
         """
@@ -111,38 +180,80 @@ class QuerySet(object):
             # check the need for autogeneration of datetime field value
             if isinstance(field, DateTimeField):
                 if field.auto_now_on_insert and not updating:
-                    setattr(document, field_name, datetime.now())
+                    setattr(document, field_name, field.now())
                 elif field.auto_now_on_update:
-                    setattr(document, field_name, datetime.now())
+                    setattr(document, field_name, field.now())
 
             if field.on_save is not None:
                 setattr(document, field_name, field.on_save(document, updating))
 
             if isinstance(field, EmbeddedDocumentField):
+                if document.is_lazily_decoded and field_name in document._values.pending:
+                    # embedded documents that weren't accessed are kept as they were loaded
+                    continue
+
                 # update fields recursively for embedded document
                 doc = getattr(document, field_name)
                 if doc:
                     self.update_field_on_save_values(doc, updating)
 
-    async def _save(self, document, alias=None):
+    async def assign_sequence_values(self, documents, alias=None):
+        """Assigns the next values of each `SequenceField` to the documents that don't have one yet."""
+        from jetengine.fields.sequence_field import SequenceField
+
+        for field_name, field in self.__klass__._fields.items():
+            if not isinstance(field, (SequenceField,)):
+                continue
+
+            missing = [document for document in documents if document._values.get(field_name) is None]
+            if not missing:
+                continue
+
+            values = await field.next_values(
+                self.coll(alias).database,
+                self.__klass__,
+                len(missing),
+                alias=alias or self.__klass__.__alias__ or DEFAULT_CONNECTION_NAME,
+            )
+
+            for document, value in zip(missing, values):
+                document._values[field_name] = value
+
+    def _is_inserting(self, document):
+        return document._id is None or document._id_preallocated
+
+    def _allocate_id(self, document):
+        """Assigns a new ObjectId to documents that were never inserted, so they can be referenced right away."""
+        if document._id is None:
+            document._id = ObjectId()
+            document._id_preallocated = True
+
+        return document._id
+
+    async def _save(self, document, alias=None, upsert=False, write_concern=None):
         """ Insert or update document """
-        doc = document.to_son()
+        if document.is_lazily_decoded and document._values.untouched and not self._is_inserting(document):
+            # nothing was decoded or changed, so the raw document is written back as is
+            doc = document._values.raw
+        else:
+            doc = document.to_son()
 
-        if document._id is not None:
+        if not self._is_inserting(document):
             try:
-                await self.coll(alias).update({"_id": document._id}, doc)
+                await self.coll(alias, write_concern).update({"_id": document._id}, doc, upsert=upsert)
             except DuplicateKeyError as e:
                 raise UniqueKeyViolationError.from_pymongo(str(e), self.__klass__)
         else:
+            doc["_id"] = self._allocate_id(document)
             try:
-                doc_id = await self.coll(alias).insert(doc)
+                await self.coll(alias, write_concern).insert(doc)
             except DuplicateKeyError as e:
                 raise UniqueKeyViolationError.from_pymongo(str(e), self.__klass__)
-            document._id = doc_id
+            document._id_preallocated = False
 
         return document
 
-    async def save(self, document, alias=None, upsert=False):
+    def _ensure_fully_loaded(self, document):
         if document.is_partly_loaded:
             msg = (
                 "Partly loaded document {0} can't be saved. Document should "
@@ -151,10 +262,98 @@ class QuerySet(object):
             )
             raise PartlyLoadedDocumentError(msg.format(document.__class__.__name__))
 
-        self.update_field_on_save_values(document, document._id is not None)
+    async def save(self, document, alias=None, upsert=False, write_concern=None):
+        """
+        Creates or updates the specified document.
+
+        When `upsert` is `True`, a document that has an `_id` but no longer exists in the database is inserted
+        instead of being silently ignored. `write_concern` overrides the `__write_concern__` of the document class.
+        """
+        self._ensure_fully_loaded(document)
+
+        updating = not self._is_inserting(document)
+        self.update_field_on_save_values(document, updating)
+
+        if not updating:
+            await self.assign_sequence_values([document], alias=alias)
+
         if self.validate_document(document):
             await self.ensure_index(alias=alias)
-            return await self._save(document, alias=alias)
+
+            # the changes are known only until they are cleared below
+            references = self._get_outdated_cached_references(document) if updating else None
+
+            write_buffer = get_write_buffer(self.__klass__)
+            if write_buffer is not None and write_buffer.accepts(alias=alias, write_concern=write_concern):
+                # the future is resolved once the buffered write is flushed to the database
+                document._id = await write_buffer.add(document, upsert=upsert)
+                document._id_preallocated = False
+            else:
+                document = await self._save(document, alias=alias, upsert=upsert, write_concern=write_concern)
+
+            document.clear_changed_fields()
+
+            if references:
+                await self.update_cached_references(document, alias=alias, references=references)
+
+            return document
+
+    def _get_outdated_cached_references(self, document):
+        """
+        Returns the document types and fields that cache values of the specified document that may have changed
+        since it was loaded or saved (see `jetengine.validation.compile_validator`).
+        """
+        from jetengine.fields.cached_reference_field import get_referencing_documents
+
+        references = get_referencing_documents(document)
+        if not references or document._changed_fields is None:
+            return references
+
+        values = document._values
+        pending = values.pending if type(values) is LazyValues else EMPTY
+
+        changed = set(document._changed_fields)
+        for name, field in document._fields.items():
+            if name in changed or name in pending:
+                continue
+
+            if is_tracked_list_field(field):
+                if getattr(dict.get(values, name), "_dirty", True):
+                    changed.add(name)
+            elif isinstance(field, MUTABLE_FIELD_TYPES):
+                changed.add(name)
+
+        return get_referencing_documents(document, changed)
+
+    async def update_cached_references(self, document, alias=None, references=None):
+        """
+        Updates the values cached by `CachedReferenceField` in all documents that reference the specified document.
+
+        This is called automatically when a document is saved (or upserted with `upsert_by`) or changed with
+        `Document.modify` and any of the cached values may have changed, but not by `update` or `modify`. Each
+        referencing collection is updated with a single `update_many`.
+
+        :param references: the document types and fields to update, all the ones that reference the document
+        when `None`
+        """
+        from jetengine.fields.cached_reference_field import get_referencing_documents
+        from jetengine.fields.list_field import ListField
+
+        if references is None:
+            references = get_referencing_documents(document)
+
+        for document_type, field in references:
+            coll = document_type.objects.coll(alias)
+            id_field = "%s._id" % field.db_field
+
+            if isinstance(field, (ListField,)):
+                await coll.update_many(
+                    {id_field: document._id},
+                    {"$set": {"%s.$[reference]" % field.db_field: field._base_field.to_son(document)}},
+                    array_filters=[{"reference._id": document._id}],
+                )
+            else:
+                await coll.update_many({id_field: document._id}, {"$set": {field.db_field: field.to_son(document)}})
 
     def indexes_saved_before_save(self, document, callback, alias=None, upsert=False):
         def handle(*args, **kw):
@@ -169,6 +368,117 @@ class QuerySet(object):
 
         return handle
 
+    async def upsert_by(self, document, *fields, alias=None, insert_only=None):
+        """
+        Inserts the specified document, or updates the existing document that has the same values
+        for the specified natural key fields, in a single round trip.
+
+        Usage::
+
+            result = await User.objects.upsert_by(User(email="heynemann@gmail.com", name="Bernardo"), User.email)
+            # or
+            result = await user.upsert_by("email")
+
+            result.inserted  # True if a new document was created
+            result._id  # the id of the inserted or updated document
+
+        Fields are written with `$set`, except the ones that must only be written when the document is
+        created, which are written with `$setOnInsert`: the fields in `insert_only`, the `DateTimeField`
+        instances with `auto_now_on_insert` but without `auto_now_on_update` and the `SequenceField` values
+        assigned by this call. As in `save`, updated documents get their `SequenceField` values from the database
+        (the values assigned to them are skipped) and update the values cached by `CachedReferenceField`.
+
+        :param document: the document to insert or update
+        :param fields: fields (or field names) that identify the existing document
+        :param insert_only: fields (or field names) that are only written when inserting the document
+        :returns: dict with `inserted` and `_id`. The `_id` of the document is updated as well.
+        """
+        from pymongo import ReturnDocument
+        from jetengine.fields.base_field import BaseField
+        from jetengine.fields.datetime_field import DateTimeField
+        from jetengine.fields.sequence_field import SequenceField
+
+        if not fields:
+            raise ValueError(
+                "At least one field must be specified to upsert documents of '%s'." % self.__klass__.__name__
+            )
+
+        names = [field.name if isinstance(field, (BaseField,)) else field for field in fields]
+        insert_only = [field.name if isinstance(field, (BaseField,)) else field for field in insert_only or []]
+
+        for name in names + insert_only:
+            if name not in self.__klass__._fields:
+                raise ValueError(
+                    "Invalid upsert field '%s': Field not found in '%s'." % (name, self.__klass__.__name__)
+                )
+
+        self._ensure_fully_loaded(document)
+        self.update_field_on_save_values(document, False)
+
+        # sequence values are only written if the document is inserted, updated documents keep theirs
+        sequences = [
+            name
+            for name, field in self.__klass__._fields.items()
+            if isinstance(field, (SequenceField,)) and document._values.get(name) is None
+        ]
+        await self.assign_sequence_values([document], alias=alias)
+
+        if not self.validate_document(document):
+            return None
+
+        references = self._get_outdated_cached_references(document)
+
+        values = document.to_son()
+
+        key = {}
+        for name in names:
+            db_field = self.__klass__._fields[name].db_field
+            key[db_field] = values.pop(db_field, None)
+
+        # the id is generated here so it is known even when the document is inserted
+        set_on_insert = {"_id": document._id or ObjectId()}
+        for name, field in self.__klass__._fields.items():
+            is_insert_only = (
+                name in insert_only
+                or name in sequences
+                or (isinstance(field, (DateTimeField,)) and field.auto_now_on_insert and not field.auto_now_on_update)
+            )
+            if is_insert_only and field.db_field in values:
+                set_on_insert[field.db_field] = values.pop(field.db_field)
+
+        update_document = {"$setOnInsert": set_on_insert}
+        if values:
+            update_document["$set"] = values
+
+        projection = {"_id": True}
+        for name in sequences:
+            projection[self.__klass__._fields[name].db_field] = True
+
+        await self.ensure_index(alias=alias)
+
+        try:
+            previous = await self.coll(alias).find_one_and_update(
+                key, update_document, projection=projection, upsert=True, return_document=ReturnDocument.BEFORE
+            )
+        except DuplicateKeyError as e:
+            raise UniqueKeyViolationError.from_pymongo(str(e), self.__klass__)
+
+        inserted = previous is None
+        document._id = set_on_insert["_id"] if inserted else previous["_id"]
+        document._id_preallocated = False
+
+        if not inserted:
+            for name in sequences:
+                field = self.__klass__._fields[name]
+                document._values[name] = field.from_son(previous.get(field.db_field))
+
+        document.clear_changed_fields()
+
+        if not inserted and references:
+            await self.update_cached_references(document, alias=alias, references=references)
+
+        return edict({"inserted": inserted, "_id": document._id})
+
     def validate_document(self, document):
         if not isinstance(document, self.__klass__):
             raise ValueError(
@@ -178,6 +488,41 @@ class QuerySet(object):
 
         return document.validate()
 
+    def validate_documents(self, documents):
+        """
+        Validates many documents at once, looking up the compiled validator of each document class only once.
+        """
+        from jetengine.document import BaseDocument
+
+        validators = {}
+
+        for document_index, document in enumerate(documents):
+            document_type = type(document)
+
+            try:
+                if document_type not in validators:
+                    if not isinstance(document, self.__klass__):
+                        self.validate_document(document)
+
+                    if document_type.validate is BaseDocument.validate:
+                        validators[document_type] = get_validator(document_type)
+                    else:
+                        # the document class has its own validation
+                        validators[document_type] = document_type.validate
+
+                is_valid = validators[document_type](document)
+            except Exception:
+                err = sys.exc_info()[1]
+                raise ValueError(
+                    "Validation for document %d in the documents you are saving failed with: %s"
+                    % (document_index, str(err))
+                )
+
+            if not is_valid:
+                return False
+
+        return True
+
     def handle_bulk_insert(self, documents, callback):
         def handle(*arguments, **kw):
             if len(arguments) > 1 and arguments[1]:
@@ -189,37 +534,56 @@ class QuerySet(object):
 
         return handle
 
-    async def bulk_insert(self, documents, alias=None):
+    def buffered(self, max_batch=500, max_delay_ms=20, alias=None, write_concern=None):
+        """
+        Returns an async context manager that coalesces the saves of this document into batched writes.
+
+        Usage::
+
+            async with Event.objects.buffered(max_batch=500, max_delay_ms=20):
+                event = await Event.objects.create(name="click")
+
+        Every `save()` and `create()` of this document made while the buffer is active is flushed in a
+        single `insert_many` (or `bulk_write`) together with the other pending writes, once `max_batch` writes
+        are pending or `max_delay_ms` milliseconds have passed. Each call still returns its own document (with
+        its `_id`) or raises its own error, like `UniqueKeyViolationError`. See `jetengine.write_buffer.WriteBuffer`.
+        """
+        return WriteBuffer(
+            self, max_batch=max_batch, max_delay_ms=max_delay_ms, alias=alias, write_concern=write_concern
+        )
+
+    async def bulk_insert(self, documents, alias=None, write_concern=None):
         """
         Inserts all documents passed to this method in one go.
+
+        The ids of the documents are assigned before they are sent to the database.
+        `write_concern` overrides the `__write_concern__` of the document class.
         """
 
-        is_valid = True
         docs_to_insert = []
 
-        for document_index, document in enumerate(documents):
-            self.update_field_on_save_values(document, document._id is not None)
-            try:
-                is_valid = is_valid and self.validate_document(document)
-            except Exception:
-                err = sys.exc_info()[1]
-                raise ValueError(
-                    "Validation for document %d in the documents you are saving failed with: %s"
-                    % (document_index, str(err))
-                )
-
-            if not is_valid:
-                return
+        await self.assign_sequence_values(documents, alias=alias)
 
-            docs_to_insert.append(document.to_son())
+        for document in documents:
+            self.update_field_on_save_values(document, not self._is_inserting(document))
 
-        if not is_valid:
+        if not self.validate_documents(documents):
             return
 
-        doc_ids = await self.coll(alias).insert(docs_to_insert)
+        for document in documents:
+            if not document._id_preallocated:
+                # bulk inserts always create new documents
+                document._id = None
 
-        for object_index, object_id in enumerate(doc_ids):
-            documents[object_index]._id = object_id
+            doc = document.to_son()
+            doc["_id"] = self._allocate_id(document)
+            docs_to_insert.append(doc)
+
+        await self.coll(alias, write_concern).insert(docs_to_insert)
+
+        for document in documents:
+            document._id_preallocated = False
+            document.clear_changed_fields()
 
         return documents
 
@@ -245,23 +609,140 @@ class QuerySet(object):
 
         return result
 
-    async def update(self, definition, alias=None):
-        definition = self.transform_definition(definition)
+    def get_update_document(self, definition=None, **kwargs):
+        """Builds the MongoDB update document for `update` and `modify`."""
+        from jetengine.query_builder.transform import transform_update, update
+
+        result = {}
+
+        if definition:
+            definition = self.transform_definition(definition)
+            fields = dict((key, value) for key, value in definition.items() if not key.startswith("$"))
+            if fields:
+                result["$set"] = fields
+            update(result, dict((key, value) for key, value in definition.items() if key.startswith("$")))
+
+        if kwargs:
+            update(result, transform_update(self.__klass__, **kwargs))
+
+        if not result:
+            raise ValueError("An update definition or update operators must be provided.")
+
+        return result
+
+    async def update(self, definition=None, alias=None, multi=True, upsert=False, write_concern=None, **kwargs):
+        """
+        Updates the documents that match the specified filters (if any) atomically.
+
+        Usage::
+
+            await User.objects.filter(first_name="Bernardo").update({User.last_name: "Heynemann"})
+            # or with update operators
+            await Post.objects.filter(title="Post").update(inc__views=1, push__tags="python", unset__draft=True)
+
+        The available operators are `set` (the default), `unset`, `inc`, `dec`, `mul`, `max`, `min`, `push`,
+        `push_all`, `add_to_set`, `pull`, `pull_all` and `pop`. Fields of embedded documents are separated
+        with `__` (ex.: `set__author__name`) and values are converted using the `to_son` method of their fields.
+        Copies of the updated documents cached by `CachedReferenceField` are not updated (see
+        `update_cached_references`).
+
+        :param definition: dict of fields (or field names) to the values that will be set
+        :param multi: when `True` all matching documents are updated, otherwise only the first one is
+        :param upsert: inserts a new document when no document matches the filters. The id of the new
+        document is returned as `upserted_id`.
+        :param write_concern: overrides the `__write_concern__` of the document class. The counts returned
+        are `None` when the write is not acknowledged (`w=0`).
+        :param kwargs: update operators and their values
+        """
+        update_document = self.get_update_document(definition, **kwargs)
 
         update_filters = {}
         if self._filters:
             update_filters = self.get_query_from_filters(self._filters)
 
-        update_arguments = dict(spec=update_filters, document={"$set": definition}, multi=True)
+        coll = self.coll(alias, write_concern)
+
+        try:
+            if multi:
+                res = await coll.update_many(update_filters, update_document, upsert=upsert)
+            else:
+                res = await coll.update_one(update_filters, update_document, upsert=upsert)
+        except DuplicateKeyError as e:
+            raise UniqueKeyViolationError.from_pymongo(str(e), self.__klass__)
+
+        if not res.acknowledged:
+            return edict({"count": None, "updated_existing": None, "modified": None, "upserted_id": None})
+
+        return edict(
+            {
+                "count": res.matched_count,
+                "updated_existing": res.matched_count > 0,
+                "modified": res.modified_count,
+                "upserted_id": res.upserted_id,
+            }
+        )
 
-        res = await self.coll(alias).update(**update_arguments)
+    async def _modify_document(self, document, alias=None, **kwargs):
+        """Applies update operators to a saved document and reloads the fields that changed."""
+        from pymongo import ReturnDocument
+        from jetengine.fields.cached_reference_field import get_referencing_documents
 
-        return edict({"count": int(res["n"]), "updated_existing": res["updatedExisting"]})
+        if self._is_inserting(document):
+            raise ValueError("Can't modify a document of type '%s' before saving it." % self.__klass__.__name__)
 
-    async def delete(self, alias=None):
+        update_document = self.get_update_document(**kwargs)
+
+        projection = {}
+        for operator_fields in update_document.values():
+            for field_name in operator_fields.keys():
+                projection[field_name.split(".")[0]] = QueryFieldList.ONLY
+
+        son = await self.coll(alias).find_one_and_update(
+            {"_id": document._id}, update_document, projection=projection, return_document=ReturnDocument.AFTER
+        )
+
+        if son is None:
+            return False
+
+        changed = set()
+        for db_field in projection.keys():
+            field = self.__klass__.get_field_by_db_name(db_field)
+            if field is None:
+                continue
+            document._values[field.name] = field.from_son(son.get(db_field))
+            changed.add(field.name)
+
+        references = get_referencing_documents(document, changed)
+        if references:
+            await self.update_cached_references(document, alias=alias, references=references)
+
+        return True
+
+    async def delete(
+        self,
+        alias=None,
+        write_concern=None,
+        chunk_size=None,
+        max_rate=None,
+        pause_on_replication_lag=None,
+        progress=None,
+        resume_after=None,
+    ):
         """
         Removes all instances of this document that match the specified filters (if any).
 
+        By default all documents are removed with a single operation. Large purges can be throttled by
+        specifying `chunk_size`: the ids of the matching documents are then read in `_id` order and removed
+        in batches of at most `chunk_size` documents using `$in`.
+
+        :param chunk_size: maximum number of documents removed per operation
+        :param max_rate: maximum number of documents removed per second
+        :param pause_on_replication_lag: number of seconds of replication lag above which the removal waits for
+        the secondaries to catch up (ignored when not connected to a replica set)
+        :param progress: callable that receives the number of documents removed so far and the `_id` of the
+        last removed document after each batch
+        :param resume_after: `_id` reported by `progress` from which an interrupted removal is resumed
+
         .. testsetup:: saving_delete
 
             import asyncio
@@ -285,8 +766,291 @@ class QuerySet(object):
 
             io_loop.run_until_complete(saving_delete())
         """
+        if chunk_size is None:
+            if max_rate is not None or pause_on_replication_lag is not None or resume_after is not None:
+                raise ValueError("The chunk_size must be specified to throttle or resume deletes.")
+
+            return await self.remove(alias=alias, write_concern=write_concern)
+
+        if chunk_size < 1:
+            raise ValueError("The chunk_size must be at least 1.")
+
+        return await self._delete_in_chunks(
+            chunk_size,
+            alias=alias,
+            write_concern=write_concern,
+            max_rate=max_rate,
+            pause_on_replication_lag=pause_on_replication_lag,
+            progress=progress,
+            resume_after=resume_after,
+        )
+
+    async def _delete_in_chunks(
+        self,
+        chunk_size,
+        alias=None,
+        write_concern=None,
+        max_rate=None,
+        pause_on_replication_lag=None,
+        progress=None,
+        resume_after=None,
+    ):
+        query_filters = {}
+        if self._filters:
+            query_filters = self.get_query_from_filters(self._filters)
+
+        coll = self.coll(alias, write_concern)
+        reader = self.coll(alias)
+        file_fields = self._get_file_fields()
+
+        projection = {"_id": True}
+        for field in file_fields:
+            projection[field.db_field] = True
+
+        deleted = 0
+        last_id = resume_after
+        start = time.monotonic()
+
+        while True:
+            chunk_filters = query_filters
+            if last_id is not None:
+                chunk_filters = {"$and": [query_filters, {"_id": {"$gt": last_id}}]}
+
+            cursor = reader.find(chunk_filters, projection=projection, sort=[("_id", ASCENDING)], limit=chunk_size)
+            items = await cursor.to_list(chunk_size)
+            ids = [item["_id"] for item in items]
+
+            if not ids:
+                break
+
+            # the filters are applied again so documents changed since they were read are kept
+            res = await coll.delete_many({"$and": [query_filters, {"_id": {"$in": ids}}]})
+            deleted += res.deleted_count if res.acknowledged else len(ids)
+            last_id = ids[-1]
+
+            if file_fields:
+                await self._delete_files(items, file_fields, res.deleted_count if res.acknowledged else None, alias)
+
+            if progress is not None:
+                progress(deleted, last_id)
+
+            if len(ids) < chunk_size:
+                break
+
+            if max_rate is not None:
+                delay = deleted / float(max_rate) - (time.monotonic() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if pause_on_replication_lag is not None:
+                await self._wait_for_replication(pause_on_replication_lag, alias=alias)
+
+        return deleted
+
+    async def _get_replication_lag(self, alias=None):
+        """
+        Returns the number of seconds the slowest secondary is behind the primary or `None` when the
+        connection is not to a replica set.
+        """
+        admin = self.coll(alias).database.client.admin
+
+        try:
+            status = await admin.command("replSetGetStatus")
+        except OperationFailure:
+            return None
+
+        members = status.get("members", [])
+        primary = [member["optimeDate"] for member in members if member.get("stateStr") == "PRIMARY"]
+        secondaries = [member["optimeDate"] for member in members if member.get("stateStr") == "SECONDARY"]
+
+        if not primary or not secondaries:
+            return None
+
+        return max((primary[0] - min(secondaries)).total_seconds(), 0)
+
+    async def _wait_for_replication(self, max_lag, alias=None, interval=1.0):
+        while True:
+            lag = await self._get_replication_lag(alias=alias)
+            if lag is None or lag <= max_lag:
+                return
+
+            await asyncio.sleep(interval)
+
+    async def delete_many(self, instances, chunk_size=1000, alias=None, write_concern=None):
+        """
+        Removes the specified instances of this document using one `$in` operation per `chunk_size` instances.
+
+        Usage::
+
+            number_of_deleted_items = await User.objects.delete_many(users)
+
+        Returns `None` when the removals are not acknowledged (`w=0`).
+        """
+        instances = [instance for instance in instances if instance._id is not None]
+        coll = self.coll(alias, write_concern)
+        file_fields = self._get_file_fields()
+
+        deleted = 0
+        for index in range(0, len(instances), chunk_size):
+            chunk = instances[index : index + chunk_size]
+            res = await coll.delete_many({"_id": {"$in": [instance._id for instance in chunk]}})
+
+            if not res.acknowledged:
+                deleted = None
+            elif deleted is not None:
+                deleted += res.deleted_count
+
+            if file_fields:
+                items = [self._get_file_ids(instance, file_fields) for instance in chunk]
+                await self._delete_files(items, file_fields, res.deleted_count if res.acknowledged else None, alias)
+
+        return deleted
+
+    async def reload_many(self, instances, fields=None, chunk_size=1000, alias=None):
+        """
+        Reloads the specified instances of this document in place using one `$in` query per `chunk_size` instances.
+
+        Usage::
+
+            await User.objects.reload_many(users)
+            # or reloading only some of the fields
+            await User.objects.reload_many(users, fields=["last_login", User.email])
+
+        When `fields` are specified only the values of those fields are replaced (fields of embedded documents
+        replace the whole embedded document). Returns the instances that still exist in the database.
+        """
+        from jetengine.fields.base_field import BaseField
+
+        queryset = self.__klass__.objects
+        names = None
+
+        if fields:
+            queryset.only(*fields)
+            names = set()
+            for field in fields:
+                if isinstance(field, (BaseField,)):
+                    field = field.name
+                names.add(field.split(".")[0])
+
+        projection = queryset._loaded_fields.to_query(self.__klass__)
+        instances_by_id = {}
+        for instance in instances:
+            if instance._id is not None:
+                instances_by_id.setdefault(instance._id, []).append(instance)
+
+        ids = list(instances_by_id.keys())
+        reloaded = []
+
+        for index in range(0, len(ids), chunk_size):
+            chunk = ids[index : index + chunk_size]
+            cursor = queryset.coll(alias).find({"_id": {"$in": chunk}}, projection=projection)
+
+            for son in await cursor.to_list(length=None):
+                document = self.__klass__.from_son(
+                    son,
+                    _is_partly_loaded=bool(queryset._loaded_fields),
+                    _reference_loaded_fields=queryset._reference_loaded_fields,
+                )
+
+                for instance in instances_by_id[document._id]:
+                    if names is None:
+                        instance._values = dict(document._values)
+                        instance.is_partly_loaded = document.is_partly_loaded
+                        instance._reference_loaded_fields = document._reference_loaded_fields
+                        instance._changed_fields = set()
+                    else:
+                        for name in names:
+                            instance._values[name] = document._values.get(name)
+                            if instance._changed_fields is not None:
+                                instance._changed_fields.discard(name)
+
+                    reloaded.append(instance)
+
+        return reloaded
+
+    async def migrate_field(
+        self, field, batch_size=1000, alias=None, write_concern=None, progress=None, resume_after=None
+    ):
+        """
+        Converts the values of the specified field that are stored in a different format than the field currently
+        uses (e.g. after changing a `DecimalField` to `storage="decimal128"`), reading and rewriting the matching
+        documents in batches of `batch_size` in `_id` order.
+
+        Usage::
+
+            number_of_migrated_items = await Account.objects.migrate_field("balance")
+            # or only some of the documents
+            await Account.objects.filter(currency="EUR").migrate_field(Account.balance, batch_size=500)
+
+        The field must implement `get_migration_query`, and values are converted with its `migrate_value` method
+        (or with `from_son` and `to_son` when it has none). After each batch `progress(migrated, last_id)` is called
+        (if specified) and an interrupted migration can be continued from `last_id` with `resume_after`. Values
+        changed by other writes while a batch was being converted are not overwritten.
+        """
+        from jetengine.fields.base_field import BaseField
+
+        if isinstance(field, (BaseField,)):
+            field = field.name
+
+        document_field = self.__klass__._fields.get(field)
+        if document_field is None:
+            raise ValueError("Invalid field '%s': field not found in '%s'." % (field, self.__klass__.__name__))
+
+        if not hasattr(document_field, "get_migration_query"):
+            raise ValueError("The values of field '%s' can't be migrated." % field)
+
+        if batch_size < 1:
+            raise ValueError("The batch_size must be at least 1.")
+
+        convert = getattr(document_field, "migrate_value", None)
+        if convert is None:
+
+            def convert(value):
+                return document_field.to_son(document_field.from_son(value))
+
+        db_field = document_field.db_field
+        query_filters = {db_field: document_field.get_migration_query()}
+        if self._filters:
+            query_filters = {"$and": [self.get_query_from_filters(self._filters), query_filters]}
+
+        coll = self.coll(alias, write_concern)
+        reader = self.coll(alias)
 
-        return await self.remove(alias=alias)
+        migrated = 0
+        last_id = resume_after
+
+        while True:
+            batch_filters = query_filters
+            if last_id is not None:
+                batch_filters = {"$and": [query_filters, {"_id": {"$gt": last_id}}]}
+
+            cursor = reader.find(
+                batch_filters, projection={db_field: True}, sort=[("_id", ASCENDING)], limit=batch_size
+            )
+            items = await cursor.to_list(batch_size)
+
+            if not items:
+                break
+
+            operations = [
+                UpdateOne(
+                    {"_id": item["_id"], db_field: item[db_field]},
+                    {"$set": {db_field: convert(item[db_field])}},
+                )
+                for item in items
+            ]
+
+            res = await coll.bulk_write(operations, ordered=False)
+            migrated += res.modified_count if res.acknowledged else len(operations)
+            last_id = items[-1]["_id"]
+
+            if progress is not None:
+                progress(migrated, last_id)
+
+            if len(items) < batch_size:
+                break
+
+        return migrated
 
     def handle_remove(self, callback):
         def handle(*args, **kw):
@@ -294,19 +1058,95 @@ class QuerySet(object):
 
         return handle
 
-    async def remove(self, instance=None, alias=None):
+    async def remove(self, instance=None, alias=None, write_concern=None):
+        coll = self.coll(alias, write_concern)
+        file_fields = self._get_file_fields()
+        items = []
+
         if instance is not None:
             if hasattr(instance, "_id") and instance._id:
-                res = await self.coll(alias).remove(instance._id)
+                res = await coll.remove(instance._id)
+                items = [self._get_file_ids(instance, file_fields)]
         else:
+            remove_filters = {}
             if self._filters:
                 remove_filters = self.get_query_from_filters(self._filters)
-                res = await self.coll(alias).remove(remove_filters)
+
+            if file_fields:
+                return await self._remove_with_files(coll, remove_filters, file_fields, alias=alias)
+
+            if self._filters:
+                res = await coll.remove(remove_filters)
             else:
-                res = await self.coll(alias).remove()
+                res = await coll.remove()
+
+        if file_fields and items:
+            await self._delete_files(items, file_fields, None if res is None else res["n"], alias)
+
+        # unacknowledged removals (w=0) have no result
+        if res is None:
+            return None
 
         return res["n"]
 
+    async def _remove_with_files(self, coll, remove_filters, file_fields, alias=None):
+        """
+        Removes the documents that match `remove_filters` in batches of `FILE_BATCH_SIZE` read from a single
+        cursor, removing the GridFS files of each batch after its documents.
+        """
+        projection = dict((field.db_field, True) for field in file_fields)
+        cursor = self.coll(alias).find(remove_filters, projection=projection, batch_size=FILE_BATCH_SIZE)
+        removed = 0
+
+        while True:
+            items = await cursor.to_list(length=FILE_BATCH_SIZE)
+            if not items:
+                break
+
+            # the filters are applied again so documents changed since they were read are kept
+            res = await coll.delete_many({"$and": [remove_filters, {"_id": {"$in": [item["_id"] for item in items]}}]})
+            await self._delete_files(items, file_fields, res.deleted_count if res.acknowledged else None, alias)
+
+            # unacknowledged removals (w=0) have no count
+            removed = res.deleted_count + removed if res.acknowledged and removed is not None else None
+
+        return removed
+
+    def _get_file_fields(self):
+        from jetengine.fields.file_field import FileField
+
+        return [field for field in self.__klass__._fields.values() if isinstance(field, (FileField,))]
+
+    def _get_file_ids(self, instance, file_fields):
+        item = {"_id": instance._id}
+        for field in file_fields:
+            item[field.db_field] = field.get_file_id(instance._values.get(field.name))
+
+        return item
+
+    async def _delete_files(self, items, file_fields, deleted_count=None, alias=None):
+        """
+        Removes the GridFS files referenced by the specified documents (dicts with the `_id` and the ids of the
+        files) after the documents were removed. When fewer documents than expected were removed, the files of
+        the documents that still exist are kept.
+        """
+        if deleted_count is not None and deleted_count < len(items):
+            cursor = self.coll(alias).find({"_id": {"$in": [item["_id"] for item in items]}}, projection={"_id": True})
+            remaining = set(item["_id"] for item in await cursor.to_list(length=None))
+            items = [item for item in items if item["_id"] not in remaining]
+
+        files = [
+            (field, item[field.db_field])
+            for item in items
+            for field in file_fields
+            if item.get(field.db_field) is not None
+        ]
+
+        for index in range(0, len(files), FILE_BATCH_SIZE):
+            await asyncio.gather(
+                *[field.delete_file(file_id, alias=alias) for field, file_id in files[index : index + FILE_BATCH_SIZE]]
+            )
+
     def _check_valid_field_name_to_project(self, field_name, value):
         """Determine a presence of the field_name in the document.
 
@@ -541,6 +1381,418 @@ class QuerySet(object):
 
         return self
 
+    def select_related(self, *paths):
+        """Join referenced documents server-side when loading documents.
+
+        Each path names a reference field (or a list of references), optionally
+        reached through embedded documents and lists, using either `__` or `.`
+        as separator. `find_all` and `get` then run a single aggregation with a
+        `$lookup` per path and hydrate the referenced documents in the same
+        pass, instead of issuing one `get` per reference. References to
+        documents that don't exist anymore keep their ids, as they do in
+        documents loaded without `select_related`.
+
+        Usage::
+
+            posts = await Post.objects.select_related("author", "comments__author").find_all()
+            posts[0].author.name  # no need to call load_references
+
+        Projections for referenced documents (ex.: `.only("author.name")`) are
+        honored. Exclusions for referenced documents are applied as long as
+        the main document is not being loaded with `only()`.
+
+        :param paths: paths to the reference fields to join
+        """
+        from jetengine.fields.base_field import BaseField
+        from jetengine.fields.cached_reference_field import CachedReferenceField
+
+        for path in paths:
+            if isinstance(path, (BaseField,)):
+                path = path.name
+
+            name, db_parts, field, is_list = self._get_reference_path(path)
+
+            if isinstance(field, (CachedReferenceField,)):
+                raise ValueError(
+                    "Invalid reference path '%s': cached references are already loaded with the document." % path
+                )
+
+            reference_alias = field.reference_type.__alias__
+            if reference_alias is not None and reference_alias != self.__klass__.__alias__:
+                raise ValueError(
+                    "Invalid reference path '%s': '%s' is stored in a different database."
+                    % (path, field.reference_type.__name__)
+                )
+
+            self._select_related.append((name, db_parts, field, is_list))
+
+        return self
+
+    def _get_reference_path(self, path):
+        """Resolve a path that ends in a reference field.
+
+        :param path: `__` or `.` separated field names, ex.: `comments__author`
+        :returns: tuple of the field name path (as used in projections), the list
+        of db field names leading to the reference, the reference field and
+        whether the path goes through a list.
+        """
+        names = path.replace("__", ".").split(".")
+        hop_names, db_parts, field, is_list, names = self._split_reference_hop(self.__klass__, names, path)
+
+        if names:
+            raise ValueError(
+                "Invalid reference path '%s': '%s' is a reference field and must end the path." % (path, hop_names[-1])
+            )
+
+        return ".".join(hop_names), db_parts, field, is_list
+
+    def _split_reference_hop(self, document_type, names, path):
+        """Consume field names of `document_type` up to the first reference field.
+
+        :param document_type: class of the document where `names` start
+        :param names: list of field names, ex.: `["comments", "author", "company"]`
+        :param path: the full path, used in error messages
+        :returns: tuple of the consumed field names, their db field names, the
+        reference field, whether a list was traversed and the remaining names.
+        """
+        from jetengine.fields.embedded_document_field import EmbeddedDocumentField
+        from jetengine.fields.list_field import ListField
+        from jetengine.fields.reference_field import ReferenceField
+
+        db_parts = []
+        is_list = False
+        obj = document_type
+
+        for index, name in enumerate(names):
+            if obj is None or name not in obj._fields:
+                raise ValueError(
+                    "Invalid reference path '%s': Field not found in '%s'." % (path, document_type.__name__)
+                )
+
+            field = obj._fields[name]
+            db_parts.append(field.db_field)
+
+            if isinstance(field, ListField):
+                is_list = True
+                field = field._base_field
+
+            if isinstance(field, ReferenceField):
+                return names[: index + 1], db_parts, field, is_list, names[index + 1 :]
+
+            if isinstance(field, EmbeddedDocumentField):
+                obj = field.embedded_type
+            else:
+                obj = None
+
+        raise ValueError("Invalid reference path '%s': '%s' is not a reference field." % (path, names[-1]))
+
+    def _get_related_target(self, db_parts):
+        """Name of the field that receives the `$lookup` results for a path.
+
+        References are joined into a temporary array that is stitched back into
+        the documents after loading them, so references to documents that don't
+        exist anymore keep their ids.
+        """
+        return SELECT_RELATED_PREFIX + "_".join(db_parts)
+
+    def _get_aggregation_projection(self, projection):
+        """Translate a find projection into aggregation stages."""
+        if not projection:
+            return []
+
+        fields = {}
+        slices = {}
+        for key, value in projection.items():
+            if isinstance(value, (dict,)) and "$slice" in value:
+                arguments = value["$slice"]
+                if not isinstance(arguments, (tuple, list)):
+                    arguments = [arguments]
+                slices[key] = {"$slice": ["$%s" % key] + list(arguments)}
+            else:
+                fields[key] = value
+
+        if any(value for key, value in fields.items() if key != "_id"):
+            fields.update(slices)
+            return [{"$project": fields}]
+
+        stages = []
+        if fields:
+            stages.append({"$project": fields})
+        if slices:
+            stages.append({"$addFields": slices})
+
+        return stages
+
+    def _get_select_related_pipeline(self, query_filters, sort=None, skip=None, limit=None):
+        pipeline = []
+
+        if query_filters:
+            pipeline.append({"$match": query_filters})
+
+        if sort:
+            pipeline.append({"$sort": SON(sort)})
+
+        if skip:
+            pipeline.append({"$skip": skip})
+
+        if limit:
+            pipeline.append({"$limit": limit})
+
+        projection = self._loaded_fields.to_query(self.__klass__)
+        is_inclusion = bool(projection) and any(
+            value for key, value in projection.items() if key != "_id" and not isinstance(value, (dict,))
+        )
+
+        for name, db_parts, field, is_list in self._select_related:
+            reference_type = field.reference_type
+            local_field = ".".join(db_parts)
+            target = self._get_related_target(db_parts)
+
+            if is_inclusion and not any(local_field == key or local_field.startswith(key + ".") for key in projection):
+                # the reference is not being loaded at all
+                continue
+
+            pipeline.append(
+                {
+                    "$lookup": {
+                        "from": reference_type.__collection__,
+                        "localField": local_field,
+                        "foreignField": "_id",
+                        "as": target,
+                    }
+                }
+            )
+
+            reference_projection = None
+            if name in self._reference_loaded_fields:
+                reference_projection = reference_type.objects.fields(
+                    **self._reference_loaded_fields[name]
+                )._loaded_fields.to_query(reference_type)
+
+            if is_inclusion:
+                # the ids are loaded as stored, the referenced fields are projected in the target
+                for key in [key for key in projection if key.startswith(local_field + ".")]:
+                    projection.pop(key)
+                if not any(local_field == key or local_field.startswith(key + ".") for key in projection):
+                    projection[local_field] = QueryFieldList.ONLY
+
+                is_reference_inclusion = reference_projection and any(
+                    value for key, value in reference_projection.items() if key != "_id"
+                )
+                if is_reference_inclusion:
+                    for key, value in reference_projection.items():
+                        projection["%s.%s" % (target, key)] = value
+                    # ids are needed to stitch the references back
+                    projection["%s._id" % target] = QueryFieldList.ONLY
+                else:
+                    projection[target] = QueryFieldList.ONLY
+            elif reference_projection:
+                projection = projection or {}
+                for key, value in reference_projection.items():
+                    if key != "_id" and not value:
+                        projection["%s.%s" % (target, key)] = value
+
+        pipeline.extend(self._get_aggregation_projection(projection))
+
+        return pipeline
+
+    def _replace_references(self, son, db_parts, resolve):
+        """Replace the reference ids found at the end of `db_parts` inside `son`.
+
+        Lists found along the path are traversed, so the same path resolves
+        references in embedded documents and lists of embedded documents.
+        """
+        head, tail = db_parts[0], db_parts[1:]
+        items = son if isinstance(son, (list,)) else [son]
+
+        for item in items:
+            if not isinstance(item, (dict,)) or item.get(head) is None:
+                continue
+
+            if tail:
+                self._replace_references(item[head], tail, resolve)
+            elif isinstance(item[head], (list,)):
+                item[head] = [resolve(value) for value in item[head]]
+            else:
+                item[head] = resolve(item[head])
+
+    def _fill_select_related(self, son):
+        """Hydrate the documents joined by `select_related` in a raw result."""
+        for name, db_parts, field, is_list in self._select_related:
+            reference_type = field.reference_type
+            target = self._get_related_target(db_parts)
+            reference_fields = self._reference_loaded_fields.get(name)
+
+            def hydrate(value, reference_type=reference_type, reference_fields=reference_fields):
+                doc = reference_type.from_son(value, _is_partly_loaded=bool(reference_fields))
+                if reference_fields and reference_fields.get("_id") == QueryFieldList.EXCLUDE:
+                    doc._id = None
+                return doc
+
+            related = {}
+            for value in son.pop(target, None) or []:
+                # from_son consumes the id of the raw value
+                reference_id = value["_id"]
+                related[reference_id] = hydrate(value)
+
+            self._replace_references(son, db_parts, lambda value, related=related: related.get(value, value))
+
+        return son
+
+    async def _find_related(self, query_filters, alias=None, sort=None, skip=None, limit=None):
+        pipeline = self._get_select_related_pipeline(query_filters, sort=sort, skip=skip, limit=limit)
+        docs = await self.coll(alias).aggregate(pipeline).to_list(limit)
+
+        return [self._fill_select_related(doc) for doc in docs]
+
+    def prefetch(self, *paths, only=None):
+        """Load referenced documents in batches after loading documents.
+
+        Each path is a chain of reference hops, using `__` or `.` as separator
+        and going through embedded documents and lists, ex.: the path
+        `comments__author__company` loads the author of every comment and then
+        the company of every author. References are resolved level by level
+        with a single `$in` query per level and referenced document type, so
+        ids are deduplicated across all the loaded documents.
+
+        Usage::
+
+            posts = await Post.objects.prefetch(
+                "author", "comments__author__company",
+                only={"comments__author": ["name", "company"], "comments__author__company": ["name"]},
+            ).find_all()
+
+        :param paths: paths of reference hops to load
+        :param only: dict of the hop path (as in `paths`) to the fields to load
+        for the documents referenced by that hop. Projections set with
+        `.only("author.name")` are used for the first hop when not specified.
+        """
+        only = dict((key.replace(".", "__"), value) for key, value in (only or {}).items())
+
+        for path in paths:
+            names = path.replace("__", ".").split(".")
+            hops = self._prefetch
+            document_type = self.__klass__
+            hop_path = []
+
+            while names:
+                hop_names, db_parts, field, is_list, names = self._split_reference_hop(document_type, names, path)
+                hop_path.extend(hop_names)
+
+                key = tuple(hop_names)
+                if key not in hops:
+                    hops[key] = {
+                        "field": field,
+                        "projection": self._get_prefetch_projection(hop_path, only),
+                        "children": {},
+                    }
+
+                hops = hops[key]["children"]
+                document_type = field.reference_type
+
+        return self
+
+    def _get_prefetch_projection(self, hop_path, only):
+        name = "__".join(hop_path)
+        if name in only:
+            return dict((field_name, QueryFieldList.ONLY) for field_name in only[name])
+
+        return self._reference_loaded_fields.get(".".join(hop_path)) or None
+
+    def _get_prefetch_key(self, hop):
+        """Hops that load the same document type with the same projection share a query."""
+        return hop["field"].reference_type, repr(sorted((hop["projection"] or {}).items()))
+
+    def _replace_document_references(self, document, names, replace):
+        """Replace the references found at the end of `names` with `replace(value)`.
+
+        Embedded documents and lists found along the path are traversed.
+        """
+        name, names = names[0], names[1:]
+        documents = document if isinstance(document, (list,)) else [document]
+
+        for doc in documents:
+            if not hasattr(doc, "_values") or doc._values.get(name) is None:
+                continue
+
+            value = doc._values[name]
+            if names:
+                self._replace_document_references(value, names, replace)
+            elif isinstance(value, (list,)):
+                doc._values[name] = [replace(item) for item in value]
+            else:
+                doc._values[name] = replace(value)
+
+    async def _find_by_ids(self, document_type, ids, projection=None, alias=None):
+        queryset = document_type.objects
+        if projection:
+            queryset.fields(**projection)
+
+        cursor = queryset.coll(alias).find(
+            {"_id": {"$in": list(ids)}}, projection=queryset._loaded_fields.to_query(document_type)
+        )
+
+        result = {}
+        for son in await cursor.to_list(length=None):
+            document_id = son["_id"]
+            result[document_id] = document_type.from_son(
+                son,
+                _is_partly_loaded=bool(queryset._loaded_fields),
+                _reference_loaded_fields=queryset._reference_loaded_fields,
+            )
+
+        return result
+
+    async def _prefetch_references(self, documents, alias=None):
+        """Load the references declared with `prefetch` in `documents`, one level at a time."""
+        loaded = {}
+        level = [(documents, self._prefetch)]
+
+        while level:
+            # collect the ids of each referenced type for all the documents of this level
+            requested = {}
+            for docs, hops in level:
+                for names, hop in hops.items():
+                    reference_type = hop["field"].reference_type
+                    projection, ids = requested.setdefault(self._get_prefetch_key(hop), (hop["projection"], set()))
+
+                    def collect(value, reference_type=reference_type, ids=ids):
+                        if not isinstance(value, reference_type):
+                            ids.add(value)
+                        return value
+
+                    self._replace_document_references(docs, list(names), collect)
+
+            for key, (projection, ids) in requested.items():
+                cache = loaded.setdefault(key, {})
+                missing = ids - set(cache.keys())
+                if missing:
+                    cache.update(await self._find_by_ids(key[0], missing, projection, alias=alias))
+
+            # replace the ids and move to the documents referenced by this level
+            next_level = []
+            for docs, hops in level:
+                for names, hop in hops.items():
+                    reference_type = hop["field"].reference_type
+                    cache = loaded[self._get_prefetch_key(hop)]
+                    referenced = []
+
+                    def replace(value, reference_type=reference_type, cache=cache, referenced=referenced):
+                        if not isinstance(value, reference_type):
+                            value = cache.get(value, value)
+                        if isinstance(value, reference_type):
+                            referenced.append(value)
+                        return value
+
+                    self._replace_document_references(docs, list(names), replace)
+
+                    if hop["children"] and referenced:
+                        next_level.append((referenced, hop["children"]))
+
+            level = next_level
+
+        return documents
+
     def handle_auto_load_references(self, doc, callback):
         def handle(*args, **kw):
             if len(args) > 0:
@@ -595,7 +1847,18 @@ class QuerySet(object):
             filters = Q(**kwargs)
             filters = self.get_query_from_filters(filters)
 
-        instance = await self.coll(alias).find_one(filters, projection=self._loaded_fields.to_query(self.__klass__))
+        if self._select_related:
+            instances = await self._find_related(filters, alias=alias, limit=1)
+            instance = instances[0] if instances else None
+        else:
+            instance = await self._read_coll(alias).find_one(
+                filters, projection=self._loaded_fields.to_query(self.__klass__)
+            )
+
+        return await self._load_document(instance)
+
+    async def _load_document(self, instance):
+        """Creates a document from a single result, loading its references as configured."""
         if instance is None:
             return None
         else:
@@ -607,12 +1870,112 @@ class QuerySet(object):
                 # set projections for references (if any)
                 _reference_loaded_fields=self._reference_loaded_fields,
             )
+
+            if self._prefetch:
+                await self._prefetch_references([doc], alias=alias)
+
             if self.is_lazy:
                 return doc
             else:
                 await doc.load_references()
                 return doc
 
+    def _get_sort(self, sort=None):
+        """Returns the sort specification for single document operations.
+
+        :param sort: a field name, or a list of field names or `(field name, direction)` tuples.
+        If not specified the fields passed to `order_by` are used.
+        """
+        if sort is None:
+            return self._order_fields or None
+
+        if isinstance(sort, (str,)) or not isinstance(sort, (tuple, list)):
+            sort = [sort]
+        elif len(sort) == 2 and sort[1] in (ASCENDING, DESCENDING):
+            sort = [tuple(sort)]
+
+        queryset = self.__klass__.objects
+        for item in sort:
+            if isinstance(item, (tuple, list)):
+                queryset.order_by(*item)
+            else:
+                queryset.order_by(item)
+
+        return queryset._order_fields
+
+    async def modify(self, definition=None, new=True, upsert=False, sort=None, projection=None, alias=None, **kwargs):
+        """
+        Atomically updates the first document that matches the specified filters (if any) and returns it.
+
+        Usage::
+
+            job = await Job.objects.filter(status="pending").modify(
+                set__status="running", inc__attempts=1, sort="created_at"
+            )
+
+        The update is specified in the same way as in `update` (and doesn't update cached references either).
+        Fields loaded are controlled with `only()`, `exclude()` and `fields()` or with the `projection` argument.
+
+        :param definition: dict of fields (or field names) to the values that will be set
+        :param new: returns the document after the update is applied when `True`, before it otherwise
+        :param upsert: inserts a new document if no document matches the filters
+        :param sort: field name, or list of field names or `(field name, direction)` tuples, that decides which
+        document is updated when many match. Defaults to the fields passed to `order_by`.
+        :param projection: names of the fields to load, the same as calling `only()` with them
+        :returns: the document or `None` if no document matched the filters
+        """
+        from pymongo import ReturnDocument
+
+        update_document = self.get_update_document(definition, **kwargs)
+
+        if projection:
+            self.only(*projection)
+
+        arguments = dict(
+            projection=self._loaded_fields.to_query(self.__klass__),
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER if new else ReturnDocument.BEFORE,
+        )
+
+        sort = self._get_sort(sort)
+        if sort:
+            arguments["sort"] = sort
+
+        try:
+            instance = await self.coll(alias).find_one_and_update(
+                self.get_query_from_filters(self._filters), update_document, **arguments
+            )
+        except DuplicateKeyError as e:
+            raise UniqueKeyViolationError.from_pymongo(str(e), self.__klass__)
+
+        return await self._load_document(instance)
+
+    async def find_one_and_delete(self, sort=None, projection=None, alias=None):
+        """
+        Atomically removes the first document that matches the specified filters (if any) and returns it.
+
+        Usage::
+
+            item = await QueueItem.objects.filter(queue="emails").find_one_and_delete(sort="created_at")
+
+        :param sort: field name, or list of field names or `(field name, direction)` tuples, that decides which
+        document is removed when many match. Defaults to the fields passed to `order_by`.
+        :param projection: names of the fields to load, the same as calling `only()` with them
+        :returns: the removed document or `None` if no document matched the filters
+        """
+        if projection:
+            self.only(*projection)
+
+        arguments = dict(projection=self._loaded_fields.to_query(self.__klass__))
+
+        sort = self._get_sort(sort)
+        if sort:
+            arguments["sort"] = sort
+
+        instance = await self.coll(alias).find_one_and_delete(self.get_query_from_filters(self._filters), **arguments)
+
+        return await self._load_document(instance)
+
     def get_query_from_filters(self, filters):
         if not filters:
             return {}
@@ -620,7 +1983,7 @@ class QuerySet(object):
         query = filters.to_query(self.__klass__)
         return query
 
-    def _get_find_cursor(self, alias):
+    def _get_find_arguments(self):
         find_arguments = {}
 
         if self._order_fields:
@@ -632,10 +1995,13 @@ class QuerySet(object):
         if self._skip:
             find_arguments["skip"] = self._skip
 
+        return find_arguments
+
+    def _get_find_cursor(self, alias):
         query_filters = self.get_query_from_filters(self._filters)
 
-        return self.coll(alias).find(
-            query_filters, projection=self._loaded_fields.to_query(self.__klass__), **find_arguments
+        return self._read_coll(alias).find(
+            query_filters, projection=self._loaded_fields.to_query(self.__klass__), **self._get_find_arguments()
         )
 
     def filter(self, *arguments, **kwargs):
@@ -794,7 +2160,7 @@ class QuerySet(object):
 
         return handle
 
-    async def find_all(self, lazy=None, alias=None):
+    async def find_all(self, lazy=None, alias=None, decode_in=None, workers=None):
         """
         Returns a list of items in the current queryset collection that match specified filters (if any).
 
@@ -805,18 +2171,50 @@ class QuerySet(object):
             result = await User.objects.find_all()
             # do something with result
             # users is None if no users found
+
+        Large results can be decoded outside the event loop thread with `decode_in="thread"` or
+        `decode_in="process"`: the results are fetched as raw BSON documents and each batch is decoded and converted
+        to documents by a pool of `workers` threads or processes (see `jetengine.decoding`). Documents decoded by
+        workers are always fully decoded, even when the queryset decodes documents lazily::
+
+            events = await Event.objects.limit(100000).find_all(decode_in="process", workers=4)
         """
+        if decode_in is not None:
+            result = await self._find_in_executor(get_executor(decode_in, workers), alias=alias)
+        else:
+            result = await self._find_documents(alias=alias)
+
+        if self._prefetch:
+            await self._prefetch_references(result, alias=alias)
+
+        for obj in result:
+            if (lazy is not None and not lazy) or not obj.is_lazy:
+                await obj.load_references(obj._fields)
+
+        return result
+
+    async def _find_documents(self, alias=None):
         to_list_arguments = {}
         if self._limit is not None:
             to_list_arguments["length"] = self._limit
         else:
             to_list_arguments["length"] = DEFAULT_LIMIT
 
-        cursor = self._get_find_cursor(alias=alias)
+        if self._select_related:
+            docs = await self._find_related(
+                self.get_query_from_filters(self._filters),
+                alias=alias,
+                sort=self._order_fields,
+                skip=self._skip,
+                limit=to_list_arguments["length"],
+            )
+            self._filters = {}
+        else:
+            cursor = self._get_find_cursor(alias=alias)
 
-        self._filters = {}
+            self._filters = {}
 
-        docs = await cursor.to_list(**to_list_arguments)
+            docs = await cursor.to_list(**to_list_arguments)
 
         # if _loaded_fields is not empty then documents are partly loaded
         is_partly_loaded = bool(self._loaded_fields)
@@ -830,13 +2228,51 @@ class QuerySet(object):
                 _is_partly_loaded=is_partly_loaded,
             )
 
-            if (lazy is not None and not lazy) or not obj.is_lazy:
-                await obj.load_references(obj._fields)
-
             result.append(obj)
 
         return result
 
+    async def _find_in_executor(self, executor, alias=None):
+        if self._select_related:
+            raise ValueError("Results of queries with select_related can't be decoded in workers.")
+
+        find_arguments = self._get_find_arguments()
+        find_arguments["limit"] = self._limit if self._limit is not None else DEFAULT_LIMIT
+
+        # documents are fetched as `RawBSONDocument` instances and decoded by the workers with the codec options of
+        # the collection (not the raw ones used by lazy querysets), so workers return fully decoded documents
+        coll = self.coll(alias)
+        cursor = coll.with_options(codec_options=get_raw_codec_options(coll.codec_options)).find(
+            self.get_query_from_filters(self._filters),
+            projection=self._loaded_fields.to_query(self.__klass__),
+            batch_size=DECODE_BATCH_SIZE,
+            **find_arguments
+        )
+        self._filters = {}
+
+        # each batch is decoded while the next ones are fetched
+        loop = asyncio.get_event_loop()
+        batches = []
+        while True:
+            docs = await cursor.to_list(length=DECODE_BATCH_SIZE)
+            if not docs:
+                break
+
+            data = b"".join(doc.raw for doc in docs)
+            batches.append(
+                loop.run_in_executor(
+                    executor,
+                    decode_batch,
+                    self.__klass__,
+                    data,
+                    coll.codec_options,
+                    bool(self._loaded_fields),
+                    self._reference_loaded_fields,
+                )
+            )
+
+        return list(itertools.chain.from_iterable(await asyncio.gather(*batches)))
+
     def handle_count(self, callback):
         def handle(*arguments, **kwargs):
             if arguments and len(arguments) > 1 and arguments[1]:
@@ -853,6 +2289,80 @@ class QuerySet(object):
         self._filters = {}
         return await cursor.count()
 
+    async def to_columns(self, *fields, batch_size=10000, alias=None):
+        """
+        Returns a dict with the values of the specified fields (all fields by default) of the documents that match
+        the filters (if any) in columns, without creating documents.
+
+        Usage::
+
+            columns = await Sale.objects.filter(year=2018).to_columns("price", "quantity")
+            revenue = (columns["price"] * columns["quantity"]).sum()
+
+        Only the specified fields are read, in batches of `batch_size` documents, and their values are appended to
+        column buffers typed after the field types (see `jetengine.columns`): NumPy arrays when NumPy is installed
+        and `array.array` instances or lists otherwise. `_id` can be specified to get the ids of the documents.
+        """
+        from jetengine.columns import get_column
+        from jetengine.fields.base_field import BaseField
+
+        if batch_size < 1:
+            raise ValueError("The batch_size must be at least 1.")
+
+        if not fields:
+            fields = list(self.__klass__._fields.keys())
+
+        columns = {}
+        appends = []
+        projection = {"_id": False}
+        for field in fields:
+            if isinstance(field, (BaseField,)):
+                field = field.name
+
+            if field in columns:
+                continue
+
+            if field == "_id":
+                document_field = BaseField(db_field="_id")
+            else:
+                document_field = self.__klass__._fields.get(field)
+
+            if document_field is None:
+                raise ValueError("Invalid field '%s': field not found in '%s'." % (field, self.__klass__.__name__))
+
+            columns[field] = get_column(document_field)
+            appends.append((document_field.db_field, columns[field].append))
+            projection[document_field.db_field] = True
+
+        cursor = self.coll(alias).find(
+            self.get_query_from_filters(self._filters), projection=projection, **self._get_find_arguments()
+        )
+        cursor.batch_size(batch_size)
+        self._filters = {}
+
+        while True:
+            batch = await cursor.to_list(length=batch_size)
+            if not batch:
+                break
+
+            for son in batch:
+                for db_field, append in appends:
+                    append(son.get(db_field))
+
+        return dict((field, column.to_array()) for field, column in columns.items())
+
+    async def to_dataframe(self, *fields, batch_size=10000, alias=None):
+        """
+        Returns a pandas `DataFrame` with the columns returned by `to_columns`. Requires pandas.
+
+        Usage::
+
+            sales = await Sale.objects.filter(year=2018).to_dataframe("price", "quantity", "sold_at")
+        """
+        from jetengine.columns import to_dataframe
+
+        return to_dataframe(await self.to_columns(*fields, batch_size=batch_size, alias=alias))
+
     @property
     def aggregate(self):
         return Aggregation(self)
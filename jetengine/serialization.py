@@ -0,0 +1,135 @@
+from jetengine.fields.base_field import BaseField
+from jetengine.type_codecs import get_decoded_type
+
+MISSING = object()
+
+
+def is_identity(field, method_name):
+    """
+    Indicates whether `method_name` of the field returns its argument unchanged (it's not overridden, or the field
+    lists it in `identity_methods` because it doesn't convert values with its current arguments).
+    """
+    if method_name in getattr(field, "identity_methods", ()):
+        return True
+
+    return getattr(type(field), method_name) is getattr(BaseField, method_name)
+
+
+def is_compressed_field(field):
+    """Compressed fields get the stored value in `to_son`, so values that were never decompressed are kept."""
+    return getattr(field, "compress", None) is not None
+
+
+def compile_to_son(document_type):
+    """
+    Generates a function that serializes instances of `document_type` like `BaseDocument.to_son` does, but with
+    the fields unrolled and without calling the conversion methods that don't change the values.
+    """
+    namespace = {}
+    lines = ["def to_son(document):", "    values = document._values", "    data = {}"]
+
+    for index, (name, field) in enumerate(document_type._fields.items()):
+        value = "values.get(%r)" % name
+        if not is_identity(field, "get_value") and not is_compressed_field(field):
+            namespace["get_value_%d" % index] = field.get_value
+            value = "get_value_%d(%s)" % (index, value)
+
+        converted = "value"
+        if not is_identity(field, "to_son"):
+            namespace["to_son_%d" % index] = field.to_son
+            converted = "to_son_%d(value)" % index
+
+        lines.append("    value = %s" % value)
+        if field.sparse:
+            lines.append("    if value is not None:")
+            lines.append("        data[%r] = %s" % (field.db_field, converted))
+        else:
+            lines.append("    data[%r] = %s" % (field.db_field, converted))
+
+    lines.append("    return data")
+
+    exec("\n".join(lines), namespace)
+    return namespace["to_son"]
+
+
+def compile_from_son(document_type):
+    """
+    Generates a function that creates instances of `document_type` from the values returned by motor like
+    `BaseDocument.from_son` does, looking up each declared field directly instead of searching for the field
+    of every key. Keys that don't belong to a declared field are handled by `get_field_by_db_name`, and values
+    already converted by the type codecs of the collection (checked by type) are used as they are.
+    """
+    namespace = {"MISSING": MISSING}
+    db_fields = set()
+    lines = [
+        "def from_son(cls, dic, _is_partly_loaded=False, _reference_loaded_fields=None):",
+        "    field_values = {}",
+        "    _object_id = dic.pop('_id', None)",
+        "    found = 0",
+    ]
+
+    for index, (name, field) in enumerate(document_type._fields.items()):
+        if field.db_field in db_fields:
+            continue
+        db_fields.add(field.db_field)
+
+        converted = "value"
+        if not is_identity(field, "from_son"):
+            namespace["from_son_%d" % index] = field.from_son
+            converted = "from_son_%d(value)" % index
+
+            decoded_type = get_decoded_type(field)
+            if decoded_type is not None:
+                namespace["decoded_type_%d" % index] = decoded_type
+                converted = "value if type(value) is decoded_type_%d else %s" % (index, converted)
+
+        lines.append("    value = dic.get(%r, MISSING)" % field.db_field)
+        lines.append("    if value is not MISSING:")
+        lines.append("        found += 1")
+        lines.append("        field_values[%r] = %s" % (field.name, converted))
+
+    namespace["DB_FIELDS"] = frozenset(db_fields)
+    lines.extend(
+        [
+            "    if found < len(dic):",
+            "        for name, value in dic.items():",
+            "            if name in DB_FIELDS:",
+            "                continue",
+            "            field = cls.get_field_by_db_name(name)",
+            "            if field:",
+            "                field_values[field.name] = field.from_son(value)",
+            "            else:",
+            "                field_values[name] = value",
+            "    return cls.hydrate(field_values, _id=_object_id, _is_partly_loaded=_is_partly_loaded,"
+            " _reference_loaded_fields=_reference_loaded_fields)",
+        ]
+    )
+
+    exec("\n".join(lines), namespace)
+    return namespace["from_son"]
+
+
+def compile_serializers(document_type):
+    """Compiles the serializers of `document_type` for its current fields."""
+    document_type._compiled_serializers = (
+        len(document_type._fields),
+        compile_to_son(document_type),
+        compile_from_son(document_type),
+    )
+
+    return document_type._compiled_serializers
+
+
+def get_serializers(document_type):
+    """
+    Returns the `to_son` and `from_son` functions compiled for `document_type`.
+
+    Dynamic fields are added to the fields of the class when they are first set, so the functions are compiled
+    again whenever the number of fields changes.
+    """
+    compiled = document_type.__dict__.get("_compiled_serializers")
+
+    if compiled is None or compiled[0] != len(document_type._fields):
+        compiled = compile_serializers(document_type)
+
+    return compiled[1], compiled[2]
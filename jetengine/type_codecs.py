@@ -0,0 +1,98 @@
+"""
+BSON type codecs applied to the collections of the documents that need them, so conversions that don't depend
+on the field are done by the driver while decoding BSON instead of by the `from_son` method of each field.
+
+Fields declare the BSON type they can be decoded from in `bson_type`. The collection returned by `QuerySet.coll`
+decodes values with the codecs of the fields of its document, including the fields of the embedded and referenced
+documents that can be loaded with it (references are loaded in the same query with `select_related`).
+
+Codecs are applied to every value of their BSON type in the collection (including values in dict, json and dynamic
+fields of the same documents), so only lossless conversions are registered. Collections of documents without such
+fields decode values as the driver usually does.
+
+The compiled `from_son` of the documents only skips the `from_son` of those fields for values of the type returned
+by the codec, so documents can still be created from values decoded without the codecs.
+"""
+
+from decimal import Decimal
+
+from bson.codec_options import TypeCodec, TypeRegistry
+from bson.decimal128 import Decimal128
+
+
+class DecimalCodec(TypeCodec):
+    python_type = Decimal
+    bson_type = Decimal128
+
+    def transform_python(self, value):
+        return Decimal128(value)
+
+    def transform_bson(self, value):
+        return value.to_decimal()
+
+
+CODECS = {Decimal128: DecimalCodec}
+
+_type_registries = {}
+_document_registries = {}
+
+
+def get_bson_types(document_type, bson_types=None, seen=None):
+    """Returns the BSON types decoded by the fields of `document_type` and of its embedded and referenced documents."""
+    from jetengine.fields.embedded_document_field import EmbeddedDocumentField
+    from jetengine.fields.list_field import ListField
+    from jetengine.fields.reference_field import ReferenceField
+
+    if bson_types is None:
+        bson_types = set()
+        seen = set()
+
+    if document_type in seen:
+        return bson_types
+
+    seen.add(document_type)
+
+    for field in document_type._fields.values():
+        while isinstance(field, (ListField,)):
+            field = field._base_field
+
+        if getattr(field, "bson_type", None) in CODECS:
+            bson_types.add(field.bson_type)
+
+        if isinstance(field, (EmbeddedDocumentField,)):
+            get_bson_types(field.embedded_type, bson_types, seen)
+        elif isinstance(field, (ReferenceField,)):
+            get_bson_types(field.reference_type, bson_types, seen)
+
+    return bson_types
+
+
+def get_type_registry(document_type):
+    """
+    Returns the type registry with the codecs required by `document_type` (or `None` when it requires none).
+
+    Registries are computed the first time the collection of a document is used, when the document types of
+    embedded and reference fields declared by name can be resolved.
+    """
+    if document_type not in _document_registries:
+        bson_types = frozenset(get_bson_types(document_type))
+
+        if bson_types and bson_types not in _type_registries:
+            _type_registries[bson_types] = TypeRegistry(
+                [CODECS[bson_type]() for bson_type in sorted(bson_types, key=str)]
+            )
+
+        _document_registries[document_type] = _type_registries.get(bson_types)
+
+    return _document_registries[document_type]
+
+
+def is_decoded_by_driver(field):
+    """Indicates whether values of the field are already converted by the driver when they are loaded."""
+    return getattr(field, "bson_type", None) in CODECS
+
+
+def get_decoded_type(field):
+    """Returns the type of the values of the field converted by the driver (`None` if they are not converted)."""
+    codec = CODECS.get(getattr(field, "bson_type", None))
+    return None if codec is None else codec.python_type
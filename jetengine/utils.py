@@ -1,7 +1,35 @@
 import sys
 
+# json serializers tried (in order) when jetengine is imported, orjson is opt-in (see `use_json_serializer`)
+JSON_SERIALIZERS = ("ujson", "json")
 
-try:
+
+def load_orjson():
+    import orjson
+    from bson import json_util
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+    def serialize(value):
+        return orjson.dumps(value, default=json_util.default, option=options).decode("utf-8")
+
+    def restore(value):
+        # applies `json_util.object_hook` from the innermost objects out, like `json.loads` does
+        if isinstance(value, dict):
+            return json_util.object_hook(dict((key, restore(item)) for key, item in value.items()))
+
+        if isinstance(value, list):
+            return [restore(item) for item in value]
+
+        return value
+
+    def deserialize(value):
+        return restore(orjson.loads(value))
+
+    return serialize, deserialize
+
+
+def load_ujson():
     from ujson import loads, dumps
 
     def serialize(value):
@@ -10,8 +38,10 @@ try:
     def deserialize(value):
         return loads(value)
 
+    return serialize, deserialize
+
 
-except ImportError:
+def load_json():
     from json import loads, dumps
     from bson import json_util
 
@@ -21,6 +51,52 @@ except ImportError:
     def deserialize(value):
         return loads(value, object_hook=json_util.object_hook)
 
+    return serialize, deserialize
+
+
+_json_loaders = {"orjson": load_orjson, "ujson": load_ujson, "json": load_json}
+
+
+def register_json_serializer(name, serialize, deserialize):
+    """
+    Registers a json serializer that can be selected with `use_json_serializer`. `serialize` must return a
+    string and `deserialize` must accept one.
+    """
+    _json_loaders[name] = lambda: (serialize, deserialize)
+
+
+def use_json_serializer(*names):
+    """
+    Uses the first available json serializer among `names` to store `JsonField` values and returns its name.
+
+    Usage::
+
+        from jetengine.utils import use_json_serializer
+
+        use_json_serializer("orjson", "json")
+
+    orjson is the fastest but isn't used by default: values with extended json types (dates, ids, etc.) are
+    stored like the json module stores them, except for UUIDs, which orjson always stores as plain strings.
+    """
+    global serialize, deserialize, json_serializer
+
+    for name in names:
+        if name not in _json_loaders:
+            raise ValueError("Unknown json serializer '%s'." % name)
+
+        try:
+            serialize, deserialize = _json_loaders[name]()
+        except ImportError:
+            continue
+
+        json_serializer = name
+        return name
+
+    raise ImportError("None of the json serializers %s is available." % ", ".join(names))
+
+
+use_json_serializer(*JSON_SERIALIZERS)
+
 
 def get_class(module_name, klass=None):
     if "." not in module_name and klass is None:
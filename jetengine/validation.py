@@ -0,0 +1,97 @@
+from jetengine.errors import InvalidDocumentError
+from jetengine.fields.base_field import BaseField
+from jetengine.fields.dict_field import DictField
+from jetengine.fields.embedded_document_field import EmbeddedDocumentField
+from jetengine.fields.json_field import JsonField
+from jetengine.fields.list_field import ListField
+from jetengine.compression import is_untouched
+from jetengine.lazy import LazyValues
+from jetengine.serialization import is_compressed_field
+
+# values of these fields can change without being assigned again, so they are validated even when unchanged
+MUTABLE_FIELD_TYPES = (EmbeddedDocumentField, DictField, JsonField, ListField)
+
+EMPTY = frozenset()
+
+
+def is_tracked_list_field(field):
+    """Lists of values that can't be changed in place are tracked by `TrackedList` when loaded from the database."""
+    return isinstance(field, (ListField,)) and not isinstance(field._base_field, MUTABLE_FIELD_TYPES)
+
+
+def compile_validator(document_type):
+    """
+    Generates a function that validates instances of `document_type` like `BaseDocument.validate_fields` used to,
+    checking only the fields that may have changed since the document was loaded or saved:
+
+    * fields without `required` and without their own `validate` method are never checked;
+    * fields with immutable values are checked only when they were assigned (or the document is new);
+    * lists of immutable values loaded from the database are checked only when they were modified;
+    * embedded documents, dicts and other lists are always checked (embedded documents check their own changes);
+    * compressed values that were never decompressed are not checked.
+    """
+    namespace = {
+        "InvalidDocumentError": InvalidDocumentError,
+        "LazyValues": LazyValues,
+        "EMPTY": EMPTY,
+        "is_untouched": is_untouched,
+    }
+    lines = [
+        "def validate_fields(document):",
+        "    values = document._values",
+        "    changed = document._changed_fields",
+        "    pending = values.pending if type(values) is LazyValues else EMPTY",
+    ]
+
+    for index, (name, field) in enumerate(document_type._fields.items()):
+        has_validate = getattr(type(field), "validate") is not BaseField.validate
+        if not field.required and not has_validate:
+            continue
+
+        # fields that were not accessed in lazily decoded documents are still the ones loaded from the database
+        condition = "%r not in pending" % name
+
+        if is_tracked_list_field(field):
+            condition += " and (changed is None or %r in changed or getattr(values.get(%r), '_dirty', True))" % (
+                name,
+                name,
+            )
+        elif not isinstance(field, MUTABLE_FIELD_TYPES):
+            condition += " and (changed is None or %r in changed)" % name
+
+        # compressed values that were never decompressed are the ones loaded from the database
+        if is_compressed_field(field):
+            condition += " and not is_untouched(values.get(%r))" % name
+
+        namespace["get_value_%d" % index] = field.get_value
+        lines.append("    if %s:" % condition)
+        lines.append("        value = get_value_%d(values.get(%r))" % (index, name))
+
+        if field.required:
+            namespace["is_empty_%d" % index] = field.is_empty
+            lines.append("        if is_empty_%d(value):" % index)
+            lines.append("            raise InvalidDocumentError(%r)" % ("Field '%s' is required." % name))
+
+        if has_validate:
+            namespace["validate_%d" % index] = field.validate
+            lines.append("        if not validate_%d(value):" % index)
+            lines.append("            raise InvalidDocumentError(%r)" % ("Field '%s' must be valid." % name))
+
+    lines.append("    return True")
+
+    exec("\n".join(lines), namespace)
+    return namespace["validate_fields"]
+
+
+def get_validator(document_type):
+    """
+    Returns the validation function compiled for `document_type`, compiling it again when dynamic fields
+    were added to the class.
+    """
+    compiled = document_type.__dict__.get("_compiled_validator")
+
+    if compiled is None or compiled[0] != len(document_type._fields):
+        compiled = (len(document_type._fields), compile_validator(document_type))
+        document_type._compiled_validator = compiled
+
+    return compiled[1]
@@ -0,0 +1,154 @@
+import asyncio
+from contextvars import ContextVar
+
+from pymongo import InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, WriteError
+
+from jetengine.errors import UniqueKeyViolationError
+
+DUPLICATE_KEY_ERROR_CODES = (11000, 11001)
+
+# write buffers active in the current context, by document type
+_write_buffers = ContextVar("write_buffers", default={})
+
+
+def get_write_buffer(document_type):
+    """Returns the write buffer active for the specified document type in the current context (if any)."""
+    return _write_buffers.get().get(document_type)
+
+
+class WriteBuffer(object):
+    """
+    Write-behind buffer that coalesces individual saves of a document type into batched writes.
+
+    Usage::
+
+        async with Event.objects.buffered(max_batch=500, max_delay_ms=20):
+            await asyncio.gather(*[Event(name="click").save() for i in range(1000)])
+
+    While the buffer is active every `save()` and `create()` of the document type made inside the block
+    (including the ones made by tasks created inside it, which inherit its context) is queued and the
+    pending writes are flushed with a single `insert_many` (or `bulk_write` when there are updates)
+    as soon as `max_batch` writes are queued or `max_delay_ms` milliseconds have passed since the first
+    one. Each caller still awaits its own write: it gets the document with its `_id` or the error of its
+    own write. Pending writes are flushed when leaving the `async with` block.
+
+    Saves made by other tasks are not buffered, and buffers nested in the same task are restored in order.
+    """
+
+    def __init__(self, queryset, max_batch=500, max_delay_ms=20, alias=None, write_concern=None):
+        if max_batch < 1:
+            raise ValueError("The write buffer max_batch must be at least 1.")
+
+        self.queryset = queryset
+        self.document_type = queryset.__klass__
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000.0
+        self.alias = alias
+        self.write_concern = write_concern
+
+        self._pending = []
+        self._timer = None
+        self._flushes = set()
+        self._token = None
+        self._loop = None
+
+    async def __aenter__(self):
+        self._loop = asyncio.get_event_loop()
+
+        write_buffers = dict(_write_buffers.get())
+        write_buffers[self.document_type] = self
+        self._token = _write_buffers.set(write_buffers)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        _write_buffers.reset(self._token)
+        self._token = None
+
+        await self.flush()
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def accepts(self, alias=None, write_concern=None):
+        """Writes with a different alias or write concern than the buffer's are not buffered."""
+        return write_concern is None and (alias is None or alias == self.alias)
+
+    def add(self, document, upsert=False):
+        """Queues the write of the specified document and returns a future resolved with its `_id`."""
+        doc = document.to_son()
+
+        if document._id is None or document._id_preallocated:
+            doc["_id"] = self.queryset._allocate_id(document)
+            operation = InsertOne(doc)
+        else:
+            doc["_id"] = document._id
+            operation = ReplaceOne({"_id": document._id}, doc, upsert=upsert)
+
+        future = self._loop.create_future()
+        self._pending.append((doc, operation, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self.max_delay, self._schedule_flush)
+
+        return future
+
+    def _schedule_flush(self):
+        task = asyncio.ensure_future(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self):
+        """Writes all pending documents in one round trip."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        operations = [operation for _, operation, _ in pending]
+        coll = self.queryset.coll(self.alias, self.write_concern)
+
+        try:
+            if all(isinstance(operation, InsertOne) for operation in operations):
+                await coll.insert_many([doc for doc, _, _ in pending], ordered=False)
+            else:
+                await coll.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            errors = dict((error["index"], error) for error in e.details.get("writeErrors", []))
+
+            for index, (doc, _, future) in enumerate(pending):
+                if index in errors:
+                    self._set_exception(future, self._get_write_error(errors[index]))
+                else:
+                    self._set_result(future, doc["_id"])
+            return
+        except Exception as e:
+            for _, _, future in pending:
+                self._set_exception(future, e)
+            return
+
+        for doc, _, future in pending:
+            self._set_result(future, doc["_id"])
+
+    def _get_write_error(self, error):
+        if error.get("code") in DUPLICATE_KEY_ERROR_CODES:
+            unique_error = UniqueKeyViolationError.from_pymongo(error["errmsg"], self.document_type)
+            if unique_error is not None:
+                return unique_error
+
+            return DuplicateKeyError(error["errmsg"], error.get("code"), error)
+
+        return WriteError(error.get("errmsg"), error.get("code"), error)
+
+    def _set_result(self, future, value):
+        if not future.done():
+            future.set_result(value)
+
+    def _set_exception(self, future, exception):
+        if not future.done():
+            future.set_exception(exception)
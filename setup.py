@@ -14,7 +14,7 @@ setup(
     author_email="inbox@philonas.net",
     license="BSD",
     packages=find_packages(exclude=["tests"]),
-    install_requires=["easydict", "pymongo==3.6", "motor==1.3.1"],
+    install_requires=["easydict", "pymongo==3.8", "motor==1.3.1", 'contextvars; python_version < "3.7"'],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -0,0 +1,147 @@
+import asyncio
+
+from preggy import expect
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, ListField, CachedReferenceField
+from jetengine.query_builder.transform import transform_query
+from tests import AsyncTestCase, async_test
+
+
+class User(Document):
+    __collection__ = "CachedReferenceUser"
+
+    name = StringField()
+    avatar = StringField(db_field="picture")
+    bio = StringField()
+
+
+class Post(Document):
+    __collection__ = "CachedReferencePost"
+
+    title = StringField()
+    author = CachedReferenceField(User, fields=["name", "avatar"])
+    editors = ListField(CachedReferenceField(User, fields=["name"]))
+
+
+class TestCachedReferenceField(AsyncTestCase):
+    def setUp(self):
+        super(TestCachedReferenceField, self).setUp()
+        self.drop_coll(User.__collection__)
+        self.drop_coll(Post.__collection__)
+
+    def test_to_son(self):
+        field = CachedReferenceField(User, fields=["name", "avatar"])
+
+        user = User(name="Bernardo", avatar="avatar.png", bio="bio")
+        user._id = ObjectId("123456789012123456789012")
+
+        expect(field.to_son(user)).to_equal({"_id": user._id, "name": "Bernardo", "picture": "avatar.png"})
+        expect(field.to_son(user._id)).to_equal({"_id": user._id})
+        expect(field.to_son(None)).to_be_null()
+
+    def test_from_son(self):
+        field = CachedReferenceField(User, fields=["name", "avatar"])
+
+        result = field.from_son({"_id": ObjectId("123456789012123456789012"), "name": "Bernardo", "picture": "a.png"})
+
+        expect(result).to_be_instance_of(User)
+        expect(result._id).to_equal(ObjectId("123456789012123456789012"))
+        expect(result.name).to_equal("Bernardo")
+        expect(result.avatar).to_equal("a.png")
+        expect(result.bio).to_be_null()
+        expect(result.is_partly_loaded).to_be_true()
+
+    def test_queries_by_id(self):
+        user_id = ObjectId("123456789012123456789012")
+
+        expect(transform_query(Post, author=user_id)).to_equal({"author._id": user_id})
+
+    def test_in_queries_by_id(self):
+        user = User(name="Bernardo")
+        user._id = ObjectId("123456789012123456789012")
+        other_id = ObjectId("123456789012123456789013")
+
+        expect(transform_query(Post, author__in=[user, other_id])).to_equal(
+            {"author._id": {"$in": [user._id, other_id]}}
+        )
+        expect(transform_query(Post, editors__in=[user])).to_equal({"editors._id": {"$in": [user._id]}})
+
+    def test_list_items_are_queried_by_id(self):
+        user = User(name="Bernardo")
+        user._id = ObjectId("123456789012123456789012")
+        other_id = ObjectId("123456789012123456789013")
+
+        expect(transform_query(Post, editors=user)).to_equal({"editors._id": user._id})
+        expect(transform_query(Post, editors=[user, other_id])).to_equal(
+            {"editors._id": {"$all": [user._id, other_id]}}
+        )
+
+    def test_only_changes_of_cached_fields_outdate_cached_references(self):
+        user = User.from_son({"_id": ObjectId(), "name": "Bernardo", "picture": "avatar.png", "bio": "bio"})
+
+        user.bio = "other bio"
+        expect(Post.objects._get_outdated_cached_references(user)).to_be_empty()
+
+        user.avatar = "other.png"
+        expect(Post.objects._get_outdated_cached_references(user)).to_equal([(Post, Post.author)])
+
+        user.name = "Heynemann"
+        expect(Post.objects._get_outdated_cached_references(user)).to_equal([(Post, Post.author), (Post, Post.editors)])
+
+        user.clear_changed_fields()
+        expect(Post.objects._get_outdated_cached_references(user)).to_be_empty()
+
+    @async_test
+    @asyncio.coroutine
+    def test_reads_cached_fields_without_loading_references(self):
+        user = yield from User.objects.create(name="Bernardo", avatar="avatar.png", bio="bio")
+        post = yield from Post.objects.create(title="post", author=user, editors=[user])
+
+        result = yield from Post.objects.get(post._id)
+
+        expect(result.author.name).to_equal("Bernardo")
+        expect(result.author.avatar).to_equal("avatar.png")
+        expect(result.author.bio).to_be_null()
+        expect(result.editors[0].name).to_equal("Bernardo")
+
+    @async_test
+    @asyncio.coroutine
+    def test_saving_referenced_document_updates_cached_fields(self):
+        user = yield from User.objects.create(name="Bernardo", avatar="avatar.png")
+        other = yield from User.objects.create(name="Someone")
+        post = yield from Post.objects.create(title="post", author=user, editors=[other, user])
+
+        user.name = "Heynemann"
+        yield from user.save()
+
+        result = yield from Post.objects.get(post._id)
+
+        expect(result.author.name).to_equal("Heynemann")
+        expect(result.author.avatar).to_equal("avatar.png")
+        expect(result.editors[0].name).to_equal("Someone")
+        expect(result.editors[1].name).to_equal("Heynemann")
+
+    @async_test
+    @asyncio.coroutine
+    def test_modifying_referenced_document_updates_cached_fields(self):
+        user = yield from User.objects.create(name="Bernardo", avatar="avatar.png")
+        post = yield from Post.objects.create(title="post", author=user, editors=[user])
+
+        yield from user.modify(set__name="Heynemann")
+
+        result = yield from Post.objects.get(post._id)
+
+        expect(result.author.name).to_equal("Heynemann")
+        expect(result.editors[0].name).to_equal("Heynemann")
+
+    @async_test
+    @asyncio.coroutine
+    def test_upserting_referenced_document_updates_cached_fields(self):
+        user = yield from User.objects.create(name="Bernardo", avatar="avatar.png")
+        post = yield from Post.objects.create(title="post", author=user)
+
+        yield from User(name="Bernardo", avatar="other.png").upsert_by("name")
+
+        result = yield from Post.objects.get(post._id)
+        expect(result.author.avatar).to_equal("other.png")
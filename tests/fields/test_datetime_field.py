@@ -1,12 +1,88 @@
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from preggy import expect
 
-from jetengine import Document, DateTimeField, EmbeddedDocumentField
+from bson import BSON
+from bson.codec_options import CodecOptions
+
+import jetengine.connection
+from jetengine import connect, Document, DateTimeField, EmbeddedDocumentField
+from jetengine.serialization import is_identity
 from tests import AsyncTestCase, async_test
 
+BRASILIA = timezone(timedelta(hours=-3))
+
+
+class Event(Document):
+    __collection__ = "DateTimeFieldEvent"
+
+    starts = DateTimeField()
+    local_starts = DateTimeField(tz=BRASILIA)
+    legacy_starts = DateTimeField(parse_strings=True)
+
+
+class TestDateTimeFieldConversions(AsyncTestCase):
+    def setUp(self):
+        super(TestDateTimeFieldConversions, self).setUp(auto_connect=False)
+
+    def load(self, son, **codec_options):
+        son = BSON(BSON.encode(dict(son, _id=1))).decode(codec_options=CodecOptions(**codec_options))
+        return Event.from_son(son)
+
+    def test_values_without_timezone_are_not_converted(self):
+        expect(is_identity(Event.starts, "from_son")).to_be_true()
+        expect(is_identity(Event.local_starts, "from_son")).to_be_false()
+
+        value = datetime(2020, 1, 1, 10, 0, tzinfo=BRASILIA)
+        expect(Event.starts.to_son(value) is value).to_be_true()
+        expect(Event.starts.from_son(value) is value).to_be_true()
+
+    def test_values_decoded_in_the_field_timezone_are_not_converted(self):
+        starts = datetime(2020, 1, 1, 10, 0, tzinfo=BRASILIA)
+        event = self.load(Event(starts=starts, local_starts=starts).to_son(), tz_aware=True, tzinfo=BRASILIA)
+
+        expect(event.starts).to_equal(starts)
+        expect(event.starts.tzinfo is BRASILIA).to_be_true()
+        expect(event.local_starts.tzinfo is BRASILIA).to_be_true()
+
+        event = self.load(Event(local_starts=starts).to_son(), tz_aware=True)
+        expect(event.local_starts).to_equal(starts)
+        expect(event.local_starts.tzinfo).to_equal(BRASILIA)
+
+    def test_strings_are_only_parsed_when_asked_to(self):
+        expect(Event.starts.from_son("2020-01-01 10:00:00")).to_equal("2020-01-01 10:00:00")
+        expect(Event.legacy_starts.from_son("2020-01-01 10:00:00")).to_equal(datetime(2020, 1, 1, 10, 0))
+        expect(Event.legacy_starts.to_son("2020-01-01 10:00:00")).to_equal(datetime(2020, 1, 1, 10, 0))
+
+    def test_base_field_arguments_can_be_positional(self):
+        field = DateTimeField(False, False, None, "db_starts")
+
+        expect(field.db_field).to_equal("db_starts")
+        expect(field.parse_strings).to_be_false()
+
+    def test_auto_now_uses_the_field_timezone(self):
+        expect(Event.starts.now().tzinfo).to_be_null()
+        expect(Event.local_starts.now().tzinfo is BRASILIA).to_be_true()
+
 
 class TestDateTimeField(AsyncTestCase):
+    @async_test
+    @asyncio.coroutine
+    def test_connection_decodes_dates_in_its_timezone(self):
+        db = connect("test", alias="brasilia", host="localhost", port=27017, io_loop=self.io_loop, tzinfo=BRASILIA)
+        expect(jetengine.connection._connection_settings["brasilia"]["tz_aware"]).to_be_true()
+
+        yield from Event.objects.delete(alias="brasilia")
+        starts = datetime(2020, 1, 1, 10, 0, tzinfo=BRASILIA)
+        event = yield from Event.objects.create(alias="brasilia", starts=starts)
+
+        raw = yield from db[Event.__collection__].find_one({"_id": event._id})
+        expect(raw["starts"].tzinfo is BRASILIA).to_be_true()
+
+        loaded = yield from Event.objects.get(event._id, alias="brasilia")
+        expect(loaded.starts).to_equal(starts)
+        expect(loaded.starts.tzinfo is BRASILIA).to_be_true()
+
     @async_test
     @asyncio.coroutine
     def test_document_with_auto_insert_datetime_field(self):
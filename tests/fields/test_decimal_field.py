@@ -0,0 +1,106 @@
+import asyncio
+from decimal import Decimal, ROUND_HALF_UP
+
+from bson.decimal128 import Decimal128
+from preggy import expect
+
+from jetengine import Document, StringField, DecimalField, Q
+from tests import AsyncTestCase, async_test
+
+
+class Account(Document):
+    __collection__ = "DecimalFieldAccount"
+
+    name = StringField()
+    balance = DecimalField(storage="decimal128")
+
+
+class LegacyAccount(Document):
+    __collection__ = "DecimalFieldAccount"
+
+    name = StringField()
+    balance = DecimalField()
+
+
+class TestDecimalField(AsyncTestCase):
+    def setUp(self):
+        super(TestDecimalField, self).setUp()
+        self.drop_coll(Account.__collection__)
+
+    def test_invalid_storage(self):
+        with expect.error_to_happen(
+            ValueError, message="Invalid storage 'float' for DecimalField: must be one of string, decimal128."
+        ):
+            DecimalField(storage="float")
+
+    def test_base_field_arguments_can_be_positional(self):
+        field = DecimalField(None, None, 2, ROUND_HALF_UP, "db_balance")
+
+        expect(field.db_field).to_equal("db_balance")
+        expect(field.storage).to_equal("string")
+
+    def test_to_son(self):
+        expect(LegacyAccount.balance.to_son(Decimal("10.555"))).to_equal("10.56")
+        expect(Account.balance.to_son(Decimal("10.555"))).to_equal(Decimal128("10.56"))
+        expect(Account.balance.to_son("3")).to_equal(Decimal128("3.00"))
+        expect(Account.balance.to_son(None)).to_be_null()
+
+    def test_from_son(self):
+        expect(Account.balance.from_son(Decimal128("10.555"))).to_equal(Decimal("10.56"))
+        expect(Account.balance.from_son("10.5")).to_equal(Decimal("10.50"))
+        expect(LegacyAccount.balance.from_son(Decimal128("1.5"))).to_equal(Decimal("1.50"))
+
+    def test_validate(self):
+        expect(Account.balance.validate(Decimal128("1.5"))).to_be_true()
+        expect(Account.balance.validate("invalid")).to_be_false()
+
+    def test_query_values_are_not_quantized(self):
+        query = Q(balance__gte=Decimal("10.004")).to_query(Account)
+        expect(query).to_equal({"balance": {"$gte": Decimal128("10.004")}})
+
+        query = Q(balance__in=[Decimal("1"), "2.5"]).to_query(Account)
+        expect(query).to_equal({"balance": {"$in": [Decimal128("1.00"), Decimal128("2.50")]}})
+
+        query = Q(balance__gte=Decimal("10.004")).to_query(LegacyAccount)
+        expect(query).to_equal({"balance": {"$gte": "10.00"}})
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_query_and_sort_by_decimal128_values(self):
+        yield from Account.objects.create(name="a", balance=Decimal("10.50"))
+        yield from Account.objects.create(name="b", balance=Decimal("9.99"))
+        yield from Account.objects.create(name="c", balance=Decimal("100"))
+
+        accounts = yield from Account.objects.filter(balance__gt=Decimal("10")).order_by("balance").find_all()
+        expect([account.name for account in accounts]).to_equal(["a", "c"])
+        expect(accounts[0].balance).to_equal(Decimal("10.50"))
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_migrate_string_values(self):
+        for index in range(5):
+            yield from LegacyAccount.objects.create(name="account%d" % index, balance=Decimal("1.25") * index)
+
+        progress = []
+        migrated = yield from Account.objects.migrate_field(
+            "balance", batch_size=2, progress=lambda count, last_id: progress.append(count)
+        )
+
+        expect(migrated).to_equal(5)
+        expect(progress).to_equal([2, 4, 5])
+
+        raw = yield from self.db[Account.__collection__].find_one({"name": "account3"})
+        expect(raw["balance"]).to_equal(Decimal128("3.75"))
+
+        accounts = yield from Account.objects.filter(balance__gte=Decimal("2.5")).find_all()
+        expect(len(accounts)).to_equal(3)
+
+        migrated = yield from Account.objects.migrate_field(Account.balance)
+        expect(migrated).to_equal(0)
+
+    def test_cant_migrate_unknown_field(self):
+        with expect.error_to_happen(ValueError, message="Invalid field 'other': field not found in 'Account'."):
+            self.io_loop.run_until_complete(Account.objects.migrate_field("other"))
+
+        with expect.error_to_happen(ValueError, message="The values of field 'name' can't be migrated."):
+            self.io_loop.run_until_complete(Account.objects.migrate_field("name"))
@@ -0,0 +1,173 @@
+import asyncio
+
+from gridfs.errors import NoFile
+from preggy import expect
+
+from jetengine import Document, StringField, FileField, connect
+from jetengine.fields.file_field import GridFSFile
+from jetengine.queryset import FILE_BATCH_SIZE
+from tests import AsyncTestCase, async_test
+
+
+class Message(Document):
+    __collection__ = "FileFieldMessage"
+
+    subject = StringField()
+    attachment = FileField(bucket="FileFieldAttachments", chunk_size=4)
+
+
+class Archive(Document):
+    __collection__ = "FileFieldArchive"
+
+    attachment = FileField(bucket="FileFieldArchives", alias="file_field_files")
+
+
+async def read_chunks(reader):
+    return [chunk async for chunk in reader]
+
+
+class TestFileField(AsyncTestCase):
+    def setUp(self):
+        super(TestFileField, self).setUp()
+        self.drop_coll(Message.__collection__)
+        self.drop_coll("FileFieldAttachments.files")
+        self.drop_coll("FileFieldAttachments.chunks")
+
+    def test_new_documents_have_an_empty_file(self):
+        message = Message(subject="hello")
+
+        expect(message.attachment).to_be_instance_of(GridFSFile)
+        expect(message.attachment.file_id).to_be_null()
+        expect(Message.attachment.is_empty(message.attachment)).to_be_true()
+        expect(message.to_son()["attachment"]).to_be_null()
+
+        with expect.error_to_happen(ValueError, message="No file was stored in field 'attachment'."):
+            message.attachment.get_file_id()
+
+    def test_files_can_be_compared_and_hashed(self):
+        first = GridFSFile(Message.attachment, file_id=1)
+        second = GridFSFile(Message.attachment, file_id=1)
+
+        expect(first).to_equal(second)
+        expect(set([first, second])).to_length(1)
+
+    def test_invalid_range(self):
+        with expect.error_to_happen(
+            ValueError, message="Invalid range 10-5: start must be positive and lesser than end."
+        ):
+            Message().attachment.open(start=10, end=5)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_write_and_read_files_in_chunks(self):
+        message = Message(subject="hello")
+
+        stream = message.attachment.open_writer(filename="hello.txt")
+        yield from stream.open()
+        yield from stream.write(b"hello ")
+        yield from stream.write(b"world")
+        yield from stream.close()
+
+        yield from message.save()
+
+        loaded = yield from Message.objects.get(message._id)
+        expect(loaded.attachment.file_id).to_equal(message.attachment.file_id)
+
+        reader = loaded.attachment.open()
+        chunks = yield from read_chunks(reader)
+
+        expect(chunks).to_equal([b"hell", b"o wo", b"rld"])
+        expect(reader.length).to_equal(11)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_read_ranges(self):
+        message = Message(subject="hello")
+        yield from message.attachment.put(b"0123456789")
+        yield from message.save()
+
+        data = yield from message.attachment.read(start=3, end=9)
+        expect(data).to_equal(b"345678")
+
+        data = yield from message.attachment.read(start=8, end=100)
+        expect(data).to_equal(b"89")
+
+        reader = message.attachment.open(start=2)
+        data = yield from reader.read(3)
+        expect(data).to_equal(b"234")
+        data = yield from reader.read()
+        expect(data).to_equal(b"56789")
+
+    @async_test
+    @asyncio.coroutine
+    def test_removes_files_of_deleted_documents(self):
+        first = Message(subject="first")
+        yield from first.attachment.put(b"first")
+        yield from first.save()
+
+        second = Message(subject="second")
+        yield from second.attachment.put(b"second")
+        yield from second.save()
+
+        third = Message(subject="third")
+        yield from third.attachment.put(b"third")
+        yield from third.save()
+
+        yield from first.delete()
+
+        with expect.error_to_happen(NoFile):
+            yield from first.attachment.read()
+
+        yield from Message.objects.filter(subject="second").delete()
+
+        with expect.error_to_happen(NoFile):
+            yield from second.attachment.read()
+
+        data = yield from third.attachment.read()
+        expect(data).to_equal(b"third")
+
+        yield from Message.objects.delete_many([third])
+        count = yield from self.db["FileFieldAttachments.files"].find().count()
+        expect(count).to_equal(0)
+
+    @async_test
+    @asyncio.coroutine
+    def test_removes_files_of_documents_removed_in_batches(self):
+        for index in range(FILE_BATCH_SIZE + 1):
+            message = Message(subject="batch")
+            yield from message.attachment.put(b"data")
+            yield from message.save()
+
+        kept = Message(subject="kept")
+        yield from kept.attachment.put(b"kept")
+        yield from kept.save()
+
+        removed = yield from Message.objects.filter(subject="batch").delete()
+        expect(removed).to_equal(FILE_BATCH_SIZE + 1)
+
+        count = yield from self.db["FileFieldAttachments.files"].find().count()
+        expect(count).to_equal(1)
+
+        data = yield from kept.attachment.read()
+        expect(data).to_equal(b"kept")
+
+    @async_test
+    @asyncio.coroutine
+    def test_files_are_always_stored_with_the_alias_of_the_field(self):
+        files_db = connect(
+            "test_file_field_files", alias="file_field_files", host="localhost", port=27017, io_loop=self.io_loop
+        )
+        yield from files_db["FileFieldArchives.files"].drop()
+        yield from self.drop_coll_async(Archive.__collection__)
+
+        archive = Archive()
+        yield from archive.attachment.put(b"archived", alias="default")
+        yield from archive.save()
+
+        count = yield from files_db["FileFieldArchives.files"].find().count()
+        expect(count).to_equal(1)
+
+        yield from archive.delete()
+
+        count = yield from files_db["FileFieldArchives.files"].find().count()
+        expect(count).to_equal(0)
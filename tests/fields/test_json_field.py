@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime
+
+from bson.objectid import ObjectId
+from bson.tz_util import utc
+from preggy import expect
+
+from jetengine import Document, StringField, JsonField, Q, utils
+from tests import AsyncTestCase, async_test
+
+
+class Job(Document):
+    __collection__ = "JsonFieldJob"
+
+    name = StringField()
+    payload = JsonField(native=True)
+
+
+class LegacyJob(Document):
+    __collection__ = "JsonFieldJob"
+
+    name = StringField()
+    payload = JsonField()
+
+
+class TestJsonField(AsyncTestCase):
+    def setUp(self):
+        super(TestJsonField, self).setUp()
+        self.drop_coll(Job.__collection__)
+
+    def test_native_cant_be_compressed(self):
+        with expect.error_to_happen(ValueError, message="A JsonField can't be both native and compressed."):
+            JsonField(native=True, compress="zlib")
+
+    def test_native_values_are_stored_as_they_are(self):
+        payload = {"status": "done", "items": [{"count": 1}]}
+
+        expect(Job(payload=payload).to_son()["payload"]).to_equal(payload)
+        expect(Job.payload.from_son(payload)).to_equal(payload)
+        expect(LegacyJob(payload=payload).to_son()["payload"]).to_equal(utils.serialize(payload))
+
+    def test_native_keys_must_be_valid(self):
+        expect(Job.payload.validate({"a": [{"b": 1}]})).to_be_true()
+        expect(Job.payload.validate({"$set": 1})).to_be_false()
+        expect(Job.payload.validate({"a": [{"b.c": 1}]})).to_be_false()
+        expect(Job.payload.validate({1: "a"})).to_be_false()
+
+    def test_can_query_native_values_with_dotted_paths(self):
+        expect(Q(payload__status="done").to_query(Job)).to_equal({"payload.status": "done"})
+        expect(Q(payload__items__count__gt=3).to_query(Job)).to_equal({"payload.items.count": {"$gt": 3}})
+
+    def test_json_serializers(self):
+        expect(utils.JSON_SERIALIZERS).to_include(utils.json_serializer)
+
+        with expect.error_to_happen(ValueError, message="Unknown json serializer 'other'."):
+            utils.use_json_serializer("other")
+
+    def test_base_field_arguments_can_be_positional(self):
+        field = JsonField("db_payload")
+
+        expect(field.db_field).to_equal("db_payload")
+        expect(field.native).to_be_false()
+
+    def test_extended_json_values_round_trip(self):
+        payload = {"id": ObjectId("123456789012123456789012"), "at": datetime(2018, 1, 1, tzinfo=utc), "n": [1]}
+
+        for name in ["orjson", "ujson", "json"]:
+            if utils.use_json_serializer(name, "json") != name:
+                continue
+
+            try:
+                expect(LegacyJob.payload.from_son(LegacyJob.payload.to_son(payload))).to_equal(payload)
+
+                # values written by any serializer are read by the others
+                utils.use_json_serializer("json")
+                written = utils.serialize(payload)
+                utils.use_json_serializer(name)
+                expect(utils.deserialize(written)).to_equal(payload)
+            finally:
+                utils.use_json_serializer(*utils.JSON_SERIALIZERS)
+
+    def test_can_use_custom_serializers(self):
+        utils.register_json_serializer("custom", lambda value: "custom", lambda value: {"custom": value})
+
+        try:
+            expect(utils.use_json_serializer("custom", "json")).to_equal("custom")
+            expect(LegacyJob(payload={"a": 1}).to_son()["payload"]).to_equal("custom")
+        finally:
+            utils.use_json_serializer(*utils.JSON_SERIALIZERS)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_filter_native_values(self):
+        yield from Job.objects.create(name="first", payload={"status": "done", "attempts": 1})
+        yield from Job.objects.create(name="second", payload={"status": "failed", "attempts": 3})
+
+        jobs = yield from Job.objects.filter(payload__status="done").find_all()
+        expect([job.name for job in jobs]).to_equal(["first"])
+
+        jobs = yield from Job.objects.filter(payload__attempts__gte=2).find_all()
+        expect([job.name for job in jobs]).to_equal(["second"])
+        expect(jobs[0].payload).to_equal({"status": "failed", "attempts": 3})
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_migrate_json_strings(self):
+        yield from LegacyJob.objects.create(name="legacy", payload={"status": "done"})
+
+        migrated = yield from Job.objects.migrate_field("payload")
+        expect(migrated).to_equal(1)
+
+        job = yield from Job.objects.get(payload__status="done")
+        expect(job.name).to_equal("legacy")
+
+        migrated = yield from LegacyJob.objects.migrate_field("payload")
+        expect(migrated).to_equal(1)
+
+        job = yield from LegacyJob.objects.get(name="legacy")
+        expect(job.payload).to_equal({"status": "done"})
@@ -0,0 +1,98 @@
+import asyncio
+
+from preggy import expect
+
+from jetengine import Document, StringField, SequenceField
+from jetengine.fields.sequence_field import reset_sequences
+from tests import AsyncTestCase, async_test
+
+
+class Order(Document):
+    __collection__ = "SequenceFieldOrder"
+
+    number = SequenceField(block_size=3)
+    name = StringField()
+
+
+class Invoice(Document):
+    __collection__ = "SequenceFieldInvoice"
+
+    number = SequenceField(sequence_name="invoices", collection="SequenceFieldCounters")
+
+
+class TestSequenceField(AsyncTestCase):
+    def setUp(self):
+        super(TestSequenceField, self).setUp()
+        self.drop_coll(Order.__collection__)
+        self.drop_coll(Invoice.__collection__)
+        self.drop_coll("counters")
+        self.drop_coll("SequenceFieldCounters")
+        reset_sequences()
+
+    def test_block_size_must_be_positive(self):
+        with expect.error_to_happen(ValueError, message="The block_size of a SequenceField must be at least 1."):
+            SequenceField(block_size=0)
+
+    def test_sequence_name(self):
+        expect(Order.number.get_sequence_name(Order)).to_equal("SequenceFieldOrder.number")
+        expect(Invoice.number.get_sequence_name(Invoice)).to_equal("invoices")
+
+    @async_test
+    @asyncio.coroutine
+    def test_assigns_values_on_insert(self):
+        first = yield from Order.objects.create(name="first")
+        second = yield from Order.objects.create(name="second")
+
+        expect(first.number).to_equal(1)
+        expect(second.number).to_equal(2)
+
+        second.name = "changed"
+        yield from second.save()
+        expect(second.number).to_equal(2)
+
+        explicit = yield from Order.objects.create(name="explicit", number=100)
+        expect(explicit.number).to_equal(100)
+
+    @async_test
+    @asyncio.coroutine
+    def test_reserves_blocks(self):
+        orders = [Order(name="order%d" % index) for index in range(5)]
+        yield from Order.objects.bulk_insert(orders)
+
+        expect([order.number for order in orders]).to_equal([1, 2, 3, 4, 5])
+
+        counter = yield from self.db["counters"].find_one({"_id": "SequenceFieldOrder.number"})
+        expect(counter["value"]).to_equal(5)
+
+        order = yield from Order.objects.create(name="next")
+        expect(order.number).to_equal(6)
+
+        counter = yield from self.db["counters"].find_one({"_id": "SequenceFieldOrder.number"})
+        expect(counter["value"]).to_equal(8)
+
+    @async_test
+    @asyncio.coroutine
+    def test_concurrent_allocation_is_unique(self):
+        invoices = yield from asyncio.gather(*[Invoice.objects.create() for index in range(20)], loop=self.io_loop)
+
+        expect(sorted(invoice.number for invoice in invoices)).to_equal(list(range(1, 21)))
+
+        counter = yield from self.db["SequenceFieldCounters"].find_one({"_id": "invoices"})
+        expect(counter["value"]).to_equal(1000)
+
+    @async_test
+    @asyncio.coroutine
+    def test_upsert_by_assigns_values_only_on_insert(self):
+        first = Order(name="first")
+        yield from first.upsert_by("name")
+
+        expect(first.number).to_equal(1)
+
+        other = Order(name="first")
+        result = yield from other.upsert_by("name")
+
+        expect(result.inserted).to_be_false()
+        expect(other.number).to_equal(1)
+
+        loaded = yield from Order.objects.get(first._id)
+        expect(loaded.number).to_equal(1)
@@ -0,0 +1,100 @@
+import asyncio
+from uuid import UUID, uuid4
+
+from bson.binary import Binary, OLD_UUID_SUBTYPE, UUID_SUBTYPE
+from preggy import expect
+
+from jetengine import Document, StringField, UUIDField, Q
+from tests import AsyncTestCase, async_test
+
+
+class Device(Document):
+    __collection__ = "UUIDFieldDevice"
+
+    name = StringField()
+    uid = UUIDField(representation="standard")
+
+
+class LegacyDevice(Document):
+    __collection__ = "UUIDFieldDevice"
+
+    name = StringField()
+    uid = StringField()
+
+
+class TestUUIDField(AsyncTestCase):
+    def setUp(self):
+        super(TestUUIDField, self).setUp()
+        self.drop_coll(Device.__collection__)
+
+    def test_invalid_representation(self):
+        with expect.error_to_happen(
+            ValueError, message="Invalid representation 'java' for UUIDField: must be standard or None."
+        ):
+            UUIDField(representation="java")
+
+    def test_base_field_arguments_can_be_positional(self):
+        expect(UUIDField("db_token").db_field).to_equal("db_token")
+
+    def test_to_son(self):
+        uid = uuid4()
+
+        expect(Device.uid.to_son(uid)).to_equal(Binary(uid.bytes, UUID_SUBTYPE))
+        expect(Device.uid.to_son(str(uid))).to_equal(Binary(uid.bytes, UUID_SUBTYPE))
+        expect(Device.uid.to_son(None)).to_be_null()
+        expect(UUIDField().to_son(str(uid))).to_equal(uid)
+
+    def test_from_son(self):
+        uid = uuid4()
+
+        expect(Device.uid.from_son(Binary(uid.bytes, UUID_SUBTYPE))).to_equal(uid)
+        expect(Device.uid.from_son(Binary(uid.bytes, OLD_UUID_SUBTYPE))).to_equal(uid)
+        expect(Device.uid.from_son(uid)).to_equal(uid)
+        expect(Device.uid.from_son(str(uid))).to_equal(uid)
+        expect(Device.uid.from_son(None)).to_be_null()
+
+    def test_queries(self):
+        uid = uuid4()
+        other = uuid4()
+
+        expect(Q(uid=uid).to_query(Device)).to_equal({"uid": Binary(uid.bytes, UUID_SUBTYPE)})
+
+        query = Q(uid__in=[uid, str(other)]).to_query(Device)
+        expect(query).to_equal({"uid": {"$in": [Binary(uid.bytes, UUID_SUBTYPE), Binary(other.bytes, UUID_SUBTYPE)]}})
+
+    @async_test
+    @asyncio.coroutine
+    def test_stores_binary_subtype_4(self):
+        uid = uuid4()
+        yield from Device.objects.create(name="phone", uid=uid)
+
+        raw = yield from self.db[Device.__collection__].find_one({"name": "phone"})
+        expect(raw["uid"]).to_be_instance_of(UUID)
+
+        count = yield from self.db[Device.__collection__].find({"uid": Binary(uid.bytes, UUID_SUBTYPE)}).count()
+        expect(count).to_equal(1)
+
+        device = yield from Device.objects.get(uid=uid)
+        expect(device.uid).to_equal(uid)
+
+        devices = yield from Device.objects.filter(uid__in=[uid, uuid4()]).find_all()
+        expect(len(devices)).to_equal(1)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_migrate_string_values(self):
+        uids = [uuid4() for index in range(3)]
+        for index, uid in enumerate(uids):
+            yield from LegacyDevice.objects.create(name="device%d" % index, uid=str(uid))
+
+        migrated = yield from Device.objects.migrate_field("uid", batch_size=2)
+        expect(migrated).to_equal(3)
+
+        count = yield from self.db[Device.__collection__].find({"uid": {"$type": "string"}}).count()
+        expect(count).to_equal(0)
+
+        device = yield from Device.objects.get(uid=uids[1])
+        expect(device.name).to_equal("device1")
+
+        migrated = yield from Device.objects.migrate_field("uid")
+        expect(migrated).to_equal(0)
@@ -0,0 +1,66 @@
+import asyncio
+
+from preggy import expect
+
+from jetengine import Document, StringField, IntField
+from tests import AsyncTestCase, async_test
+
+
+class Account(Document):
+    __collection__ = "BulkInstancesAccount"
+
+    name = StringField(required=True)
+    balance = IntField(default=0)
+
+
+class TestBulkInstances(AsyncTestCase):
+    def setUp(self):
+        super(TestBulkInstances, self).setUp()
+        self.drop_coll(Account.__collection__)
+
+    @asyncio.coroutine
+    def create_accounts(self):
+        accounts = [Account(name="account%d" % index, balance=index) for index in range(5)]
+        yield from Account.objects.bulk_insert(accounts)
+        return accounts
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_delete_many_instances(self):
+        accounts = yield from self.create_accounts()
+
+        deleted = yield from Account.objects.delete_many(accounts[:3] + [Account(name="unsaved")], chunk_size=2)
+
+        expect(deleted).to_equal(3)
+
+        remaining = yield from Account.objects.order_by("balance").find_all()
+        expect([account.name for account in remaining]).to_equal(["account3", "account4"])
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_reload_many_instances(self):
+        accounts = yield from self.create_accounts()
+
+        yield from Account.objects.update(inc__balance=10)
+        yield from Account.objects.filter(name="account4").delete()
+
+        accounts[0].name = "changed"
+        reloaded = yield from Account.objects.reload_many(accounts, chunk_size=2)
+
+        expect(reloaded).to_length(4)
+        expect(accounts[0].name).to_equal("account0")
+        expect([account.balance for account in accounts]).to_equal([10, 11, 12, 13, 4])
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_reload_only_some_fields(self):
+        accounts = yield from self.create_accounts()
+
+        yield from Account.objects.update(inc__balance=10)
+
+        accounts[0].name = "changed"
+        yield from Account.objects.reload_many(accounts, fields=[Account.balance])
+
+        expect(accounts[0].name).to_equal("changed")
+        expect(accounts[0].balance).to_equal(10)
+        expect(accounts[0].is_partly_loaded).to_be_false()
@@ -0,0 +1,71 @@
+import asyncio
+
+from preggy import expect
+
+from jetengine import Document, StringField, IntField
+from tests import AsyncTestCase, async_test
+
+
+class Session(Document):
+    __collection__ = "ChunkedDeleteSession"
+
+    user = StringField(required=True)
+    expired = IntField(default=0)
+
+
+class TestChunkedDelete(AsyncTestCase):
+    def setUp(self):
+        super(TestChunkedDelete, self).setUp()
+        self.drop_coll(Session.__collection__)
+
+    @asyncio.coroutine
+    def create_sessions(self):
+        sessions = [Session(user="user%d" % index, expired=index % 2) for index in range(10)]
+        yield from Session.objects.bulk_insert(sessions)
+        return sessions
+
+    def test_chunk_size_is_required_to_throttle(self):
+        with expect.error_to_happen(
+            ValueError, message="The chunk_size must be specified to throttle or resume deletes."
+        ):
+            self.io_loop.run_until_complete(Session.objects.delete(max_rate=100))
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_delete_in_chunks(self):
+        yield from self.create_sessions()
+
+        reports = []
+        deleted = yield from Session.objects.filter(expired=1).delete(
+            chunk_size=2, max_rate=1000, progress=lambda count, last_id: reports.append(count)
+        )
+
+        expect(deleted).to_equal(5)
+        expect(reports).to_equal([2, 4, 5])
+
+        count = yield from Session.objects.count()
+        expect(count).to_equal(5)
+
+        count = yield from Session.objects.filter(expired=1).count()
+        expect(count).to_equal(0)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_resume_chunked_delete(self):
+        sessions = yield from self.create_sessions()
+
+        deleted = yield from Session.objects.delete(chunk_size=3, resume_after=sessions[5]._id)
+
+        expect(deleted).to_equal(4)
+
+        remaining = yield from Session.objects.find_all()
+        expect(set(session._id for session in remaining)).to_equal(set(session._id for session in sessions[:6]))
+
+    @async_test
+    @asyncio.coroutine
+    def test_waits_for_replication_only_on_replica_sets(self):
+        yield from self.create_sessions()
+
+        deleted = yield from Session.objects.delete(chunk_size=4, pause_on_replication_lag=10)
+
+        expect(deleted).to_equal(10)
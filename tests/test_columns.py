@@ -0,0 +1,126 @@
+import array
+import asyncio
+import math
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from bson.decimal128 import Decimal128
+from preggy import expect
+
+from jetengine import Document, StringField, IntField, FloatField, BooleanField, DateTimeField, DecimalField
+from jetengine.columns import numpy, pandas, get_column
+from tests import AsyncTestCase, async_test
+
+
+class Sale(Document):
+    __collection__ = "ColumnsSale"
+
+    product = StringField()
+    quantity = IntField()
+    price = FloatField()
+    paid = BooleanField()
+    sold_at = DateTimeField()
+    total = DecimalField()
+
+
+def get_values(column):
+    return list(column.to_array())
+
+
+class TestColumns(AsyncTestCase):
+    def setUp(self):
+        super(TestColumns, self).setUp(auto_connect=False)
+
+    def fill(self, field, values):
+        column = get_column(field)
+        for value in values:
+            column.append(value)
+
+        return column
+
+    def test_numbers_are_stored_in_typed_buffers(self):
+        column = self.fill(Sale.quantity, [1, 2, 3])
+        expect(column.buffer).to_equal(array.array("q", [1, 2, 3]))
+        expect(get_values(column)).to_equal([1, 2, 3])
+
+        column = self.fill(Sale.price, [1.5, 2])
+        expect(column.buffer).to_equal(array.array("d", [1.5, 2.0]))
+
+        column = self.fill(Sale.paid, [True, False])
+        expect(get_values(column)).to_equal([True, False])
+
+    def test_missing_numbers_turn_the_column_into_floats(self):
+        column = self.fill(Sale.quantity, [1, None, 3])
+
+        expect(column.buffer.typecode).to_equal("d")
+        values = get_values(column)
+        expect(values[0]).to_equal(1.0)
+        expect(math.isnan(values[1])).to_be_true()
+
+    def test_other_values_are_converted_by_the_field(self):
+        column = self.fill(Sale.total, ["10.50", None])
+        expect(get_values(column)).to_equal([Decimal("10.50"), None])
+
+        column = self.fill(Sale.product, ["shoes", None])
+        expect(column.convert).to_be_null()
+        expect(get_values(column)).to_equal(["shoes", None])
+
+    def test_values_decoded_by_the_driver_are_converted_only_when_needed(self):
+        column = self.fill(DecimalField(storage="decimal128"), [Decimal("10.50"), Decimal128("3.505"), None])
+
+        expect(get_values(column)).to_equal([Decimal("10.50"), Decimal("3.51"), None])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_arrays(self):
+        column = self.fill(Sale.quantity, [1, 2, 3])
+        expect(str(column.to_array().dtype)).to_equal("int64")
+
+        column = self.fill(Sale.sold_at, [datetime(2018, 1, 1, 10, 0), None])
+        values = column.to_array()
+        expect(str(values.dtype)).to_equal("datetime64[ms]")
+        expect(values[0]).to_equal(numpy.datetime64("2018-01-01T10:00:00.000"))
+        expect(bool(numpy.isnat(values[1]))).to_be_true()
+
+
+class TestColumnsWithDatabase(AsyncTestCase):
+    def setUp(self):
+        super(TestColumnsWithDatabase, self).setUp()
+        self.drop_coll(Sale.__collection__)
+
+    @asyncio.coroutine
+    def create_sales(self):
+        for index in range(5):
+            yield from Sale.objects.create(
+                product="product%d" % index, quantity=index, price=index * 1.5, paid=index % 2 == 0
+            )
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_get_columns(self):
+        yield from self.create_sales()
+
+        columns = (
+            yield from Sale.objects.filter(quantity__gte=1)
+            .order_by("quantity")
+            .to_columns("quantity", Sale.price, "_id", batch_size=2)
+        )
+
+        expect(list(columns)).to_equal(["quantity", "price", "_id"])
+        expect(list(columns["quantity"])).to_equal([1, 2, 3, 4])
+        expect(list(columns["price"])).to_equal([1.5, 3.0, 4.5, 6.0])
+        expect(len(columns["_id"])).to_equal(4)
+
+        with expect.error_to_happen(ValueError, message="Invalid field 'other': field not found in 'Sale'."):
+            yield from Sale.objects.to_columns("other")
+
+    @unittest.skipIf(pandas is None, "pandas is not installed")
+    @async_test
+    @asyncio.coroutine
+    def test_can_get_a_dataframe(self):
+        yield from self.create_sales()
+
+        frame = yield from Sale.objects.order_by("quantity").to_dataframe("product", "quantity")
+
+        expect(list(frame.columns)).to_equal(["product", "quantity"])
+        expect(list(frame["quantity"])).to_equal([0, 1, 2, 3, 4])
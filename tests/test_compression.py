@@ -0,0 +1,125 @@
+import asyncio
+import zlib
+
+from bson import BSON
+from bson.binary import Binary
+from preggy import expect
+
+from jetengine import Document, StringField, JsonField, BinaryField, utils
+from jetengine.compression import COMPRESSED_SUBTYPE, CompressedValue, compress, decompress, register_codec
+from tests import AsyncTestCase, async_test
+
+
+class Page(Document):
+    __collection__ = "CompressionPage"
+
+    title = StringField()
+    body = StringField(compress="zlib", compress_threshold=100)
+    data = JsonField(compress="lzma", compress_threshold=100)
+    blob = BinaryField(compress="zlib", compress_threshold=100)
+
+
+class TestCompression(AsyncTestCase):
+    def setUp(self):
+        super(TestCompression, self).setUp(auto_connect=False)
+
+    def get_page(self):
+        return Page(title="title", body="body " * 100, data={"items": list(range(100))}, blob=b"blob" * 100)
+
+    def load(self, son):
+        son = BSON.decode(BSON.encode(dict(son, _id=1)))
+        return Page.from_son(son), son
+
+    def test_codecs(self):
+        value = compress("zlib", b"data" * 10)
+
+        expect(value.subtype).to_equal(COMPRESSED_SUBTYPE)
+        expect(value.startswith(b"zlib:")).to_be_true()
+        expect(decompress(value)).to_equal(b"data" * 10)
+
+        with expect.error_to_happen(ValueError, message="Unknown compression codec 'zip': must be one of lzma, zlib."):
+            StringField(compress="zip")
+
+        with expect.error_to_happen(ValueError, message="Invalid codec name 'a:b': codec names can't contain ':'."):
+            register_codec("a:b", zlib.compress, zlib.decompress)
+
+    def test_base_field_arguments_can_be_positional(self):
+        field = StringField(100, "db_body", compress="zlib")
+        expect(field.max_length).to_equal(100)
+        expect(field.db_field).to_equal("db_body")
+        expect(field.compress).to_equal("zlib")
+
+        expect(BinaryField(None, "db_blob").db_field).to_equal("db_blob")
+        expect(BinaryField(None, "db_blob").compress).to_be_null()
+
+    def test_large_values_are_compressed(self):
+        son = self.get_page().to_son()
+
+        expect(son["title"]).to_equal("title")
+        for name in ["body", "data", "blob"]:
+            expect(son[name]).to_be_instance_of(Binary)
+            expect(son[name].subtype).to_equal(COMPRESSED_SUBTYPE)
+
+        expect(len(son["body"])).to_be_lesser_than(len("body " * 100))
+
+    def test_small_values_are_not_compressed(self):
+        son = Page(body="body", data={"a": 1}, blob=b"blob").to_son()
+
+        expect(son["body"]).to_equal("body")
+        expect(son["data"]).to_equal(utils.serialize({"a": 1}))
+        expect(son["blob"]).to_equal(b"blob")
+
+        page, _ = self.load(son)
+        expect(page.body).to_equal("body")
+        expect(page.data).to_equal({"a": 1})
+        expect(page.blob).to_equal(b"blob")
+
+    def test_values_are_decompressed_on_first_access(self):
+        page, son = self.load(self.get_page().to_son())
+
+        expect(page._values["body"]).to_be_instance_of(CompressedValue)
+        expect(page._values["body"].loaded).to_be_false()
+
+        expect(page.body).to_equal("body " * 100)
+        expect(page._values["body"].loaded).to_be_true()
+        expect(page._values["data"].loaded).to_be_false()
+
+        expect(page.data).to_equal({"items": list(range(100))})
+        expect(page.blob).to_equal(b"blob" * 100)
+
+    def test_unchanged_values_are_not_compressed_again(self):
+        page, son = self.load(self.get_page().to_son())
+
+        expect(page.validate()).to_be_true()
+        expect(page._values["data"].loaded).to_be_false()
+
+        saved = page.to_son()
+        expect(saved["body"]).to_equal(son["body"])
+        expect(saved["data"]).to_equal(son["data"])
+        expect(page._values["body"].loaded).to_be_false()
+
+    def test_json_values_changed_in_place_are_saved(self):
+        page, son = self.load(self.get_page().to_son())
+
+        page.data["items"].append(100)
+
+        loaded, _ = self.load(page.to_son())
+        expect(loaded.data["items"][-1]).to_equal(100)
+
+
+class TestCompressionWithDatabase(AsyncTestCase):
+    def setUp(self):
+        super(TestCompressionWithDatabase, self).setUp()
+        self.drop_coll(Page.__collection__)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_save_and_load_compressed_values(self):
+        page = yield from Page.objects.create(title="title", body="body " * 100, data={"a": [1] * 100})
+
+        raw = yield from self.db[Page.__collection__].find_one({"_id": page._id})
+        expect(raw["body"]).to_be_instance_of(Binary)
+
+        loaded = yield from Page.objects.get(page._id)
+        expect(loaded.body).to_equal("body " * 100)
+        expect(loaded.data).to_equal({"a": [1] * 100})
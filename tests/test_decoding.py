@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime
+
+from bson import BSON
+from bson.codec_options import CodecOptions
+from preggy import expect
+
+from jetengine import Document, StringField, IntField, DateTimeField, ReferenceField
+from jetengine.decoding import decode_batch, get_executor, shutdown_executors
+from tests import AsyncTestCase, async_test
+
+
+class Event(Document):
+    __collection__ = "DecodingEvent"
+
+    name = StringField()
+    order = IntField()
+    happened = DateTimeField()
+
+
+class TestDecoding(AsyncTestCase):
+    def setUp(self):
+        super(TestDecoding, self).setUp(auto_connect=False)
+
+    def tearDown(self):
+        super(TestDecoding, self).tearDown()
+        shutdown_executors()
+
+    def get_batch(self, count):
+        return b"".join(
+            BSON.encode(dict(Event(name="event%d" % index, order=index).to_son(), _id=index)) for index in range(count)
+        )
+
+    def test_executors_are_shared(self):
+        expect(get_executor("thread", 2)).to_equal(get_executor("thread", 2))
+
+        with expect.error_to_happen(ValueError, message="Invalid decode_in 'fiber': must be one of thread, process."):
+            get_executor("fiber")
+
+        with expect.error_to_happen(ValueError, message="The number of workers must be at least 1."):
+            get_executor("thread", 0)
+
+    def test_can_decode_batches(self):
+        events = decode_batch(Event, self.get_batch(3), CodecOptions(), True, {})
+
+        expect([event._id for event in events]).to_equal([0, 1, 2])
+        expect(events[2].name).to_equal("event2")
+        expect(events[2].is_partly_loaded).to_be_true()
+
+    def test_can_decode_batches_in_processes(self):
+        future = get_executor("process", 1).submit(decode_batch, Event, self.get_batch(3), CodecOptions())
+
+        events = future.result()
+        expect([event.order for event in events]).to_equal([0, 1, 2])
+        expect(events[1].name).to_equal("event1")
+
+    def test_select_related_results_cant_be_decoded_in_workers(self):
+        class Attendance(Document):
+            event = ReferenceField(Event)
+
+        message = "Results of queries with select_related can't be decoded in workers."
+        with expect.error_to_happen(ValueError, message=message):
+            self.io_loop.run_until_complete(Attendance.objects.select_related("event").find_all(decode_in="thread"))
+
+
+class TestDecodingWithDatabase(AsyncTestCase):
+    def setUp(self):
+        super(TestDecodingWithDatabase, self).setUp()
+        self.drop_coll(Event.__collection__)
+
+    def tearDown(self):
+        super(TestDecodingWithDatabase, self).tearDown()
+        shutdown_executors()
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_find_all_decoding_in_workers(self):
+        for index in range(10):
+            yield from Event.objects.create(name="event%d" % index, order=index, happened=datetime(2018, 1, 1))
+
+        for decode_in in ["thread", "process"]:
+            events = yield from Event.objects.order_by("order").limit(8).find_all(decode_in=decode_in, workers=2)
+
+            expect([event.order for event in events]).to_equal(list(range(8)))
+            expect(events[0].happened).to_equal(datetime(2018, 1, 1))
+
+        events = yield from Event.objects.only("name").filter(order__gte=5).find_all(decode_in="thread")
+        expect(events).to_length(5)
+        expect(events[0].is_partly_loaded).to_be_true()
+
+    @async_test
+    @asyncio.coroutine
+    def test_lazy_querysets_are_fully_decoded_in_workers(self):
+        for index in range(3):
+            yield from Event.objects.create(name="event%d" % index, order=index)
+
+        events = yield from Event.objects.lazy_decode().order_by("order").find_all(decode_in="process")
+
+        expect([event.name for event in events]).to_equal(["event0", "event1", "event2"])
+        expect(type(events[0]._values) is dict).to_be_true()
@@ -0,0 +1,98 @@
+import asyncio
+
+from preggy import expect
+
+from jetengine import Document, StringField, IntField, DESCENDING
+from tests import AsyncTestCase, async_test
+
+
+class Job(Document):
+    __collection__ = "FindAndModifyJob"
+
+    name = StringField(required=True)
+    status = StringField(default="pending")
+    priority = IntField(default=0)
+    attempts = IntField(default=0)
+
+
+class TestFindAndModify(AsyncTestCase):
+    def setUp(self):
+        super(TestFindAndModify, self).setUp()
+        self.drop_coll(Job.__collection__)
+
+    def test_get_sort(self):
+        expect(Job.objects._get_sort("priority")).to_equal([("priority", 1)])
+        expect(Job.objects._get_sort(("priority", DESCENDING))).to_equal([("priority", -1)])
+        expect(Job.objects._get_sort(["priority", ("name", DESCENDING)])).to_equal([("priority", 1), ("name", -1)])
+        expect(Job.objects.order_by("name")._get_sort()).to_equal([("name", 1)])
+        expect(Job.objects._get_sort()).to_be_null()
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_modify_and_return_new_document(self):
+        yield from Job.objects.create(name="low", priority=1)
+        yield from Job.objects.create(name="high", priority=10)
+
+        job = yield from Job.objects.filter(status="pending").modify(
+            set__status="running", inc__attempts=1, sort=("priority", DESCENDING)
+        )
+
+        expect(job).to_be_instance_of(Job)
+        expect(job.name).to_equal("high")
+        expect(job.status).to_equal("running")
+        expect(job.attempts).to_equal(1)
+
+        pending = yield from Job.objects.filter(status="pending").count()
+        expect(pending).to_equal(1)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_modify_and_return_old_document(self):
+        yield from Job.objects.create(name="job")
+
+        job = yield from Job.objects.filter(name="job").modify(new=False, set__status="running")
+
+        expect(job.status).to_equal("pending")
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_modify_with_projection(self):
+        yield from Job.objects.create(name="job")
+
+        job = yield from Job.objects.filter(name="job").modify(set__status="running", projection=["status"])
+
+        expect(job.status).to_equal("running")
+        expect(job.name).to_be_null()
+        expect(job.is_partly_loaded).to_be_true()
+
+    @async_test
+    @asyncio.coroutine
+    def test_modify_returns_none_when_nothing_matches(self):
+        job = yield from Job.objects.filter(name="job").modify(set__status="running")
+
+        expect(job).to_be_null()
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_upsert_with_modify(self):
+        job = yield from Job.objects.filter(name="job").modify(upsert=True, set__status="running")
+
+        expect(job._id).not_to_be_null()
+        expect(job.name).to_equal("job")
+        expect(job.status).to_equal("running")
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_find_one_and_delete(self):
+        yield from Job.objects.create(name="first", priority=1)
+        yield from Job.objects.create(name="second", priority=2)
+
+        job = yield from Job.objects.find_one_and_delete(sort="priority")
+
+        expect(job.name).to_equal("first")
+
+        count = yield from Job.objects.count()
+        expect(count).to_equal(1)
+
+        job = yield from Job.objects.filter(name="missing").find_one_and_delete()
+        expect(job).to_be_null()
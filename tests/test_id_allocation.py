@@ -0,0 +1,90 @@
+import asyncio
+
+from preggy import expect
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, ReferenceField
+from tests import AsyncTestCase, async_test
+
+
+class Parent(Document):
+    __collection__ = "IdAllocationParent"
+    __id_allocation__ = "construction"
+
+    name = StringField()
+
+
+class Child(Document):
+    __collection__ = "IdAllocationChild"
+
+    name = StringField()
+    parent = ReferenceField(Parent)
+
+
+class TestIdAllocation(AsyncTestCase):
+    def setUp(self):
+        super(TestIdAllocation, self).setUp()
+        self.drop_coll(Parent.__collection__)
+        self.drop_coll(Child.__collection__)
+
+    def test_invalid_id_allocation(self):
+        message = "Invalid __id_allocation__ 'insert' in 'Invalid': must be one of save, construction."
+        with expect.error_to_happen(ValueError, message=message):
+
+            class Invalid(Document):
+                __id_allocation__ = "insert"
+
+    def test_ids_are_allocated_at_construction(self):
+        parent = Parent(name="parent")
+
+        expect(parent._id).to_be_instance_of(ObjectId)
+        expect(parent._id_preallocated).to_be_true()
+
+        expect(Child(name="child")._id).to_be_null()
+
+        loaded = Parent.from_son({"_id": ObjectId("123456789012123456789012"), "name": "parent"})
+        expect(loaded._id).to_equal(ObjectId("123456789012123456789012"))
+        expect(loaded._id_preallocated).to_be_false()
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_insert_parent_and_children_concurrently(self):
+        parent = Parent(name="parent")
+        parent_id = parent._id
+        children = [Child(name="child%d" % index, parent=parent) for index in range(3)]
+
+        yield from asyncio.gather(parent.save(), Child.objects.bulk_insert(children), loop=self.io_loop)
+
+        expect(parent._id).to_equal(parent_id)
+        expect(parent._id_preallocated).to_be_false()
+
+        loaded = yield from Child.objects.get(children[0]._id)
+        yield from loaded.load_references()
+
+        expect(loaded.parent._id).to_equal(parent_id)
+        expect(loaded.parent.name).to_equal("parent")
+
+    @async_test
+    @asyncio.coroutine
+    def test_saving_twice_updates_preallocated_document(self):
+        parent = Parent(name="parent")
+
+        yield from parent.save()
+        parent.name = "changed"
+        yield from parent.save()
+
+        count = yield from Parent.objects.count()
+        expect(count).to_equal(1)
+
+        loaded = yield from Parent.objects.get(parent._id)
+        expect(loaded.name).to_equal("changed")
+
+    @async_test
+    @asyncio.coroutine
+    def test_ids_are_allocated_before_insert_on_save(self):
+        child = Child(name="child")
+
+        yield from child.save()
+
+        expect(child._id).to_be_instance_of(ObjectId)
+        expect(child._id_preallocated).to_be_false()
@@ -0,0 +1,82 @@
+import asyncio
+
+from bson import BSON
+from bson.raw_bson import RawBSONDocument
+from preggy import expect
+
+from jetengine import Document, StringField, IntField, ListField, EmbeddedDocumentField
+from tests import AsyncTestCase, async_test
+
+
+class Tag(Document):
+    name = StringField()
+
+
+class Article(Document):
+    __collection__ = "LazyDecodeArticle"
+
+    title = StringField()
+    views = IntField(default=0)
+    tags = ListField(EmbeddedDocumentField(Tag))
+    main_tag = EmbeddedDocumentField(Tag)
+
+
+class TestLazyDecode(AsyncTestCase):
+    def setUp(self):
+        super(TestLazyDecode, self).setUp()
+        self.drop_coll(Article.__collection__)
+
+    def get_raw(self):
+        return RawBSONDocument(
+            BSON.encode({"_id": 1, "title": "title", "tags": [{"name": "python"}], "main_tag": {"name": "mongo"}})
+        )
+
+    def test_fields_are_decoded_on_first_access(self):
+        article = Article.from_son(self.get_raw())
+
+        expect(article.is_lazily_decoded).to_be_true()
+        expect(article._id).to_equal(1)
+        expect(article._values.untouched).to_be_true()
+
+        expect(article.title).to_equal("title")
+        expect(article._values.pending).to_equal(set(["views", "tags", "main_tag"]))
+
+        expect(article.tags[0].name).to_equal("python")
+        expect(article.main_tag.name).to_equal("mongo")
+        expect(article.views).to_equal(0)
+
+    def test_to_son_only_encodes_accessed_fields(self):
+        article = Article.from_son(self.get_raw())
+
+        son = article.to_son()
+        expect(son["title"]).to_equal("title")
+        expect(son["main_tag"]).to_be_instance_of(RawBSONDocument)
+
+        article.views = 10
+        article.main_tag = Tag(name="motor")
+
+        son = article.to_son()
+        expect(son["views"]).to_equal(10)
+        expect(son["main_tag"]).to_equal({"name": "motor"})
+        expect(article._values.pending).to_equal(set(["title", "tags"]))
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_load_and_save_lazily_decoded_documents(self):
+        article = yield from Article.objects.create(title="title", tags=[Tag(name="python")])
+
+        loaded = yield from Article.objects.lazy_decode().get(article._id)
+        expect(loaded.is_lazily_decoded).to_be_true()
+
+        yield from loaded.save()
+        expect(loaded._values.untouched).to_be_true()
+
+        loaded.views = 5
+        yield from loaded.save()
+
+        articles = yield from Article.objects.lazy_decode().find_all()
+        expect(articles[0].views).to_equal(5)
+        expect(articles[0].tags[0].name).to_equal("python")
+
+        article = yield from Article.objects.get(article._id)
+        expect(article.is_lazily_decoded).to_be_false()
@@ -0,0 +1,110 @@
+import asyncio
+
+from preggy import expect
+
+from jetengine import Document, StringField, ListField, EmbeddedDocumentField, ReferenceField, connect
+from tests import AsyncTestCase, async_test
+
+
+class Company(Document):
+    __collection__ = "PrefetchCompany"
+
+    name = StringField(required=True)
+    address = StringField()
+
+
+class Author(Document):
+    __collection__ = "PrefetchAuthor"
+
+    name = StringField(required=True)
+    bio = StringField()
+    company = ReferenceField(Company)
+
+
+class Comment(Document):
+    text = StringField(required=True)
+    author = ReferenceField(Author)
+
+
+class Post(Document):
+    __collection__ = "PrefetchPost"
+
+    title = StringField(required=True)
+    author = ReferenceField(Author)
+    comments = ListField(EmbeddedDocumentField(Comment))
+
+
+class TestPrefetch(AsyncTestCase):
+    def setUp(self):
+        super(TestPrefetch, self).setUp()
+        self.drop_coll(Company.__collection__)
+        self.drop_coll(Author.__collection__)
+        self.drop_coll(Post.__collection__)
+
+    def test_builds_hops_for_paths(self):
+        queryset = Post.objects.prefetch("author", "comments__author__company")
+
+        expect(sorted(queryset._prefetch.keys())).to_equal([("author",), ("comments", "author")])
+        expect(queryset._prefetch[("author",)]["children"]).to_be_empty()
+        expect(list(queryset._prefetch[("comments", "author")]["children"].keys())).to_equal([("company",)])
+
+    def test_cant_prefetch_non_reference_field(self):
+        with expect.error_to_happen(
+            ValueError, message="Invalid reference path 'author__name': 'name' is not a reference field."
+        ):
+            Post.objects.prefetch("author__name")
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_prefetch_nested_references(self):
+        company = yield from Company.objects.create(name="Company", address="Street")
+        author = yield from Author.objects.create(name="Bernardo", company=company)
+        other = yield from Author.objects.create(name="Someone", company=company)
+
+        yield from Post.objects.create(
+            title="post1", author=author, comments=[Comment(text="first", author=other), Comment(text="second")]
+        )
+        yield from Post.objects.create(title="post2", author=other, comments=[Comment(text="third", author=author)])
+
+        posts = yield from Post.objects.prefetch("author", "comments__author__company").order_by("title").find_all()
+
+        expect(posts).to_length(2)
+        expect(posts[0].author.name).to_equal("Bernardo")
+        expect(posts[0].comments[0].author.name).to_equal("Someone")
+        expect(posts[0].comments[0].author.company.name).to_equal("Company")
+        expect(posts[0].comments[1].author).to_be_null()
+        expect(posts[1].author.name).to_equal("Someone")
+        expect(posts[1].comments[0].author.company.address).to_equal("Street")
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_prefetch_with_projection_per_hop(self):
+        company = yield from Company.objects.create(name="Company", address="Street")
+        author = yield from Author.objects.create(name="Bernardo", bio="Bio", company=company)
+        post = yield from Post.objects.create(title="post", author=author)
+
+        result = yield from Post.objects.prefetch(
+            "author__company", only={"author": ["name", "company"], "author__company": ["name"]}
+        ).get(post._id)
+
+        expect(result.author.name).to_equal("Bernardo")
+        expect(result.author.bio).to_be_null()
+        expect(result.author.is_partly_loaded).to_be_true()
+        expect(result.author.company.name).to_equal("Company")
+        expect(result.author.company.address).to_be_null()
+
+    @async_test
+    @asyncio.coroutine
+    def test_prefetch_uses_the_alias_of_the_query(self):
+        db = connect("test_prefetch", alias="prefetch", host="localhost", port=27017, io_loop=self.io_loop)
+        yield from db[Author.__collection__].drop()
+        yield from db[Post.__collection__].drop()
+
+        author = yield from Author.objects.create(name="Bernardo", alias="prefetch")
+        post = yield from Post.objects.create(title="post", author=author, alias="prefetch")
+
+        posts = yield from Post.objects.prefetch("author").find_all(alias="prefetch")
+        expect(posts[0].author.name).to_equal("Bernardo")
+
+        result = yield from Post.objects.prefetch("author").get(post._id, alias="prefetch")
+        expect(result.author.name).to_equal("Bernardo")
@@ -0,0 +1,137 @@
+import asyncio
+
+from preggy import expect
+
+from jetengine import Document, StringField, ListField, EmbeddedDocumentField, ReferenceField
+from tests import AsyncTestCase, async_test
+
+
+class Author(Document):
+    __collection__ = "SelectRelatedAuthor"
+
+    name = StringField(required=True)
+    bio = StringField()
+
+
+class Comment(Document):
+    text = StringField(required=True)
+    author = ReferenceField(Author)
+
+
+class Post(Document):
+    __collection__ = "SelectRelatedPost"
+
+    title = StringField(required=True)
+    author = ReferenceField(Author)
+    comments = ListField(EmbeddedDocumentField(Comment))
+    editors = ListField(ReferenceField(Author))
+
+
+class TestSelectRelated(AsyncTestCase):
+    def setUp(self):
+        super(TestSelectRelated, self).setUp()
+        self.drop_coll(Author.__collection__)
+        self.drop_coll(Post.__collection__)
+
+    def test_builds_lookup_pipeline(self):
+        pipeline = Post.objects.select_related("author", "comments__author")._get_select_related_pipeline(
+            {"title": "post"}, limit=10
+        )
+
+        expect(pipeline).to_equal(
+            [
+                {"$match": {"title": "post"}},
+                {"$limit": 10},
+                {
+                    "$lookup": {
+                        "from": "SelectRelatedAuthor",
+                        "localField": "author",
+                        "foreignField": "_id",
+                        "as": "_related_author",
+                    }
+                },
+                {
+                    "$lookup": {
+                        "from": "SelectRelatedAuthor",
+                        "localField": "comments.author",
+                        "foreignField": "_id",
+                        "as": "_related_comments_author",
+                    }
+                },
+            ]
+        )
+
+    def test_projects_referenced_fields(self):
+        pipeline = Post.objects.only("title", "author.name").select_related("author")._get_select_related_pipeline({})
+
+        expect(pipeline[-1]).to_equal(
+            {"$project": {"title": 1, "author": 1, "_related_author.name": 1, "_related_author._id": 1}}
+        )
+
+    def test_cant_select_related_non_reference_field(self):
+        with expect.error_to_happen(
+            ValueError, message="Invalid reference path 'title': 'title' is not a reference field."
+        ):
+            Post.objects.select_related("title")
+
+    def test_cant_select_related_invalid_field(self):
+        with expect.error_to_happen(ValueError, message="Invalid reference path 'invalid': Field not found in 'Post'."):
+            Post.objects.select_related("invalid")
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_select_related(self):
+        author = yield from Author.objects.create(name="Bernardo", bio="Author bio")
+        other = yield from Author.objects.create(name="Someone")
+
+        yield from Post.objects.create(
+            title="post",
+            author=author,
+            comments=[Comment(text="first", author=other), Comment(text="second", author=author)],
+            editors=[other, author],
+        )
+
+        posts = yield from Post.objects.select_related("author", "comments__author", "editors").find_all()
+
+        expect(posts).to_length(1)
+        expect(posts[0].author).to_be_instance_of(Author)
+        expect(posts[0].author._id).to_equal(author._id)
+        expect(posts[0].author.name).to_equal("Bernardo")
+        expect(posts[0].comments[0].author.name).to_equal("Someone")
+        expect(posts[0].comments[1].author.name).to_equal("Bernardo")
+        expect([editor.name for editor in posts[0].editors]).to_equal(["Someone", "Bernardo"])
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_select_related_with_projection(self):
+        author = yield from Author.objects.create(name="Bernardo", bio="Author bio")
+        post = yield from Post.objects.create(title="post", author=author)
+
+        result = yield from Post.objects.only("title", "author.name").select_related("author").get(post._id)
+
+        expect(result.title).to_equal("post")
+        expect(result.author.name).to_equal("Bernardo")
+        expect(result.author.bio).to_be_null()
+        expect(result.author.is_partly_loaded).to_be_true()
+
+    @async_test
+    @asyncio.coroutine
+    def test_select_related_keeps_missing_references_empty(self):
+        yield from Post.objects.create(title="post")
+
+        posts = yield from Post.objects.select_related("author").find_all()
+
+        expect(posts).to_length(1)
+        expect(posts[0].author).to_be_null()
+
+    @async_test
+    @asyncio.coroutine
+    def test_select_related_keeps_ids_of_deleted_references(self):
+        author = yield from Author.objects.create(name="Bernardo")
+        post = yield from Post.objects.create(title="post", author=author, editors=[author])
+        yield from author.delete()
+
+        result = yield from Post.objects.select_related("author", "editors").get(post._id)
+
+        expect(result.author).to_equal(author._id)
+        expect(result.editors).to_equal([author._id])
@@ -0,0 +1,94 @@
+from preggy import expect
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, IntField, ListField, EmbeddedDocumentField
+from jetengine.serialization import get_serializers, is_identity
+from tests import AsyncTestCase
+
+
+class Address(Document):
+    street = StringField(db_field="st")
+
+
+class Person(Document):
+    __collection__ = "SerializationPerson"
+
+    name = StringField()
+    age = IntField()
+    nickname = StringField(sparse=True)
+    tags = ListField(StringField())
+    address = EmbeddedDocumentField(Address)
+
+
+class Dynamic(Document):
+    __collection__ = "SerializationDynamic"
+
+    name = StringField()
+
+
+class TestSerialization(AsyncTestCase):
+    def setUp(self):
+        super(TestSerialization, self).setUp(auto_connect=False)
+
+    def test_identity_fields(self):
+        expect(is_identity(Person._fields["name"], "to_son")).to_be_true()
+        expect(is_identity(Person._fields["age"], "to_son")).to_be_false()
+        expect(is_identity(Person._fields["address"], "from_son")).to_be_false()
+
+    def test_to_son(self):
+        person = Person(name="Bernardo", age="32", tags=["a"], address=Address(street="Rua"))
+
+        expect(person.to_son()).to_equal({"name": "Bernardo", "age": 32, "tags": ["a"], "address": {"st": "Rua"}})
+
+        person.nickname = "heynemann"
+        expect(person.to_son()["nickname"]).to_equal("heynemann")
+
+    def test_from_son(self):
+        object_id = ObjectId()
+        person = Person.from_son({"_id": object_id, "name": "Bernardo", "age": 32.0, "address": {"st": "Rua"}})
+
+        expect(person._id).to_equal(object_id)
+        expect(person.name).to_equal("Bernardo")
+        expect(person.age).to_equal(32)
+        expect(person.address.street).to_equal("Rua")
+        expect(person.tags).to_equal([])
+
+    def test_serializers_are_compiled_again_for_dynamic_fields(self):
+        to_son, from_son = get_serializers(Dynamic)
+
+        document = Dynamic(name="name")
+        document.color = "blue"
+
+        expect(get_serializers(Dynamic)[0]).not_to_equal(to_son)
+        expect(document.to_son()).to_equal({"name": "name", "_color": "blue"})
+
+        loaded = Dynamic.from_son({"_id": ObjectId(), "name": "name", "_color": "red"})
+        expect(loaded.color).to_equal("red")
+
+    def test_hydrate_only_evaluates_defaults_of_missing_fields(self):
+        calls = []
+
+        def default():
+            calls.append(1)
+            return "default"
+
+        class Counted(Document):
+            __collection__ = "SerializationCounted"
+
+            first = StringField(default=default)
+            second = StringField(default=default)
+
+        document = Counted.from_son({"_id": ObjectId(), "first": "loaded"})
+
+        expect(calls).to_length(1)
+        expect(document.first).to_equal("loaded")
+        expect(document.second).to_equal("default")
+        expect(document._id_preallocated).to_be_false()
+
+        values = {"first": "a", "second": "b"}
+        document = Counted.hydrate(values, _id=1, _is_partly_loaded=True)
+
+        expect(calls).to_length(1)
+        expect(document._values is values).to_be_true()
+        expect(document._id).to_equal(1)
+        expect(document.is_partly_loaded).to_be_true()
@@ -0,0 +1,94 @@
+import asyncio
+from decimal import Decimal
+
+from bson import BSON
+from bson.decimal128 import Decimal128
+from preggy import expect
+
+from jetengine import Document, StringField, DecimalField, DictField, EmbeddedDocumentField, ListField
+from jetengine.type_codecs import get_type_registry, is_decoded_by_driver
+from tests import AsyncTestCase, async_test
+
+
+class Invoice(Document):
+    __collection__ = "TypeCodecsInvoice"
+
+    number = StringField()
+    total = DecimalField(storage="decimal128")
+    legacy_total = DecimalField()
+    extra = DictField()
+
+
+class Order(Document):
+    __collection__ = "TypeCodecsOrder"
+
+    invoices = ListField(EmbeddedDocumentField(Invoice))
+
+
+class Log(Document):
+    __collection__ = "TypeCodecsLog"
+
+    extra = DictField()
+
+
+class TestTypeCodecs(AsyncTestCase):
+    def setUp(self):
+        super(TestTypeCodecs, self).setUp()
+        self.drop_coll(Invoice.__collection__)
+
+    def test_registry_has_codecs_of_declared_fields(self):
+        expect(get_type_registry(Invoice)).not_to_be_null()
+        expect(is_decoded_by_driver(Invoice.total)).to_be_true()
+        expect(is_decoded_by_driver(Invoice.legacy_total)).to_be_false()
+
+    def test_registries_are_scoped_to_the_documents_that_need_them(self):
+        expect(get_type_registry(Order) is get_type_registry(Invoice)).to_be_true()
+        expect(get_type_registry(Log)).to_be_null()
+
+        son = BSON(BSON.encode({"_id": 1, "extra": {"tax": Decimal128("1.5")}})).decode(
+            codec_options=Log.objects.coll().codec_options
+        )
+        expect(Log.from_son(son).extra).to_equal({"tax": Decimal128("1.5")})
+
+    def test_collections_use_the_registry(self):
+        coll = Invoice.objects.coll()
+        expect(coll.codec_options.type_registry).to_equal(get_type_registry(Invoice))
+
+        coll = Invoice.objects.coll(write_concern={"w": 1})
+        expect(coll.codec_options.type_registry).to_equal(get_type_registry(Invoice))
+
+    def test_values_decoded_by_the_driver_are_not_converted_again(self):
+        son = BSON.encode(Invoice(number="1", total=Decimal("10.50"), legacy_total=Decimal("3")).to_son())
+        son = BSON(son).decode(codec_options=Invoice.objects.coll().codec_options)
+
+        expect(son["total"]).to_equal(Decimal("10.50"))
+
+        invoice = Invoice.from_son(dict(son, _id=1))
+        expect(invoice.total).to_equal(Decimal("10.50"))
+        expect(invoice.legacy_total).to_equal(Decimal("3.00"))
+
+    def test_values_decoded_without_the_codecs_are_converted(self):
+        invoice = Invoice.from_son({"_id": 1, "total": Decimal128("10.505"), "legacy_total": "3"})
+
+        expect(invoice.total).to_equal(Decimal("10.51"))
+        expect(type(invoice.total) is Decimal).to_be_true()
+        expect(invoice.legacy_total).to_equal(Decimal("3.00"))
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_save_and_load_documents_with_decoded_values(self):
+        invoice = yield from Invoice.objects.create(
+            number="1", total=Decimal("10.50"), extra={"tax": Decimal128("1.5")}
+        )
+
+        raw = yield from self.db[Invoice.__collection__].find_one({"_id": invoice._id})
+        expect(raw["total"]).to_equal(Decimal128("10.50"))
+
+        loaded = yield from Invoice.objects.get(invoice._id)
+        expect(loaded.total).to_equal(Decimal("10.50"))
+        expect(loaded.extra).to_equal({"tax": Decimal("1.5")})
+
+        # decimals in other fields are encoded back to Decimal128
+        yield from loaded.save()
+        raw = yield from self.db[Invoice.__collection__].find_one({"_id": invoice._id})
+        expect(raw["extra"]).to_equal({"tax": Decimal128("1.5")})
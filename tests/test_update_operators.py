@@ -0,0 +1,105 @@
+import asyncio
+from decimal import Decimal
+
+from preggy import expect
+
+from jetengine import Document, StringField, IntField, ListField, EmbeddedDocumentField, DecimalField
+from jetengine.query_builder.transform import transform_update
+from tests import AsyncTestCase, async_test
+
+
+class Author(Document):
+    name = StringField(db_field="author_name")
+
+
+class Post(Document):
+    __collection__ = "UpdateOperatorsPost"
+
+    title = StringField()
+    views = IntField(default=0)
+    price = DecimalField()
+    tags = ListField(StringField())
+    author = EmbeddedDocumentField(Author)
+
+
+class TestUpdateOperators(AsyncTestCase):
+    def setUp(self):
+        super(TestUpdateOperators, self).setUp()
+        self.drop_coll(Post.__collection__)
+
+    def test_transform_update(self):
+        expect(
+            transform_update(
+                Post,
+                title="Post",
+                inc__views=1,
+                push__tags="python",
+                pull__tags="java",
+                set__author__name="Bernardo",
+                unset__price=True,
+            )
+        ).to_equal(
+            {
+                "$set": {"title": "Post", "author.author_name": "Bernardo"},
+                "$inc": {"views": 1},
+                "$push": {"tags": "python"},
+                "$pull": {"tags": "java"},
+                "$unset": {"price": ""},
+            }
+        )
+
+    def test_transform_update_converts_values(self):
+        expect(transform_update(Post, max__price=Decimal("10.555"), dec__views="2")).to_equal(
+            {"$max": {"price": "10.56"}, "$inc": {"views": -2}}
+        )
+        expect(transform_update(Post, push_all__tags=["a", "b"], add_to_set__tags=("c", "d"))).to_equal(
+            {"$push": {"tags": {"$each": ["a", "b"]}}, "$addToSet": {"tags": {"$each": ["c", "d"]}}}
+        )
+        expect(transform_update(Post, pull_all__tags=["a"])).to_equal({"$pullAll": {"tags": ["a"]}})
+
+    def test_update_requires_a_definition(self):
+        with expect.error_to_happen(ValueError, message="An update definition or update operators must be provided."):
+            Post.objects.get_update_document()
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_update_with_operators(self):
+        yield from Post.objects.create(title="post1", tags=["java"])
+        yield from Post.objects.create(title="post2", tags=["java"])
+
+        result = yield from Post.objects.update(inc__views=2, push__tags="python", pull__tags="java")
+
+        expect(result.count).to_equal(2)
+        expect(result.updated_existing).to_be_true()
+
+        posts = yield from Post.objects.order_by("title").find_all()
+        expect(posts[0].views).to_equal(2)
+        expect(posts[0].tags).to_equal(["python"])
+        expect(posts[1].views).to_equal(2)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_update_a_single_document(self):
+        yield from Post.objects.create(title="post")
+        yield from Post.objects.create(title="post")
+
+        result = yield from Post.objects.filter(title="post").update(multi=False, inc__views=1)
+
+        expect(result.count).to_equal(1)
+
+        count = yield from Post.objects.filter(views=1).count()
+        expect(count).to_equal(1)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_modify_document(self):
+        post = yield from Post.objects.create(title="post", views=10, tags=["java"])
+
+        result = yield from post.modify(inc__views=5, add_to_set__tags="python")
+
+        expect(result).to_be_true()
+        expect(post.views).to_equal(15)
+        expect(post.tags).to_equal(["java", "python"])
+
+        loaded = yield from Post.objects.get(post._id)
+        expect(loaded.views).to_equal(15)
@@ -0,0 +1,87 @@
+import asyncio
+
+from preggy import expect
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, IntField, DateTimeField
+from tests import AsyncTestCase, async_test
+
+
+class Event(Document):
+    __collection__ = "UpsertEvent"
+
+    source = StringField(required=True)
+    external_id = StringField(required=True)
+    payload = StringField()
+    hits = IntField(default=0)
+    created_at = DateTimeField(auto_now_on_insert=True)
+    updated_at = DateTimeField(auto_now_on_insert=True, auto_now_on_update=True)
+
+
+class TestUpsert(AsyncTestCase):
+    def setUp(self):
+        super(TestUpsert, self).setUp()
+        self.drop_coll(Event.__collection__)
+
+    @async_test
+    @asyncio.coroutine
+    def test_save_with_upsert_inserts_missing_document(self):
+        event = Event(source="web", external_id="1")
+        event._id = ObjectId()
+
+        yield from event.save(upsert=True)
+
+        loaded = yield from Event.objects.get(event._id)
+        expect(loaded).not_to_be_null()
+        expect(loaded.external_id).to_equal("1")
+
+    @async_test
+    @asyncio.coroutine
+    def test_save_without_upsert_ignores_missing_document(self):
+        event = Event(source="web", external_id="1")
+        event._id = ObjectId()
+
+        yield from event.save()
+
+        loaded = yield from Event.objects.get(event._id)
+        expect(loaded).to_be_null()
+
+    @async_test
+    @asyncio.coroutine
+    def test_update_with_upsert(self):
+        result = yield from Event.objects.filter(source="web", external_id="1").update(upsert=True, inc__hits=1)
+
+        expect(result.count).to_equal(0)
+        expect(result.upserted_id).not_to_be_null()
+
+        event = yield from Event.objects.get(result.upserted_id)
+        expect(event.hits).to_equal(1)
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_upsert_by_natural_key(self):
+        event = Event(source="web", external_id="1", payload="first")
+        result = yield from event.upsert_by("source", Event.external_id)
+
+        expect(result.inserted).to_be_true()
+        expect(result._id).to_equal(event._id)
+
+        created = yield from Event.objects.get(event._id)
+
+        other = Event(source="web", external_id="1", payload="second")
+        result = yield from Event.objects.upsert_by(other, "source", "external_id")
+
+        expect(result.inserted).to_be_false()
+        expect(result._id).to_equal(event._id)
+        expect(other._id).to_equal(event._id)
+
+        count = yield from Event.objects.count()
+        expect(count).to_equal(1)
+
+        loaded = yield from Event.objects.get(event._id)
+        expect(loaded.payload).to_equal("second")
+        expect(loaded.created_at).to_equal(created.created_at)
+
+    def test_cant_upsert_by_unknown_field(self):
+        with expect.error_to_happen(ValueError, message="Invalid upsert field 'invalid': Field not found in 'Event'."):
+            self.io_loop.run_until_complete(Event(source="web", external_id="1").upsert_by("invalid"))
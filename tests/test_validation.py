@@ -0,0 +1,99 @@
+import pickle
+
+from preggy import expect
+from bson.objectid import ObjectId
+
+from jetengine import Document, StringField, IntField, ListField, EmbeddedDocumentField, EmailField
+from jetengine.errors import InvalidDocumentError
+from jetengine.fields.list_field import TrackedList
+from tests import AsyncTestCase
+
+
+class Address(Document):
+    street = StringField(required=True)
+
+
+class Customer(Document):
+    __collection__ = "ValidationCustomer"
+
+    name = StringField(required=True)
+    email = EmailField()
+    age = IntField(min_value=0)
+    tags = ListField(StringField(max_length=5))
+    address = EmbeddedDocumentField(Address)
+
+
+class TestValidation(AsyncTestCase):
+    def setUp(self):
+        super(TestValidation, self).setUp(auto_connect=False)
+
+    def load(self, **values):
+        values["_id"] = ObjectId()
+        return Customer.from_son(values)
+
+    def test_new_documents_validate_all_fields(self):
+        customer = Customer(email="invalid")
+
+        expect(customer._changed_fields).to_be_null()
+
+        with expect.error_to_happen(InvalidDocumentError, message="Field 'name' is required."):
+            customer.validate()
+
+    def test_loaded_documents_only_validate_changed_fields(self):
+        customer = self.load(name="Bernardo", email="invalid", tags=["a"], address={"street": "Rua"})
+
+        expect(customer.validate()).to_be_true()
+
+        customer.age = -1
+        expect(customer._changed_fields).to_equal(set(["age"]))
+
+        with expect.error_to_happen(InvalidDocumentError, message="Field 'age' must be valid."):
+            customer.validate()
+
+    def test_lists_modified_in_place_are_validated(self):
+        customer = self.load(name="Bernardo", tags=["a"])
+
+        expect(customer.tags).to_be_instance_of(TrackedList)
+
+        customer.tags.append("too long")
+
+        with expect.error_to_happen(InvalidDocumentError, message="Field 'tags' must be valid."):
+            customer.validate()
+
+    def test_unpickled_lists_keep_their_changes(self):
+        tags = pickle.loads(pickle.dumps(TrackedList(["a"])))
+
+        expect(tags).to_equal(["a"])
+        expect(tags._dirty).to_be_false()
+
+        tags.append("b")
+        expect(pickle.loads(pickle.dumps(tags))._dirty).to_be_true()
+
+    def test_embedded_documents_validate_their_changes(self):
+        customer = self.load(name="Bernardo", address={"street": "Rua"})
+
+        customer.address.street = None
+
+        with expect.error_to_happen(InvalidDocumentError, message="Field 'street' is required."):
+            customer.validate()
+
+    def test_clear_changed_fields(self):
+        customer = self.load(name="Bernardo", tags=["a"], address={"street": "Rua"})
+
+        customer.name = "Heynemann"
+        customer.tags.append("b")
+        customer.address.street = "Avenida"
+        customer.clear_changed_fields()
+
+        expect(customer._changed_fields).to_equal(set())
+        expect(customer.tags._dirty).to_be_false()
+        expect(customer.address._changed_fields).to_equal(set())
+
+    def test_validate_documents(self):
+        customers = [Customer(name="first"), Customer(name="second", age=-1)]
+
+        message = "Validation for document 1 in the documents you are saving failed with: Field 'age' must be valid."
+        with expect.error_to_happen(ValueError, message=message):
+            Customer.objects.validate_documents(customers)
+
+        expect(Customer.objects.validate_documents(customers[:1])).to_be_true()
@@ -0,0 +1,133 @@
+import asyncio
+
+from preggy import expect
+
+from jetengine import Document, StringField, IntField
+from jetengine.errors import UniqueKeyViolationError
+from jetengine.write_buffer import get_write_buffer
+from tests import AsyncTestCase, async_test
+
+
+class Event(Document):
+    __collection__ = "WriteBufferEvent"
+
+    name = StringField(required=True)
+    key = StringField(unique=True, sparse=True)
+    value = IntField(default=0)
+
+
+class TestWriteBuffer(AsyncTestCase):
+    def setUp(self):
+        super(TestWriteBuffer, self).setUp()
+        self.drop_coll(Event.__collection__)
+
+    def test_max_batch_must_be_positive(self):
+        with expect.error_to_happen(ValueError, message="The write buffer max_batch must be at least 1."):
+            Event.objects.buffered(max_batch=0)
+
+    @async_test
+    @asyncio.coroutine
+    def test_buffer_is_only_active_inside_the_block(self):
+        buffer = Event.objects.buffered()
+
+        expect(get_write_buffer(Event)).to_be_null()
+
+        yield from buffer.__aenter__()
+        expect(get_write_buffer(Event)).to_equal(buffer)
+
+        yield from buffer.__aexit__(None, None, None)
+        expect(get_write_buffer(Event)).to_be_null()
+
+    @async_test
+    @asyncio.coroutine
+    def test_buffers_are_only_active_in_their_own_tasks(self):
+        first = Event.objects.buffered()
+        second = Event.objects.buffered()
+        first_entered = self.io_loop.create_future()
+        second_entered = self.io_loop.create_future()
+        first_exited = self.io_loop.create_future()
+        active = []
+
+        @asyncio.coroutine
+        def use_first():
+            yield from first.__aenter__()
+            first_entered.set_result(True)
+
+            yield from second_entered
+            active.append(get_write_buffer(Event))
+
+            yield from first.__aexit__(None, None, None)
+            first_exited.set_result(True)
+
+        @asyncio.coroutine
+        def use_second():
+            yield from first_entered
+            active.append(get_write_buffer(Event))
+
+            yield from second.__aenter__()
+            second_entered.set_result(True)
+
+            # the first buffer leaves its block before this one
+            yield from first_exited
+            active.append(get_write_buffer(Event))
+
+            yield from second.__aexit__(None, None, None)
+            active.append(get_write_buffer(Event))
+
+        yield from asyncio.gather(use_first(), use_second(), loop=self.io_loop)
+
+        expect(active[0]).to_be_null()
+        expect(active[1]).to_equal(first)
+        expect(active[2]).to_equal(second)
+        expect(active[3]).to_be_null()
+        expect(get_write_buffer(Event)).to_be_null()
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_buffer_saves(self):
+        buffer = Event.objects.buffered(max_batch=3, max_delay_ms=10)
+        yield from buffer.__aenter__()
+
+        events = yield from asyncio.gather(
+            *[Event.objects.create(name="event%d" % index, value=index) for index in range(5)], loop=self.io_loop
+        )
+
+        yield from buffer.__aexit__(None, None, None)
+
+        for event in events:
+            expect(event._id).not_to_be_null()
+
+        count = yield from Event.objects.count()
+        expect(count).to_equal(5)
+
+        loaded = yield from Event.objects.get(events[3]._id)
+        expect(loaded.name).to_equal("event3")
+
+    @async_test
+    @asyncio.coroutine
+    def test_buffered_updates_and_individual_errors(self):
+        existing = yield from Event.objects.create(name="existing", key="taken")
+
+        buffer = Event.objects.buffered(max_batch=10, max_delay_ms=10)
+        yield from buffer.__aenter__()
+
+        existing.value = 10
+        results = yield from asyncio.gather(
+            existing.save(),
+            Event(name="duplicate", key="taken").save(),
+            Event(name="new", key="free").save(),
+            loop=self.io_loop,
+            return_exceptions=True,
+        )
+
+        yield from buffer.__aexit__(None, None, None)
+
+        expect(results[0]).to_equal(existing)
+        expect(results[1]).to_be_instance_of(UniqueKeyViolationError)
+        expect(results[2]._id).not_to_be_null()
+
+        loaded = yield from Event.objects.get(existing._id)
+        expect(loaded.value).to_equal(10)
+
+        count = yield from Event.objects.count()
+        expect(count).to_equal(2)
@@ -0,0 +1,69 @@
+import asyncio
+
+from preggy import expect
+from pymongo.write_concern import WriteConcern
+
+from jetengine import Document, StringField, IntField
+from tests import AsyncTestCase, async_test
+
+
+class Metric(Document):
+    __collection__ = "WriteConcernMetric"
+    __write_concern__ = {"w": 1, "j": False}
+
+    name = StringField(required=True)
+    value = IntField(default=0)
+
+
+class Invoice(Document):
+    __collection__ = "WriteConcernInvoice"
+
+    number = StringField(required=True)
+
+
+class TestWriteConcern(AsyncTestCase):
+    def setUp(self):
+        super(TestWriteConcern, self).setUp()
+        self.drop_coll(Metric.__collection__)
+        self.drop_coll(Invoice.__collection__)
+
+    def test_uses_the_write_concern_of_the_class(self):
+        expect(Metric.__write_concern__).to_equal({"w": 1, "j": False})
+        expect(Invoice.__write_concern__).to_be_null()
+
+        expect(Metric.objects.coll().write_concern.document).to_equal({"w": 1, "j": False})
+        expect(Invoice.objects.coll().write_concern.document).to_equal({})
+
+    def test_write_concern_can_be_overridden(self):
+        coll = Metric.objects.coll(write_concern={"w": "majority"})
+        expect(coll.write_concern.document).to_equal({"w": "majority"})
+
+        coll = Invoice.objects.coll(write_concern=WriteConcern(w=0))
+        expect(coll.write_concern.document).to_equal({"w": 0})
+
+    def test_collections_are_cached_per_options(self):
+        expect(Metric.objects.coll()).to_equal(Metric.objects.coll(write_concern=WriteConcern(w=1, j=False)))
+        expect(Metric.objects.coll() is Metric.objects.coll(write_concern={"j": False, "w": 1})).to_be_true()
+        expect(Metric.objects.coll() is Metric.objects.coll(write_concern={"w": 0})).to_be_false()
+
+    @async_test
+    @asyncio.coroutine
+    def test_can_write_with_different_write_concerns(self):
+        metric = yield from Metric.objects.create(name="cpu", value=10)
+        expect(metric._id).not_to_be_null()
+
+        invoices = [Invoice(number="1"), Invoice(number="2")]
+        yield from Invoice.objects.bulk_insert(invoices, write_concern={"w": 1, "j": True})
+        expect(invoices[0]._id).not_to_be_null()
+
+        result = yield from Metric.objects.filter(name="cpu").update(inc__value=1, write_concern={"w": 1})
+        expect(result.count).to_equal(1)
+
+        result = yield from Metric.objects.filter(name="cpu").update(inc__value=1, write_concern={"w": 0})
+        expect(result.count).to_be_null()
+
+        removed = yield from Invoice.objects.filter(number="1").delete(write_concern={"w": 1})
+        expect(removed).to_equal(1)
+
+        removed = yield from Invoice.objects.filter(number="2").delete(write_concern={"w": 0})
+        expect(removed).to_be_null()